@@ -0,0 +1,183 @@
+"""
+Replays a whole day on the display and measures every update.
+
+Runs MainWindow offscreen at 1920x1080 with the clock swapped for one the benchmark controls. Starting
+at midnight it jumps straight to every time the display would update (see MainWindow.get_next_change)
+and records for each one:
+  - data: working out today's schedule, who is on shift and what goes in the tutor list
+  - update: update_ui itself (the data again plus changing the widgets)
+  - layout: the layout requests that update_ui posted
+  - paint: everything else Qt had queued, which is where the changed widgets get painted
+  - the number of widgets and the resident memory of the process afterwards
+
+The report is JSON so two releases can be diffed. The network check is replaced with one that always
+succeeds so the run does not depend on the network.
+
+Usage (from the repository root):
+    python benchmarks/bench_day.py [YYYY-MM-DD] [report.json]
+"""
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+# a 1920x1080 offscreen screen so the layout matches the lobby display
+SCREEN_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "offscreen_1080p.json")
+os.environ.setdefault("QT_QPA_PLATFORM", f"offscreen:configfile={SCREEN_CONFIG}")
+
+import PySide6
+from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtCore import QCoreApplication, QEvent, QThreadPool
+import clock
+import network
+
+# bump this when the meaning of a field in the report changes
+REPORT_VERSION = 1
+
+class ReplayClock:
+    """
+    A clock that only moves when the benchmark moves it.
+    """
+    def __init__(self, start):
+        self.time = start
+
+    def __call__(self):
+        return self.time
+
+def rss_mib():
+    """
+    Gets the resident memory of this process.
+    :return: the memory in MiB (0 where /proc is not available)
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            pages = int(file.read().split()[1])
+        return round(pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024, 1)
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+def elapsed_ms(start):
+    return round((time.perf_counter() - start) * 1000, 3)
+
+def summarize(values):
+    """
+    :return: the median, 95th percentile and maximum of a list of numbers
+    """
+    values = sorted(values)
+    return {
+        "median": values[len(values) // 2],
+        "p95": values[min(len(values) - 1, int(len(values) * 0.95))],
+        "max": values[-1],
+    }
+
+def measure_update(app, window):
+    """
+    Brings the display up to date with the current (replayed) time and measures each phase.
+    :return: a dictionary with the time of every phase in milliseconds
+    """
+    result = {}
+
+    start = time.perf_counter()
+    window.em.get_today_schedule()
+    try:
+        now_index = window.em.get_now_index()
+    except ValueError:
+        now_index = -1
+    if window.schedule is not None:
+        window.get_tutor_list_items(window.em.get_on_shift(), now_index)
+    result["data_ms"] = elapsed_ms(start)
+
+    start = time.perf_counter()
+    window.update_ui()
+    result["update_ms"] = elapsed_ms(start)
+
+    # arm the update timer for the next change the way update_data does, so it does not fire during the paint
+    window.schedule_next_update()
+
+    start = time.perf_counter()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.LayoutRequest)
+    result["layout_ms"] = elapsed_ms(start)
+
+    start = time.perf_counter()
+    app.processEvents()
+    result["paint_ms"] = elapsed_ms(start)
+
+    return result
+
+def replay_day(day):
+    """
+    Builds the display at midnight and replays every update until the next midnight.
+    :param day: the date to replay
+    :return: the report as a dictionary
+    """
+    replay_clock = ReplayClock(datetime.datetime.combine(day, datetime.time()))
+    clock.set_clock(replay_clock)
+    network.probe = lambda *args, **kwargs: True
+
+    app = QApplication.instance() or QApplication([])
+    import main
+
+    rss_before = rss_mib()
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        window = main.MainWindow()
+        build_ms = elapsed_ms(start)
+
+        # let the background work and the first frame finish before measuring anything
+        QThreadPool.globalInstance().waitForDone()
+        while not window.first_frame_drawn:
+            app.processEvents()
+        app.processEvents()
+
+        transitions = []
+        end = replay_clock.time + datetime.timedelta(days=1)
+        while replay_clock.time < end:
+            replay_clock.time = window.get_next_change(replay_clock.time)
+            record = {"time": replay_clock.time.isoformat(timespec="minutes")}
+            record.update(measure_update(app, window))
+            record["widgets"] = len(window.findChildren(QWidget))
+            record["rss_mib"] = rss_mib()
+            transitions.append(record)
+
+    clock.set_clock()
+
+    return {
+        "report_version": REPORT_VERSION,
+        "date": day.isoformat(),
+        "python": platform.python_version(),
+        "pyside6": PySide6.__version__,
+        "platform": app.platformName(),
+        "build_ms": build_ms,
+        "updates": len(transitions),
+        "summary_ms": {
+            phase: summarize([record[phase] for record in transitions])
+            for phase in ("data_ms", "update_ms", "layout_ms", "paint_ms")
+        },
+        "widgets": {
+            "min": min(record["widgets"] for record in transitions),
+            "max": max(record["widgets"] for record in transitions),
+        },
+        "rss_mib": {
+            "before_build": rss_before,
+            "end": transitions[-1]["rss_mib"],
+            "max": max(record["rss_mib"] for record in transitions),
+        },
+        "transitions": transitions,
+    }
+
+if __name__ == "__main__":
+    # a Wednesday by default, the same day bench_polish.py uses
+    day = datetime.date.fromisoformat(sys.argv[1]) if len(sys.argv) > 1 else datetime.date(2025, 1, 8)
+    report = json.dumps(replay_day(day), indent=2)
+
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], "w") as file:
+            file.write(report + "\n")
+    else:
+        print(report)
@@ -0,0 +1,54 @@
+"""
+Times how long it takes to read the schedule spreadsheet.
+
+Compares the old approach of calling pd.read_excel once per block (seven opens of the same
+workbook) against the single pass read_workbook in excel.py.
+
+Usage (from the repository root):
+    python benchmarks/bench_fetch.py [path to Schedule.xlsx] [repeats]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import pandas as pd
+from excel import read_workbook
+
+def read_per_block(schedule_file_path):
+    """
+    Reads the spreadsheet the way fetch_schedule used to, with one pd.read_excel call per block.
+    :param schedule_file_path: the path to the spreadsheet
+    """
+    for skip in (3, 12, 21, 30, 39):
+        pd.read_excel(schedule_file_path, sheet_name='Print Schedule', usecols='B:AC', skiprows=skip, nrows=6).values.tolist()
+    pd.read_excel(schedule_file_path, sheet_name='Schedule', usecols='A:AE', skiprows=10, nrows=200).values.tolist()
+    pd.read_excel(schedule_file_path, sheet_name='Tutor Info', usecols='A:J', nrows=30).values.tolist()
+
+def best_of(function, path, repeats):
+    """
+    Runs the function several times and keeps the fastest run.
+    :param function: the reader to time
+    :param path: the path to the spreadsheet
+    :param repeats: how many times to run it
+    :return: the fastest time in seconds
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else "data/Schedule.xlsx"
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    before = best_of(read_per_block, path, repeats)
+    after = best_of(read_workbook, path, repeats)
+
+    print(f"workbook:              {path} ({os.path.getsize(path) / 1024:.1f} KiB)")
+    print(f"seven read_excel calls: {before * 1000:8.1f} ms")
+    print(f"single pass:            {after * 1000:8.1f} ms")
+    print(f"speedup:                {before / after:8.2f}x")
@@ -0,0 +1,68 @@
+"""
+Measures what the font registry saves when building tutor cards.
+
+Builds TutorCards with the fonts coming from the registry, then again while also registering
+BRLNSR.TTF once per card (what every TutorCard and WillReturn used to do in its constructor).
+Reports the time per card and how many fonts are registered with Qt after each run.
+
+Usage (from the repository root):
+    python benchmarks/bench_fonts.py [cards]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import QApplication
+
+import fonts
+from custom_widgets import TutorCard
+
+def application_font_count(limit=100000):
+    """
+    Counts the fonts registered with QFontDatabase.addApplicationFont.
+    Qt hands out the ids in order, so this counts up until an id has no families.
+    """
+    count = 0
+    while count < limit and QFontDatabase.applicationFontFamilies(count):
+        count += 1
+    return count
+
+def build_cards(count, register_per_card):
+    """
+    Builds tutor cards and returns the average time per card in milliseconds.
+    :param count: how many cards to build
+    :param register_per_card: also register the font file for every card, like the old constructors
+    """
+    cards = []
+    start = time.perf_counter()
+    for index in range(count):
+        if register_per_card:
+            QFontDatabase.addApplicationFont(fonts.FONT_FILES["regular"])
+        cards.append(TutorCard(f"Tutor {index}", "Images/default.png", "Mechanical Engineer", "Junior", "Here until 5:00"))
+    elapsed = time.perf_counter() - start
+
+    for card in cards:
+        card.deleteLater()
+    return elapsed / count * 1000
+
+if __name__ == "__main__":
+    cards = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    app = QApplication([])
+    fonts.load_fonts()
+
+    # warm up so the first card does not pay for loading Qt plugins
+    build_cards(5, False)
+
+    registry = build_cards(cards, False)
+    registry_fonts = application_font_count()
+    per_card = build_cards(cards, True)
+    per_card_fonts = application_font_count()
+
+    print(f"cards built:            {cards}")
+    print(f"font per card:    {per_card:8.3f} ms/card, {per_card_fonts} fonts registered")
+    print(f"font registry:    {registry:8.3f} ms/card, {registry_fonts} fonts registered")
+    print(f"saved:            {per_card - registry:8.3f} ms/card")
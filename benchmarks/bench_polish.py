@@ -0,0 +1,86 @@
+"""
+Measures how long Qt spends applying style sheets to the display.
+
+Runs MainWindow offscreen at 1920x1080 on a fixed weekday and reports:
+  - rebuild: building a whole new page, including the layout and style pass that follows
+  - polish: unpolishing and polishing every widget on screen (the work a global re-polish causes)
+  - rebind: filling a tutor card in with a tutor of a different major
+
+Usage (from the repository root):
+    python benchmarks/bench_polish.py [repeats]
+"""
+import contextlib
+import datetime
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+# a 1920x1080 offscreen screen so the layout matches the lobby display
+SCREEN_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "offscreen_1080p.json")
+os.environ.setdefault("QT_QPA_PLATFORM", f"offscreen:configfile={SCREEN_CONFIG}")
+
+import clock
+from PySide6.QtWidgets import QApplication, QWidget
+from PySide6.QtCore import QThreadPool
+import custom_widgets
+
+def median_ms(function, repeats):
+    """
+    Runs the function several times and returns the median time in milliseconds.
+    """
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times) // 2] * 1000
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    # always 10:05 on a Wednesday so the benchmark does not depend on when it is run
+    clock.set_clock(lambda: datetime.datetime(2025, 1, 8, 10, 5, 0, 1))
+
+    app = QApplication([])
+    import main
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        window = main.MainWindow()
+        # let the background check of the spreadsheet finish so the page is not rebuilt while timing
+        QThreadPool.globalInstance().waitForDone()
+        # draw the first frame here so the startup report is not printed in the middle of the results
+        while not window.first_frame_drawn:
+            app.processEvents()
+        app.processEvents()
+
+    def rebuild():
+        with contextlib.redirect_stdout(io.StringIO()):
+            window.displayed_snapshot = None
+            window.update_ui()
+        app.processEvents()
+
+    def polish():
+        for widget in window.active_widget.findChildren(QWidget):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+
+    card = next(widget for widget in window.tutor_list_widgets if isinstance(widget, custom_widgets.TutorCard))
+    majors = ["Mechanical Engineer", "Civil Engineer"]
+
+    def rebind():
+        majors.reverse()
+        card.bind("Tutor", card.profile_pic.image_path, majors[0], "Junior", "Here until 5:00")
+
+    widgets = window.active_widget.findChildren(QWidget)
+    report = {
+        "widgets_on_page": len(widgets),
+        "widgets_with_own_stylesheet": sum(1 for widget in widgets if widget.styleSheet()),
+        "rebuild_ms": round(median_ms(rebuild, repeats), 3),
+        "polish_ms": round(median_ms(polish, repeats), 3),
+        "rebind_major_change_ms": round(median_ms(rebind, repeats * 10), 3),
+    }
+    print(json.dumps(report, indent=2))
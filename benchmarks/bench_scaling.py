@@ -0,0 +1,86 @@
+"""
+Measures how reading and querying the schedule scale with the size of the spreadsheet.
+
+Writes made-up workbooks with make_schedule.py for a range of tutor counts (and one fill density) and
+reports for each:
+  - the size of the workbook
+  - parse: building a snapshot from the spreadsheet (ExcelManager.read_snapshot with no cache)
+  - cache load: reading that snapshot back from the binary cache
+  - roster: the median time of get_roster over every slot of the week
+  - transitions: the median time of get_transitions over the weekdays
+  - how many tutors made it into the snapshot, and how many of them got their class from 'Tutor Info'
+
+Usage (from the repository root):
+    python benchmarks/bench_scaling.py [density] [tutor counts, comma separated]
+"""
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+# excel.py imports openpyxl on the first parse; import it here so that time is not counted against the smallest workbook
+import openpyxl
+from excel import ExcelManager
+from snapshot import load_snapshot
+from constants import WEEKDAYS
+from make_schedule import make_schedule, SLOT_COUNT
+
+def measure(directory, tutors, density):
+    """
+    Writes one workbook and measures it.
+    :return: a dictionary of results
+    """
+    workbook = make_schedule(os.path.join(directory, f"schedule_{tutors}.xlsx"), tutors=tutors, density=density)
+
+    em = ExcelManager(
+        os.path.join(directory, f"schedule_{tutors}.xlsx"), os.path.join(directory, f"cache_{tutors}.bin")
+    )
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        em.snapshot = em.read_snapshot(None)
+        parse_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    load_snapshot(em.cache_path)
+    cache_ms = (time.perf_counter() - start) * 1000
+
+    roster_times = []
+    for weekday in range(len(WEEKDAYS)):
+        for slot in range(SLOT_COUNT):
+            start = time.perf_counter()
+            em.get_roster(weekday, slot)
+            roster_times.append(time.perf_counter() - start)
+
+    transition_times = []
+    for weekday in range(len(WEEKDAYS)):
+        start = time.perf_counter()
+        em.get_transitions(weekday)
+        transition_times.append(time.perf_counter() - start)
+
+    return {
+        "tutors": tutors,
+        "workbook_kib": round(workbook["bytes"] / 1024, 1),
+        "shift_slots": workbook["shift_slots"],
+        "parse_ms": round(parse_ms, 1),
+        "cache_load_ms": round(cache_ms, 2),
+        "roster_us": round(statistics.median(roster_times) * 1e6, 2),
+        "transitions_us": round(statistics.median(transition_times) * 1e6, 2),
+        "tutors_parsed": len(em.snapshot.tutors),
+        "tutors_with_info": sum(1 for tutor in em.snapshot.tutors if tutor.academic_class),
+    }
+
+if __name__ == "__main__":
+    density = float(sys.argv[1]) if len(sys.argv) > 1 else 0.3
+    counts = [int(count) for count in sys.argv[2].split(",")] if len(sys.argv) > 2 else [10, 20, 40, 80, 160, 320]
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = [measure(directory, tutors, density) for tutors in counts]
+
+    print(json.dumps({"density": density, "results": results}, indent=2))
@@ -0,0 +1,168 @@
+"""
+Measures what every extra screen costs in multi-display mode (main.py --all-screens).
+
+Starts TutorDisplay offscreen with one to four 1920x1080 screens, each run in a fresh process since
+the screens are fixed when Qt starts, and reports for each number of screens:
+  - build: how long opening each window took, and the whole display
+  - rss: the resident memory before the display was built and what every window added to it
+  - update: the median time of update_ui on one window at a fixed time of day
+  - rebuild: the median time of building a whole new page on one window, including the paint after it
+  - loads: how many times the schedule was read (once per center however many screens show it)
+  - fonts and portraits: the size of the registries every window shares
+
+The clock is fixed to 10:05 on a Wednesday and the network check always succeeds so the runs can be compared.
+
+Usage (from the repository root):
+    python benchmarks/bench_screens.py [largest number of screens]
+"""
+import contextlib
+import datetime
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+SCREEN_WIDTH = 1920
+SCREEN_HEIGHT = 1080
+
+def rss_mib():
+    """
+    Gets the resident memory of this process.
+    :return: the memory in MiB (0 where /proc is not available)
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            pages = int(file.read().split()[1])
+        return round(pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024, 1)
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+def median_ms(function, repeats):
+    """
+    Runs the function several times and returns the median time in milliseconds.
+    """
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return round(times[len(times) // 2] * 1000, 2)
+
+def screen_config(screens):
+    """
+    An offscreen configuration with the screens side by side.
+    """
+    return {"screens": [
+        {
+            "name": f"screen{index}", "x": index * SCREEN_WIDTH, "y": 0,
+            "width": SCREEN_WIDTH, "height": SCREEN_HEIGHT,
+            "logicalDpi": 96, "logicalBaseDpi": 96, "dpr": 1,
+        }
+        for index in range(screens)
+    ]}
+
+def measure(repeats=20):
+    """
+    Builds the display on every screen Qt was started with and measures it. This runs in the child process.
+    :return: a dictionary of results
+    """
+    import clock
+    import network
+    clock.set_clock(lambda: datetime.datetime(2025, 1, 8, 10, 5, 0, 1))
+    network.probe = lambda *args, **kwargs: True
+
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QThreadPool
+    app = QApplication([])
+    import main
+    import excel
+    import fonts
+    import portraits
+
+    # count the reads of the spreadsheet and time every window as it is opened
+    loads = []
+    read_snapshot = excel.ExcelManager.read_snapshot
+    def counted_read_snapshot(self, current):
+        loads.append(self.schedule_file_path)
+        return read_snapshot(self, current)
+    excel.ExcelManager.read_snapshot = counted_read_snapshot
+
+    windows = []
+    window_class = main.MainWindow
+    def timed_window(*args, **kwargs):
+        rss_before = rss_mib()
+        start = time.perf_counter()
+        window = window_class(*args, **kwargs)
+        windows.append({
+            "build_ms": round((time.perf_counter() - start) * 1000, 1),
+            "rss_added_mib": round(rss_mib() - rss_before, 1),
+        })
+        return window
+    main.MainWindow = timed_window
+
+    rss_before = rss_mib()
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        display = main.TutorDisplay(all_screens=True)
+        build_ms = round((time.perf_counter() - start) * 1000, 1)
+
+        # let the background check of the spreadsheet and the first frames finish before timing anything
+        QThreadPool.globalInstance().waitForDone()
+        while not all(window.first_frame_drawn for window in display.windows.values()):
+            app.processEvents()
+        app.processEvents()
+    rss_built = rss_mib()
+
+    window = next(iter(display.windows.values()))
+
+    def rebuild():
+        with contextlib.redirect_stdout(io.StringIO()):
+            window.displayed_snapshot = None
+            window.update_ui()
+        app.processEvents()
+
+    return {
+        "screens": len(display.windows),
+        "build_ms": build_ms,
+        "windows": windows,
+        "rss_mib": {"before_build": rss_before, "built": rss_built, "added": round(rss_built - rss_before, 1)},
+        "update_ms": median_ms(window.update_ui, repeats),
+        "rebuild_ms": median_ms(rebuild, repeats),
+        "loads": len(loads),
+        "centers": len(display.centers),
+        "fonts": fonts.registered_font_count(),
+        "portraits": {
+            "cached": len(portraits.portrait_cache.portraits),
+            "hits": portraits.portrait_cache.hits,
+            "misses": portraits.portrait_cache.misses,
+        },
+    }
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--child":
+        print(json.dumps(measure()))
+        sys.exit(0)
+
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for screens in range(1, largest + 1):
+            config = os.path.join(directory, f"screens_{screens}.json")
+            with open(config, "w") as file:
+                json.dump(screen_config(screens), file)
+
+            environment = dict(os.environ, QT_QPA_PLATFORM=f"offscreen:configfile={config}")
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child"],
+                env=environment, capture_output=True, text=True, check=True
+            ).stdout
+            # the startup report is printed once the first frame is drawn, so the results are the last line
+            results.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(json.dumps({"results": results}, indent=2))
@@ -0,0 +1,85 @@
+"""
+Measures how long the display takes to get its first frame on screen.
+
+Starts src/main.py offscreen at 1920x1080 with python -X importtime and --exit-after-first-frame,
+several times, and reports:
+  - the median time of every startup phase, from the startup report main.py prints
+  - the heavy modules that were imported (pandas should not be when the cache is up to date)
+  - the slowest top level imports, from the -X importtime output of the first run
+
+Usage (from the repository root, with data/schedule_cache.bin present):
+    python benchmarks/bench_startup.py [runs]
+"""
+import json
+import os
+import subprocess
+import sys
+
+MAIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "main.py")
+
+# a 1920x1080 offscreen screen so the layout matches the lobby display
+SCREEN_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "offscreen_1080p.json")
+
+def start_once():
+    """
+    Starts the display once and waits for it to exit after its first frame.
+    :return: a tuple of (the startup report, the -X importtime lines)
+    """
+    env = dict(os.environ, QT_QPA_PLATFORM=f"offscreen:configfile={SCREEN_CONFIG}")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", MAIN, "--exit-after-first-frame"],
+        capture_output=True, text=True, env=env, timeout=60
+    )
+
+    report = None
+    for line in result.stdout.splitlines():
+        if line.startswith("startup report: "):
+            report = json.loads(line[len("startup report: "):])
+    if report is None:
+        raise RuntimeError(f"main.py did not print a startup report:\n{result.stdout}\n{result.stderr}")
+
+    return report, [line for line in result.stderr.splitlines() if line.startswith("import time:")]
+
+def top_level_imports(lines, count=10):
+    """
+    Picks the slowest imports made directly by the program (not by other modules) from -X importtime output.
+    :param lines: the "import time:" lines
+    :param count: how many to keep
+    :return: a list of (module, cumulative milliseconds), slowest first
+    """
+    imports = []
+    for line in lines:
+        _, cumulative_us, name = line.split("|")
+        # nested imports are indented by two more spaces per level
+        if not name.startswith(" ") or name.startswith("  "):
+            continue
+        if not cumulative_us.strip().isdigit():
+            continue # the header line
+        imports.append((name.strip(), round(int(cumulative_us) / 1000, 1)))
+
+    imports.sort(key=lambda item: item[1], reverse=True)
+    return imports[:count]
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    reports = []
+    importtime = None
+    for _ in range(runs):
+        report, lines = start_once()
+        reports.append(report)
+        if importtime is None:
+            importtime = lines
+
+    phases = {}
+    for name in reports[0]["phases_ms"]:
+        times = sorted(report["phases_ms"][name] for report in reports)
+        phases[name] = times[len(times) // 2]
+
+    print(json.dumps({
+        "runs": runs,
+        "median_phases_ms": phases,
+        "heavy_modules_loaded": reports[0]["heavy_modules_loaded"],
+        "modules_loaded": reports[0]["modules_loaded"],
+        "slowest_top_level_imports_ms": dict(top_level_imports(importtime)),
+    }, indent=2))
@@ -0,0 +1,110 @@
+"""
+Shows how the roster queries scale with the number of tutor rows.
+
+Builds random tutor schedules of increasing size and compares scanning the slot codes cell by cell
+(how get_on_shift used to work) with the vectorized ScheduleTensor queries.
+
+Usage (from the repository root):
+    python benchmarks/bench_tensor.py [tutor counts...]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from constants import MAJORS, WEEKDAYS
+from schedule_tensor import build_tensor
+from snapshot import Tutor
+
+CODES = {"MAE": "M", "CMPE": "CP", "ECE": "EL", "CEE": "CE", "BENG": "B"}
+
+def random_tutors(count, slots=28, seed=0):
+    """
+    Makes tutors with one or two random shifts a day.
+    :param count: how many tutors to make
+    :param slots: how many half hour slots there are in a day
+    :param seed: the seed for the random numbers
+    :return: a tuple of Tutor
+    """
+    rnd = random.Random(seed)
+    tutors = []
+    for index in range(count):
+        major = MAJORS[index % len(MAJORS)]
+        schedule = []
+        for _ in WEEKDAYS:
+            day = [""] * slots
+            for _ in range(rnd.randint(0, 2)):
+                start = rnd.randrange(slots - 2)
+                for slot in range(start, min(slots, start + rnd.randint(2, 8))):
+                    day[slot] = CODES[major]
+            schedule.append(tuple(day))
+        tutors.append(Tutor(f"Tutor {index}", major, "Junior", "default.png", tuple(schedule)))
+    return tuple(tutors)
+
+def scan_cells(tutors, weekday, slot):
+    """
+    The old way of finding who is on shift and when they leave, one string at a time.
+    :return: a list of (tutor index, end slot)
+    """
+    on_shift = []
+    for index, tutor in enumerate(tutors):
+        day = tutor.schedule[weekday]
+        if day[slot].lower() in {"cp", "m", "ce", "el", "b"}:
+            end = len(day)
+            for later in range(slot + 1, len(day)):
+                if day[later].lower() not in {"cp", "m", "ce", "el", "b"}:
+                    end = later
+                    break
+            on_shift.append((index, end))
+    return on_shift
+
+def count_cells(tutors, weekday):
+    """
+    The old way of counting tutors per major per slot.
+    :return: a dictionary of major -> list of counts
+    """
+    counts = {major: [0] * len(tutors[0].schedule[weekday]) for major in MAJORS}
+    for tutor in tutors:
+        for slot, value in enumerate(tutor.schedule[weekday]):
+            if value.lower() in {"cp", "m", "ce", "el", "b"}:
+                counts[tutor.major][slot] += 1
+    return counts
+
+def per_call(function, repeats):
+    """
+    Times a function and returns the average time per call in microseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats * 1e6
+
+if __name__ == "__main__":
+    sizes = [int(size) for size in sys.argv[1:]] or [40, 200, 1000, 5000, 20000]
+
+    print(f"{'tutors':>7} {'build ms':>9} {'scan us':>10} {'tensor us':>10} {'count scan us':>14} {'count tensor us':>16}")
+    for size in sizes:
+        tutors = random_tutors(size)
+        repeats = max(3, 20000 // size)
+
+        start = time.perf_counter()
+        tensor = build_tensor(tutors)
+        build = (time.perf_counter() - start) * 1000
+
+        def tensor_query():
+            on_shift = tensor.on_shift(2, 12)
+            tensor.shift_end(2, 12, on_shift)
+
+        # make sure both agree before timing them
+        on_shift = tensor.on_shift(2, 12)
+        assert scan_cells(tutors, 2, 12) == list(zip(on_shift.tolist(), tensor.shift_end(2, 12, on_shift).tolist()))
+
+        print(
+            f"{size:>7} {build:>9.1f}"
+            f" {per_call(lambda: scan_cells(tutors, 2, 12), repeats):>10.1f}"
+            f" {per_call(tensor_query, repeats):>10.1f}"
+            f" {per_call(lambda: count_cells(tutors, 2), repeats):>14.1f}"
+            f" {per_call(lambda: tensor.major_counts(2), repeats):>16.1f}"
+        )
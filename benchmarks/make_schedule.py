@@ -0,0 +1,171 @@
+"""
+Writes a made-up Schedule.xlsx with the same layout as the real one, for testing how the display
+copes with more tutors, longer hours or emptier schedules.
+
+The workbook has the three sheets excel.py reads:
+  - 'Print Schedule': a header row and six rows (MAE, CEE, a hidden row, BENG, ECE, CMPE) for each
+    weekday, starting on rows 4, 13, 22, 31 and 40. Open slots hold the major's code when someone of
+    that major is in and are empty otherwise; closed slots hold "n"
+  - 'Schedule': a header on row 11 and one row per tutor per weekday from row 12 on (name, day, major
+    and one cell per half hour from 7:00)
+  - 'Tutor Info': a header row and one row per tutor (name, email, A number, class, ..., picture)
+
+Usage (from the repository root):
+    python benchmarks/make_schedule.py data/Schedule.xlsx --tutors 40 --open 8:00 --close 20:00 --density 0.3
+"""
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from openpyxl import Workbook
+from constants import MAJORS, WEEKDAYS, SCHEDULE_START_MINUTE, SLOT_MINUTES
+
+# the number of half hour columns in both schedule sheets (7:00 to 21:00)
+SLOT_COUNT = 28
+
+# the codes each major uses in the print schedule and in the tutor schedule
+PRINT_CODES = {"MAE": "MA", "CMPE": "CP", "ECE": "EL", "CEE": "CE", "BENG": "B"}
+SHIFT_CODES = {"MAE": "M", "CMPE": "CP", "ECE": "EL", "CEE": "CE", "BENG": "B"}
+
+# the rows of each day in the print schedule, in the order they are in the real spreadsheet (None is the hidden row)
+PRINT_ROWS = ["MAE", "CEE", None, "BENG", "ECE", "CMPE"]
+
+ACADEMIC_CLASSES = ["Freshman", "Sophomore", "Junior", "Senior", "Graduate"]
+
+def parse_slot(text):
+    """
+    Turns a time like "8:30" (24 hour clock) into the index of its half hour column.
+    """
+    hour, minute = (int(part) for part in text.split(":"))
+    return (hour * 60 + minute - SCHEDULE_START_MINUTE) // SLOT_MINUTES
+
+def slot_label(slot):
+    """
+    The label of a half hour column on a 12 hour clock, e.g. 13 -> "1:30".
+    """
+    hour, minute = divmod(SCHEDULE_START_MINUTE + slot * SLOT_MINUTES, 60)
+    return f"{(hour - 1) % 12 + 1}:{minute:02d}"
+
+def make_shifts(rng, open_slot, close_slot, density):
+    """
+    Picks the slots one tutor works on one day.
+    :return: a list of booleans, one per column
+    """
+    working = [False] * SLOT_COUNT
+    target = round((close_slot - open_slot) * density)
+
+    # shifts are one to four hours long and may overlap, so stop once enough slots are covered
+    attempts = 0
+    while sum(working) < target and attempts < 20:
+        attempts += 1
+        length = min(rng.randint(2, 8), close_slot - open_slot)
+        start = rng.randint(open_slot, close_slot - length)
+        for slot in range(start, start + length):
+            working[slot] = True
+
+    return working
+
+def make_schedule(path, tutors=40, majors=MAJORS, open_time="8:00", close_time="20:00", density=0.3, seed=1):
+    """
+    Writes a made-up schedule workbook.
+    :param path: where to save the workbook
+    :param tutors: how many tutors to make
+    :param majors: the majors the tutors are spread across (abbreviations from constants.MAJORS)
+    :param open_time: when the center opens, on a 24 hour clock
+    :param close_time: when the center closes, on a 24 hour clock
+    :param density: roughly what fraction of the open hours each tutor works on a day (0 to 1)
+    :param seed: the seed for the random shifts so the same arguments always give the same workbook
+    :return: a dictionary describing what was written
+    """
+    open_slot = max(0, parse_slot(open_time))
+    close_slot = min(SLOT_COUNT, parse_slot(close_time))
+    if open_slot >= close_slot:
+        raise ValueError(f"the center has to open before it closes ({open_time} - {close_time})")
+    unknown = [major for major in majors if major not in PRINT_CODES]
+    if unknown:
+        raise ValueError(f"unknown majors: {', '.join(unknown)}")
+
+    rng = random.Random(seed)
+    workbook = Workbook()
+    print_sheet = workbook.active
+    print_sheet.title = "Print Schedule"
+    schedule_sheet = workbook.create_sheet("Schedule")
+    info_sheet = workbook.create_sheet("Tutor Info")
+    labels = [slot_label(slot) for slot in range(SLOT_COUNT)]
+
+    # --- the tutor schedule: ten rows of title and notes, then the header on row 11 ---
+    schedule_sheet.append(["Engineering Tutor Center Schedule"])
+    for _ in range(9):
+        schedule_sheet.append([])
+    schedule_sheet.append(["Name", "Day", "Major"] + labels)
+
+    staffed = {day: {major: [False] * SLOT_COUNT for major in PRINT_CODES} for day in WEEKDAYS}
+    shift_slots = 0
+    people = []
+    for index in range(tutors):
+        name = f"Tutor {index:03d}"
+        major = majors[index % len(majors)]
+        people.append((name, major))
+
+        for day in WEEKDAYS:
+            working = make_shifts(rng, open_slot, close_slot, density)
+            shift_slots += sum(working)
+            for slot, on in enumerate(working):
+                staffed[day][major][slot] |= on
+            schedule_sheet.append([name, day, major] + [SHIFT_CODES[major] if on else None for on in working])
+
+    # --- the tutor info: a header and one row per tutor ---
+    info_sheet.append(["Name", "Email", "A Number", "Class", "", "", "", "", "", "Picture"])
+    for name, major in people:
+        info_sheet.append([
+            name, f"{name.lower().replace(' ', '.')}@usu.edu", f"A{rng.randint(0, 99999999):08d}",
+            rng.choice(ACADEMIC_CLASSES), None, None, None, None, None, f"{name}.jpg"
+        ])
+
+    # --- the print schedule: three rows of title, then nine rows per weekday ---
+    print_sheet.append(["Engineering Tutor Center"])
+    print_sheet.append([])
+    print_sheet.append([])
+    for day in WEEKDAYS:
+        print_sheet.append([day] + labels)
+        for major in PRINT_ROWS:
+            row = [major or ""]
+            for slot in range(SLOT_COUNT):
+                if not open_slot <= slot < close_slot:
+                    row.append("n")
+                elif major is not None and staffed[day][major][slot]:
+                    row.append(PRINT_CODES[major])
+                else:
+                    row.append(None)
+            print_sheet.append(row)
+        print_sheet.append([])
+        print_sheet.append([])
+
+    workbook.save(path)
+    return {
+        "tutors": tutors,
+        "majors": list(majors),
+        "open": open_time,
+        "close": close_time,
+        "density": density,
+        "shift_slots": shift_slots,
+        "bytes": os.path.getsize(path),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Writes a made-up Schedule.xlsx.")
+    parser.add_argument("path", help="where to save the workbook")
+    parser.add_argument("--tutors", type=int, default=40, help="how many tutors to make")
+    parser.add_argument("--majors", default=",".join(MAJORS), help="comma separated majors, e.g. MAE,ECE")
+    parser.add_argument("--open", default="8:00", help="when the center opens (24 hour clock)")
+    parser.add_argument("--close", default="20:00", help="when the center closes (24 hour clock)")
+    parser.add_argument("--density", type=float, default=0.3, help="fraction of the open hours each tutor works")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the random shifts")
+    args = parser.parse_args()
+
+    print(make_schedule(
+        args.path, args.tutors, args.majors.split(","), args.open, args.close, args.density, args.seed
+    ))
@@ -2,8 +2,10 @@ cd /home/tutorcenter/Tutor-Display
 git pull 
 rclone sync Box:'/Engineering Tutoring Center/Schedule.xlsx' ./data
 rclone sync Box:'/Engineering Tutoring Center/Pictures For Display' ./Images
-/home/tutorcenter/Tutor-Display/venv/bin/python src/main.py > ERRORLOG.txt
-echo -e '\nThe system crashed'
+/home/tutorcenter/Tutor-Display/venv/bin/python src/preprocess_images.py
+# the supervisor restarts the display if it crashes and only returns once it is closed on purpose
+/home/tutorcenter/Tutor-Display/venv/bin/python src/supervisor.py > ERRORLOG.txt
+echo -e '\nThe display was closed'
 while true; do
 	sleep 1
 done
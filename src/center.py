@@ -0,0 +1,90 @@
+#import modules
+import startup
+from PySide6.QtCore import QObject, Signal
+from excel import ExcelManager
+from schedule_loader import ScheduleLoader
+from watcher import FileWatcher
+
+class Center(QObject):
+    """
+    one tutor center: its spreadsheet and the snapshot parsed from it. every window showing the center
+    reads the same snapshot, so the spreadsheet is only watched and parsed once however many screens show it
+
+    Signals:
+        snapshot_changed(snapshot)
+            a new snapshot has been swapped in
+
+    Methods:
+        __init__(self, name, title, schedule_file_path, cache_path, parent=None)
+            loads the cached schedule and starts watching the spreadsheet
+
+        load(self)
+            makes sure the snapshot matches the spreadsheet, parsing it in the background if it does not
+
+        reload_schedule(self)
+            reads the spreadsheet again after the file watcher saw it change
+
+        swap_snapshot(self, snapshot)
+            switches the center to a snapshot built by the loader
+
+        stop(self)
+            stops reading the spreadsheet before the center is deleted
+    """
+    snapshot_changed = Signal(object)
+
+    def __init__(self, name, title, schedule_file_path, cache_path, parent=None):
+        """
+        loads the cached schedule and starts watching the spreadsheet
+        :param name: a short name for the center, used in the log
+        :param title: the title shown across the top of the display
+        :param schedule_file_path: the path to the center's spreadsheet
+        :param cache_path: the path to the binary cache of the spreadsheet
+        :param parent: the QObject that owns the center
+        """
+        super().__init__(parent)
+        self.name = name
+        self.title = title
+
+        # show the cached schedule straight away. the spreadsheet is checked on a worker thread once the window is up
+        self.em = ExcelManager(schedule_file_path, cache_path)
+        self.em.load_cache()
+        startup.mark("cache loaded")
+        self.loader = ScheduleLoader(self.em, self)
+        # noinspection PyUnresolvedReferences
+        self.loader.snapshot_ready.connect(self.swap_snapshot)
+
+        # reload the spreadsheet when a sync changes it instead of checking every update
+        self.watcher = FileWatcher(schedule_file_path, parent=self)
+        # noinspection PyUnresolvedReferences
+        self.watcher.schedule_changed.connect(self.reload_schedule)
+
+    def load(self):
+        """
+        makes sure the snapshot matches the spreadsheet, parsing it in the background if it does not
+        """
+        self.loader.load()
+
+    def reload_schedule(self):
+        """
+        reads the spreadsheet again in the background after the file watcher saw it change
+        """
+        print(f"{self.em.schedule_file_path} changed, reloading the {self.name} schedule")
+        self.loader.load()
+
+    def swap_snapshot(self, snapshot):
+        """
+        switches the center to a snapshot built by the loader. until this runs the old one stays on screen
+        :param snapshot: the new ScheduleSnapshot
+        """
+        if snapshot is None or snapshot is self.em.get_snapshot():
+            return
+
+        # the swap is one assignment on the GUI thread, so nothing ever sees half of a new schedule
+        self.em.snapshot = snapshot
+        self.snapshot_changed.emit(snapshot)
+
+    def stop(self):
+        """
+        stops reading the spreadsheet before the center is deleted, waiting for a load that is still running
+        """
+        self.loader.stop()
@@ -0,0 +1,29 @@
+"""
+the one place the display asks what time it is. benchmarks/bench_day.py swaps in its own clock to
+replay a whole day without waiting for it
+"""
+#import modules
+from datetime import datetime
+
+# the function that gives the current local time
+_now = datetime.now
+
+def now():
+    """
+    :return: the current local time as a naive datetime
+    """
+    return _now()
+
+def timestamp():
+    """
+    :return: the current time as a POSIX timestamp, from the same clock as now()
+    """
+    return _now().timestamp()
+
+def set_clock(function=None):
+    """
+    changes where the time comes from
+    :param function: a function that returns a naive local datetime (None goes back to the system clock)
+    """
+    global _now
+    _now = function if function is not None else datetime.now
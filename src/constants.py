@@ -8,15 +8,94 @@ TITLE_TEAL = "#00706d"
 BACK_BLUE = "#cce9e8"
 BACK_GREY = "#efefef"
 BORDER_GREY = "#d9d9d9"
+NETWORK_BANNER_RED = "#a31f1f"
 MAE_RED_DARK = '#b02d20'
 CEE_GREEN_DARK = '#185919'
 BENG_BLUE_DARK = '#224a8f'
 ECE_YELLOW_DARK = '#a67f0d'
 CMPE_ORAGNE_DARK = "#b56312"
 
+#the color of every major
+MAJOR_COLORS = {
+    "MAE": MAE_RED,
+    "ECE": ECE_YELLOW,
+    "CMPE": CMPE_ORAGNE,
+    "BENG": BENG_BLUE,
+    "CEE": CEE_GREEN
+}
+
+#how round the corners of the panels are
+CORNER_RADIUS = 30
+
+#the schedule is split into half hour slots and the first slot starts at 7:00 AM (in minutes after midnight)
+SCHEDULE_START_MINUTE = 7 * 60
+SLOT_MINUTES = 30
+
+#the days the tutor center is open, in the same order as datetime.weekday()
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']
+
 #how many rows should the tutor list have
 TUTOR_LIST_HEIGHT = 12
 
+#how much memory the finished tutor portraits may use before the least recently used ones are dropped
+PORTRAIT_CACHE_BYTES = 32 * 1024 * 1024
+
+#where the synced tutor pictures are and where the small copies made by preprocess_images.py go
+IMAGES_DIR = "Images"
+DERIVED_PORTRAITS_DIR = "data/portraits"
+DERIVED_PORTRAITS_MANIFEST = "data/portraits/manifest.json"
+
+#the tutor centers the display can show. each one has its own spreadsheet (and cache of it) and a title.
+#with --all-screens the attached screens take turns showing them, so a second center needs a second screen
+#and a second rclone sync writing its spreadsheet next to the first one
+CENTERS = [
+    {
+        "name": "engineering",
+        "title": "Welcome to The Engineering Tutor Center",
+        "schedule_file_path": "data/Schedule.xlsx",
+        "cache_path": "data/schedule_cache.bin",
+    },
+]
+
+#how long Schedule.xlsx and Images/ have to stop changing before the display reloads them (a sync writes in bursts)
+WATCH_DEBOUNCE_MS = 2000
+
+#how often to check that the wall clock has not jumped (NTP syncing after boot, someone setting the time)
+#and how far it may drift before the next update is worked out again
+CLOCK_CHECK_MS = 60 * 1000
+CLOCK_JUMP_TOLERANCE_S = 2
+
+#how often the internet connection is checked and where the check connects to
+NETWORK_CHECK_MS = 60 * 1000
+NETWORK_PROBE_ADDRESS = ("8.8.8.8", 53)
+NETWORK_PROBE_TIMEOUT_S = 3
+
+#how often the memory of the display is sampled, how many samples are kept (a day at one every 10 minutes),
+#how much the resident memory may grow across those samples before a warning is logged and how many of the
+#most common Qt classes are logged with each sample
+MEMORY_CHECK_MS = 10 * 60 * 1000
+MEMORY_WINDOW_SAMPLES = 144
+MEMORY_GROWTH_WARNING_MIB = 20
+MEMORY_TOP_CLASSES = 8
+
+#where the timing histograms are served for the monitoring box to scrape (localhost only, None to turn it off)
+#and the upper bounds of the histogram buckets in seconds
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9464
+METRICS_BUCKETS_S = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+#how supervisor.py restarts the display after a crash: the first wait, which doubles after every crash in a
+#row up to the longest wait, how long the display has to stay up to count as healthy again (and for the
+#schedule it is showing to be kept as the last good one) and where the crash and restart counts are kept
+SUPERVISOR_BACKOFF_START_S = 1
+SUPERVISOR_BACKOFF_MAX_S = 5 * 60
+SUPERVISOR_HEALTHY_S = 10 * 60
+SUPERVISOR_STATS_PATH = "data/supervisor.json"
+
+#the size the tutor pictures are cropped and scaled to. about twice what a card shows on a 1080p screen
+PORTRAIT_WIDTH = 240
+PORTRAIT_HEIGHT = 320
+
 #useful sorting and conversion
 MAJOR_ABBREVIATIONS = {
     "MAE":"Mechanical Engineer",
@@ -1,16 +1,103 @@
 #import modules
-from PySide6.QtGui import QPixmap, QPainter, QPainterPath, QColor, QPen, QFont, QFontDatabase
+from PySide6.QtGui import QPainter, QPen, QColor, QFontMetrics
 from PySide6.QtWidgets import QWidget, QLabel, QSizePolicy, QVBoxLayout, QFrame, QHBoxLayout
-from PySide6.QtCore import Qt, QSize, QRectF
+from PySide6.QtCore import Qt, QSize, QRect
 from constants import *
+import fonts
+import portraits
+import style
+
+class WidgetPool:
+    """
+    keeps widgets that are no longer on screen so that they can be rebound and reused instead of built again.
+    the widget class has to have a bind method that takes the same arguments as its constructor
+
+    Methods:
+        __init__(self, widget_class, max_size=64)
+            defines the empty pool
+
+        acquire(self, *args)
+            gets a widget showing the arguments, reusing a free one if there is one
+
+        release(self, widget)
+            gives a widget that was taken off screen back to the pool
+
+        hit_rate(self)
+            the fraction of acquires that reused a widget
+    """
+    def __init__(self, widget_class, max_size=64):
+        """
+        defines the empty pool
+        :param widget_class: the class of widget kept in the pool
+        :param max_size: how many free widgets to keep at most. any more than that are deleted
+        """
+        self.widget_class = widget_class
+        self.max_size = max_size
+        self.free = []
+
+        # counters for how well the pool is working
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+        self.discarded = 0
+
+    def acquire(self, *args):
+        """
+        gets a widget showing the arguments, reusing a free one if there is one
+        :param args: the arguments for the widget's constructor or bind method
+        :return: the widget
+        """
+        if self.free:
+            self.hits += 1
+            widget = self.free.pop()
+            widget.bind(*args)
+            return widget
+
+        self.misses += 1
+        return self.widget_class(*args)
+
+    def release(self, widget):
+        """
+        gives a widget that was taken off screen back to the pool
+        :param widget: the widget to give back
+        """
+        self.released += 1
+
+        # take it out of its layout and unparent it so it disappears and does not get deleted along with the page it was on
+        parent = widget.parentWidget()
+        if parent is not None and parent.layout() is not None:
+            parent.layout().removeWidget(widget)
+        widget.setParent(None)
+        if len(self.free) < self.max_size:
+            self.free.append(widget)
+        else:
+            self.discarded += 1
+            widget.deleteLater()
+
+    def hit_rate(self):
+        """
+        the fraction of acquires that reused a widget
+        :return: a number from 0 to 1 (0 if nothing was acquired yet)
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __repr__(self):
+        return (
+            f"{self.widget_class.__name__} pool: {self.hits} hits, {self.misses} misses "
+            f"({self.hit_rate():.0%}), {len(self.free)} free, {self.discarded} discarded"
+        )
 
 class TutorCard(QFrame):
     """
     defines the layout of a tutor card so that it can easily be copied
 
     Methods:
-        __init__(self, tutor_name, profile_image_path, major, academic_class, schedule)
+        __init__(self, tutor_name, profile_image_path, major, academic_class, leaving_at)
             defines the layout of the tutor card based on the supplied arguments
+
+        bind(self, tutor_name, profile_image_path, major, academic_class, leaving_at)
+            fills the card in with a different tutor without rebuilding it
     """
 
     def __init__(self, tutor_name, profile_image_path, major, academic_class, leaving_at):
@@ -24,12 +111,6 @@ class TutorCard(QFrame):
         """
         super().__init__()
 
-        # define the font
-        font_id = QFontDatabase.addApplicationFont("Fonts/BRLNSR.TTF")
-        if font_id < 0:
-            print("Error loading font")
-        families = QFontDatabase.applicationFontFamilies(font_id)
-
         # define constants
         self.spacing = 10
 
@@ -39,62 +120,60 @@ class TutorCard(QFrame):
         self.setLayout(main_layout)
 
         # define the profile picture
-        profile_pic = RoundedImageLabel(profile_image_path, BORDER_GREY, 20)
-        profile_pic.setStyleSheet(f"background-color: {BACK_GREY}")
-        main_layout.addWidget(profile_pic)
+        self.profile_pic = RoundedImageLabel(profile_image_path, BORDER_GREY, 20)
+        main_layout.addWidget(self.profile_pic)
 
         # define the widget to hold the details
         details_widget = QWidget()
         details_layout = QVBoxLayout()
         details_widget.setLayout(details_layout)
-        details_widget.setStyleSheet("background-color: transparent")
+        details_widget.setObjectName("cardDetails")
         main_layout.addWidget(details_widget)
 
         # define the widget for the name
-        name_widget = QLabel(tutor_name)
-        name_widget.setStyleSheet("color: black")
-        name_widget.setFont(QFont(families[0], int((self.height())/TUTOR_LIST_HEIGHT)*0.45))
-        details_layout.addWidget(name_widget)
-
-        # get the border color from the tutors major
-        match major:
-            case "Biological Engineer":
-                color = BENG_BLUE
-            case "Civil Engineer":
-                color = CEE_GREEN
-            case "Electrical Engineer":
-                color = ECE_YELLOW
-            case "Computer Engineer":
-                color = CMPE_ORAGNE
-            case "Mechanical Engineer":
-                color = MAE_RED
-            case _:
-                color = 'black'
+        self.name_widget = QLabel()
+        self.name_widget.setFont(fonts.get_font("regular", int((self.height())/TUTOR_LIST_HEIGHT)*0.45))
+        details_layout.addWidget(self.name_widget)
 
         # add a line under the name with their color
-        line_widget = QWidget()
-        line_widget.setFixedHeight(8)
-        line_widget.setStyleSheet(
-            f"border: 8px solid; "
-            f"border-color: transparent transparent {color} transparent; "
-            f"border-radius: 0"
-        )
-        details_layout.addWidget(line_widget)
+        self.line_widget = QWidget()
+        self.line_widget.setObjectName("majorLine")
+        self.line_widget.setFixedHeight(8)
+        details_layout.addWidget(self.line_widget)
 
         # define the widget for the major and the year of school they are in
-        title_widget = QLabel(f"{major} ({academic_class})")
-        title_widget.setStyleSheet("color: black")
-        title_widget.setFont(QFont(families[0], 15))
-        details_layout.addWidget(title_widget)
+        self.title_widget = QLabel()
+        self.title_widget.setFont(fonts.get_font("regular", 15))
+        details_layout.addWidget(self.title_widget)
 
         # defile the widget for when they are leaving
-        tutor_schedule_widget = QLabel(leaving_at)
-        tutor_schedule_widget.setStyleSheet("color: black")
-        tutor_schedule_widget.setFont(QFont(families[0], 15))
-        details_layout.addWidget(tutor_schedule_widget)
+        self.tutor_schedule_widget = QLabel()
+        self.tutor_schedule_widget.setFont(fonts.get_font("regular", 15))
+        details_layout.addWidget(self.tutor_schedule_widget)
 
-        # format the overall card
-        self.setStyleSheet(f"TutorCard {{background-color: {BACK_GREY}; border: 2px solid {BORDER_GREY}}}")
+        # fill in the details
+        self.major = None
+        self.bind(tutor_name, profile_image_path, major, academic_class, leaving_at)
+
+    def bind(self, tutor_name, profile_image_path, major, academic_class, leaving_at):
+        """
+        fills the card in with a different tutor without rebuilding it
+        :param tutor_name: the name of the tutor
+        :param profile_image_path: the path to the tutor
+        :param major: the major of the tutor
+        :param academic_class: the academic_class (senior, junior, etc.) of the tutor
+        :param leaving_at: what hours the tutor is here for
+        """
+        self.name_widget.setText(tutor_name)
+        self.title_widget.setText(f"{major} ({academic_class})")
+        self.tutor_schedule_widget.setText(leaving_at)
+        self.profile_pic.set_image(profile_image_path)
+
+        # only recolor the line if the major changed. the color comes from the application style sheet
+        if major == self.major:
+            return
+        self.major = major
+        style.set_major(self.line_widget, major)
 
 class RoundedImageLabel(QLabel):
     """
@@ -104,8 +183,14 @@ class RoundedImageLabel(QLabel):
         __init__(self, image_path, border_color, corner_radius=20)
             saves the arguments as class variables
 
+        set_image(self, image_path)
+            swaps the picture for a different one
+
         resizeEvent(self, event)
-            called on resize. defines the rounded corners and adds them
+            called on resize. redraws the picture at the new size
+
+        render_rounded(self)
+            shows the picture with rounded corners and a border at the current size
     """
 
     def __init__(self, image_path, border_color, corner_radius=20):
@@ -116,60 +201,41 @@ class RoundedImageLabel(QLabel):
         :param corner_radius: the radius of the corner
         """
         super().__init__()
-        self.pixmap_original = QPixmap(image_path)  # Load the original image
+        self.image_path = image_path
         self.corner_radius = corner_radius
         self.border_color = border_color
 
-    def resizeEvent(self, event):
-        if self.pixmap_original.isNull():
-            return
-
-        # scale the pixmap to fit the label, maintaining aspect ratio
-        scaled_pixmap = self.pixmap_original.scaled(
-            self.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-
-        # create a new QPixmap for the result
-        rounded_pixmap = QPixmap(scaled_pixmap.size())
-        rounded_pixmap.fill(Qt.GlobalColor.transparent)
-
-        # create the painter for drawing
-        painter = QPainter(rounded_pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # draw the image with rounded corners (using clipping path)
-        path = QPainterPath()
-        r = self.corner_radius  # The radius of the corners
-        rect = QRectF(scaled_pixmap.rect())  # Convert QRect to QRectF
-        path.addRoundedRect(rect, r, r)  # Add rounded rect path
-        painter.setClipPath(path)  # Set clipping path to make the image fit inside
-
-        # draw the image
-        painter.drawPixmap(0, 0, scaled_pixmap)
+        # the height comes from the card and the width follows from the picture, so the size of the
+        # picture never feeds back into the layout and a reused card looks the same as a new one
+        self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Ignored)
 
-        # now draw the border on top of the image
-        border_thickness = 5  # Set the thickness of the border
-        border_color = QColor(self.border_color)  # Set the border color (red as an example)
-
-        # create a QPen for the border with specified thickness and color
-        pen = QPen(border_color)
-        pen.setWidth(border_thickness)  # Set the width of the border
-        painter.setPen(pen)  # Apply the pen to the painter
-        painter.setBrush(Qt.GlobalColor.transparent)  # No fill for the border
-
-        # draw the rounded rectangle border (without clipping)
-        painter.drawRoundedRect(rect, r, r)
+    def set_image(self, image_path):
+        """
+        swaps the picture for a different one and redraws it at the current size
+        :param image_path: the path to the image
+        """
+        if image_path == self.image_path:
+            return
+        self.image_path = image_path
+        self.render_rounded()
 
-        # end the painter to finalize drawing
-        painter.end()
+    def resizeEvent(self, event):
+        self.render_rounded()
+        super().resizeEvent(event)
 
-        # set the pixmap with the final result (image + border)
-        self.setPixmap(rounded_pixmap)
+    def render_rounded(self):
+        """
+        shows the picture with rounded corners and a border at the current size, drawing it only if it is not cached
+        """
+        # the picture fits in a square as tall as the label
+        pixmap = portraits.portrait_cache.get(self.image_path, self.height(), self.corner_radius, self.border_color)
+        if pixmap.isNull():
+            self.clear()
+            self.setFixedWidth(0)
+            return
 
-        super().resizeEvent(event)
-        self.setFixedWidth(rounded_pixmap.width())
+        self.setPixmap(pixmap)
+        self.setFixedWidth(pixmap.width())
 
 class WillReturn(QLabel):
     """
@@ -178,6 +244,9 @@ class WillReturn(QLabel):
     Methods:
         __init__(self, major, return_time)
             defines the widget
+
+        bind(self, major, return_time)
+            changes the major and time without rebuilding the widget
     """
     def __init__(self, major, return_time):
         """
@@ -187,12 +256,6 @@ class WillReturn(QLabel):
         """
         super().__init__()
 
-        # define the font
-        font_id = QFontDatabase.addApplicationFont("Fonts/BRLNSR.TTF")
-        if font_id < 0:
-            print("Error loading font")
-        families = QFontDatabase.applicationFontFamilies(font_id)
-
         # define constants
         self.spacing = 10
         offset = 30
@@ -205,145 +268,220 @@ class WillReturn(QLabel):
 
         # add a spacer
         spacer = QLabel()
-        spacer.setStyleSheet("background: transparent")
         spacer.setFixedHeight(offset - 15)
         main_layout.addWidget(spacer)
 
         # add the main text
-        main_text = QLabel(f"{major}ing\nWill Return {return_time}")
-        main_text.setStyleSheet("color: black; background-color: transparent")
-        main_text.setFont(QFont(families[0], 25))
-        main_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        main_layout.addWidget(main_text)
-
-        # get the color of the major
-        match major:
-            case "Biological Engineer":
-                bar_color = BENG_BLUE
-            case "Civil Engineer":
-                bar_color = CEE_GREEN
-            case "Electrical Engineer":
-                bar_color = ECE_YELLOW
-            case "Computer Engineer":
-                bar_color = CMPE_ORAGNE
-            case "Mechanical Engineer":
-                bar_color = MAE_RED
-            case _:
-                bar_color = 'black'
-
-        # add another spacer
-        spacer2 = QLabel()
-        spacer2.setStyleSheet(
-            f"border: 6px solid; "
-            f"border-color: {bar_color} transparent transparent transparent; "
-            f"background: transparent"
-        )
-        spacer2.setFixedSize(QSize(int(self.width() * 5 / 8), offset + 15))
-        main_layout.addWidget(spacer2)
+        self.main_text = QLabel()
+        self.main_text.setFont(fonts.get_font("regular", 25))
+        self.main_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        main_layout.addWidget(self.main_text)
+
+        # add another spacer. its top border is the colored bar
+        self.spacer2 = QLabel()
+        self.spacer2.setObjectName("majorBar")
+        self.spacer2.setFixedSize(QSize(int(self.width() * 5 / 8), offset + 15))
+        main_layout.addWidget(self.spacer2)
+
+        # fill in the details
+        self.major = None
+        self.bind(major, return_time)
+
+    def bind(self, major, return_time):
+        """
+        changes the major and time without rebuilding the widget
+        :param major: the major that will return
+        :param return_time: when the tutor will return as a full string
+        """
+        self.main_text.setText(f"{major}ing\nWill Return {return_time}")
 
-        # format the overall widget
-        self.setStyleSheet(f"WillReturn {{background-color: {BACK_GREY}; border: 2px solid {BORDER_GREY}}}")
+        # only recolor the bar if the major changed. the color comes from the application style sheet
+        if major == self.major:
+            return
+        self.major = major
+        style.set_major(self.spacer2, major)
 
-class ScheduleCell(QLabel):
+class ScheduleGrid(QWidget):
     """
-    a widget for the individual cells of the schedule
+    paints the whole "Today's Schedule" grid, with the hour and major labels, in one widget
 
     Methods:
-        __init__(self, major, row, col, dark)
+        __init__(self, schedule, now_index, spacing)
             defines the widget
+
+        set_schedule(self, schedule)
+            shows a different schedule
+
+        set_now_index(self, now_index)
+            moves the dark current-time column, only repainting the two columns that changed
+
+        change_minutes(self)
+            gets the times of day at which the dark column moves on screen
+
+        paintEvent(self, event)
+            paints the part of the grid that needs it
     """
-    def __init__(self, major, row, col, dark, start_index, end_index):
+    # the light and dark color of every code in the print schedule
+    CELL_COLORS = {
+        "MA": (MAE_RED, MAE_RED_DARK),
+        "CE": (CEE_GREEN, CEE_GREEN_DARK),
+        "B": (BENG_BLUE, BENG_BLUE_DARK),
+        "EL": (ECE_YELLOW, ECE_YELLOW_DARK),
+        "CP": (CMPE_ORAGNE, CMPE_ORAGNE_DARK),
+    }
+    EMPTY_COLORS = ("white", "#9e9e9e")
+
+    # the height of the row of hour labels
+    LABEL_HEIGHT = 30
+
+    def __init__(self, schedule, now_index, spacing):
         """
         defines the widget
-        :param major: the abbreviation of the major
-        :param row: the row where it will be added (for format reasons)
-        :param col: the column where it will be added (for format reasons)
-        :param dark: if the cell should be a little darker because it is the current hour
+        :param schedule: the rows of the print schedule for today, in the order they are shown
+        :param now_index: the index of the current time slot (-1 if it is before opening)
+        :param spacing: the space left above and below the grid
         """
         super().__init__()
+        self.spacing = spacing
+        self.now_index = now_index
+        self.major_font = fonts.get_font("regular", 18)
+        self.hour_font = fonts.get_font("regular", 15)
 
-        if major.lower() == "c":
-            self.setFixedWidth(0)
+        # the width of the column of major labels on the left
+        metrics = QFontMetrics(self.major_font)
+        self.label_width = max(metrics.horizontalAdvance(major) for major in MAJORS) + 4
 
-        #define colors
-        border_color = 'black'
-        if dark:
-            match major:
-                case "MA":
-                    color = MAE_RED_DARK
-                case "CE":
-                    color = CEE_GREEN_DARK
-                case "B":
-                    color = BENG_BLUE_DARK
-                case "EL":
-                    color = ECE_YELLOW_DARK
-                case "CP":
-                    color = CMPE_ORAGNE_DARK
-                case _:
-                    color = '#9e9e9e'
-        else:
-            match major:
-                case "MA":
-                    color = MAE_RED
-                case "CE":
-                    color = CEE_GREEN
-                case "B":
-                    color = BENG_BLUE
-                case "EL":
-                    color = ECE_YELLOW
-                case "CP":
-                    color = CMPE_ORAGNE
-                case "C":
-                    color = 'pink'
-                case _:
-                    color = 'white'
-
-        #define default border colors
-        top_border = 'transparent'
-        bottom_border = border_color
-        left_border = 'transparent'
-        right_border = '#2e2e2e'
-
-        #define default border widths
-        right_border_width = '2px'
-        left_border_width = '2px'
-        bottom_border_width = '3px'
-
-        #define default border styles
-        right_border_style = 'solid'
-
-        #set the top border if it is on the top
-        if row == 0:
-            top_border = border_color
-
-        #set the bottom border if it is on the bottom
-        if row == 4:
-            bottom_border = border_color
-            bottom_border_width = '3px'
-
-        #set the 30-minute mark lines to dashed
-        if col % 2 == 0:
-            right_border_width = '1px'
-            right_border_style = 'dashed'
-
-        #set the left border if we are at the start
-        if col == start_index:
-            left_border = border_color
-            left_border_width = '3px'
-
-        #set the right border if we are at the end
-        if col == end_index:
-            right_border = border_color
-            right_border_width = '3px'
-            right_border_style = 'solid'
-
-        #set the style
-        self.setStyleSheet(
-            f"background-color: {color}; "
-            f"border-width: 4px {right_border_width} {bottom_border_width} {left_border_width}; "
-            f"border-style: solid {right_border_style} solid solid; "
-            f"border-color: {top_border} {right_border} {bottom_border} {left_border}"
-        )
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.set_schedule(schedule)
+
+    def set_schedule(self, schedule):
+        """
+        shows a different schedule
+        :param schedule: the rows of the print schedule for today, in the order they are shown
+        """
+        self.schedule = [[str(value) for value in row] for row in schedule]
+
+        # the grid only shows the columns between the first and the last slot that the center is open
+        open_cols = [col for col, value in enumerate(self.schedule[0]) if value.lower() != "c"]
+        self.start_index = open_cols[0] if open_cols else 0
+        self.end_index = open_cols[-1] if open_cols else len(self.schedule[0]) - 1
+        self.update()
 
-        #set the size policy
-        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
\ No newline at end of file
+    def set_now_index(self, now_index):
+        """
+        moves the dark current-time column, only repainting the two columns that changed
+        :param now_index: the index of the current time slot
+        """
+        if now_index == self.now_index:
+            return
+        for col in (self.now_index, now_index):
+            if col is not None and self.start_index <= col <= self.end_index:
+                self.update(self.column_rect(col))
+        self.now_index = now_index
+
+    def change_minutes(self):
+        """
+        gets the times of day at which the dark column moves on screen. before the first column and after
+        the last one moving the current time does not change anything that is painted
+        :return: a list of times in minutes after midnight
+        """
+        return [SCHEDULE_START_MINUTE + col * SLOT_MINUTES for col in range(self.start_index, self.end_index + 2)]
+
+    def cell_width(self):
+        """
+        :return: the width of one half hour column. one extra column is left empty on the right so the grid is not against the edge
+        """
+        return (self.width() - self.label_width) / (self.end_index - self.start_index + 2)
+
+    def cell_height(self):
+        """
+        :return: the height of one row of the grid
+        """
+        return (self.height() - self.LABEL_HEIGHT - 2 * self.spacing) / len(self.schedule)
+
+    def column_x(self, col):
+        """
+        :return: the x position of the left edge of a column
+        """
+        return round(self.label_width + (col - self.start_index) * self.cell_width())
+
+    def row_y(self, row):
+        """
+        :return: the y position of the top edge of a row
+        """
+        return round(self.spacing + self.LABEL_HEIGHT + row * self.cell_height())
+
+    def column_rect(self, col):
+        """
+        :return: the area covered by a column, including the lines around it
+        """
+        top = self.row_y(0)
+        return QRect(self.column_x(col) - 2, top - 2, self.column_x(col + 1) - self.column_x(col) + 4, self.row_y(len(self.schedule)) - top + 4)
+
+    def paintEvent(self, event):
+        """
+        paints the part of the grid that needs it. when only the current-time column moved the dirty area
+        is just the two columns so everything else is skipped
+        :param event: the paint event with the area to repaint
+        """
+        dirty = event.rect()
+        painter = QPainter(self)
+        rows = len(self.schedule)
+        top = self.row_y(0)
+        bottom = self.row_y(rows)
+        left = self.column_x(self.start_index)
+        right = self.column_x(self.end_index + 1)
+
+        # fill in the cells
+        for col in range(self.start_index, self.end_index + 1):
+            if not self.column_rect(col).intersects(dirty):
+                continue
+            x = self.column_x(col)
+            width = self.column_x(col + 1) - x
+            dark = col == self.now_index
+            for row in range(rows):
+                value = self.schedule[row][col]
+                if value.lower() == "c":
+                    continue
+                color = self.CELL_COLORS.get(value.upper(), self.EMPTY_COLORS)[dark]
+                painter.fillRect(x, self.row_y(row), width, self.row_y(row + 1) - self.row_y(row), QColor(color))
+
+        # the line after every column. the half hour marks are dashed
+        for col in range(self.start_index, self.end_index):
+            x = self.column_x(col + 1)
+            if not dirty.intersects(QRect(x - 2, top, 4, bottom - top)):
+                continue
+            if col % 2 == 0:
+                pen = QPen(QColor("#2e2e2e"), 1, Qt.PenStyle.DashLine)
+            else:
+                pen = QPen(QColor("#2e2e2e"), 2)
+            painter.setPen(pen)
+            painter.drawLine(x, top, x, bottom)
+
+        # the lines between the rows and the outline
+        painter.setPen(QPen(QColor("black"), 3))
+        for row in range(1, rows):
+            painter.drawLine(left, self.row_y(row), right, self.row_y(row))
+        painter.drawRect(QRect(left, top, right - left, bottom - top))
+        painter.setPen(QPen(QColor("black"), 4))
+        painter.drawLine(left, top, right, top)
+
+        # label every row with its major
+        painter.setFont(self.major_font)
+        for row, major in enumerate(MAJORS[:rows]):
+            rect = QRect(0, self.row_y(row), left, self.row_y(row + 1) - self.row_y(row))
+            if rect.intersects(dirty):
+                painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, major)
+
+        # label every hour, centered on the line where it starts
+        painter.setFont(self.hour_font)
+        width = round(2 * self.cell_width())
+        for col in range(0, len(self.schedule[0]) + 1, 2):
+            if col < self.start_index or col > self.end_index + 1:
+                continue
+            x = self.column_x(col)
+            rect = QRect(x - width // 2, self.spacing, width, self.LABEL_HEIGHT)
+            if rect.intersects(dirty):
+                painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, f"{(col // 2 + 6) % 12 + 1}:00")
+
+        painter.end()
@@ -1,123 +1,283 @@
-import json
 import math
-import os
-import pandas as pd
-from datetime import datetime
-from numpy.ma.core import floor
+import clock
+import metrics
+from constants import MAJORS, WEEKDAYS
+from snapshot import build_snapshot, file_fingerprint, load_snapshot, save_snapshot
+
+# the sheets that are read from the spreadsheet
+PRINT_SCHEDULE_SHEET = 'Print Schedule'
+TUTOR_SCHEDULE_SHEET = 'Schedule'
+TUTOR_INFO_SHEET = 'Tutor Info'
+
+# where each block starts if the markers below cannot be found: the row of the header above each day's
+# block in the print schedule (Monday through Friday) and the first row of shifts in the tutor schedule
+DAY_HEADER_ROWS = [3, 12, 21, 30, 39]
+FIRST_SHIFT_ROW = 11
+
+# the columns that are read from each sheet: the label and 'B:AC' for the days, 'A:AE' for the schedule and 'A:J' for the info
+PRINT_SCHEDULE_COLUMNS = 29
+TUTOR_SCHEDULE_COLUMNS = 31
+TUTOR_INFO_COLUMNS = 10
+
+# the number of rows in each day's block of the print schedule
+DAY_BLOCK_ROWS = 6
+
+def _is_empty(value):
+    """
+    Checks if a cell read by read_workbook is empty.
+    :param value: the value of the cell
+    :return: True if the cell is empty (NaN)
+    """
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+def _read_rows(sheet, col_count):
+    """
+    Streams the rows of a sheet down to its last non-empty row.
+    Empty cells become NaN and every row is padded to the same width.
+    :param sheet: the read-only openpyxl worksheet
+    :param col_count: the number of columns to read, starting at column A
+    :return: the rows as lists
+    """
+    # the dimensions saved in the file can be wrong, so read until the rows actually run out
+    sheet.reset_dimensions()
+
+    rows = []
+    last_filled = 0
+    for row in sheet.iter_rows(min_row=1, max_col=col_count, values_only=True):
+        rows.append([float('nan') if value is None else value for value in row] + [float('nan')] * (col_count - len(row)))
+        if any(value is not None for value in row):
+            last_filled = len(rows)
+    return rows[:last_filled]
+
+def _find_day_headers(rows):
+    """
+    Finds the header row above each day's block of the print schedule by the name of the day in its first two columns.
+    :param rows: the rows of the print schedule
+    :return: the index of the header of each weekday (DAY_HEADER_ROWS, with a warning, if they are not all found in order)
+    """
+    headers = []
+    for index, row in enumerate(rows):
+        if len(headers) == len(WEEKDAYS):
+            break
+        labels = {value.strip().lower() for value in row[:2] if isinstance(value, str)}
+        if WEEKDAYS[len(headers)].lower() in labels:
+            headers.append(index)
+
+    if len(headers) == len(WEEKDAYS):
+        return headers
+
+    # the layout changed in a way the search does not understand, so the days may come out wrong
+    print(
+        f"Warning: could not find the {WEEKDAYS[0]} to {WEEKDAYS[-1]} headers in the '{PRINT_SCHEDULE_SHEET}' sheet, "
+        f"using rows {', '.join(str(row + 1) for row in DAY_HEADER_ROWS)}"
+    )
+    return DAY_HEADER_ROWS
+
+def _find_first_shift_row(rows):
+    """
+    Finds the first row of shifts in the tutor schedule, which is the first row with a weekday in its second column.
+    :param rows: the rows of the tutor schedule
+    :return: the index of the row (FIRST_SHIFT_ROW, with a warning, if there is none)
+    """
+    for index, row in enumerate(rows):
+        if row[1] in WEEKDAYS:
+            return index
+
+    print(
+        f"Warning: no row of the '{TUTOR_SCHEDULE_SHEET}' sheet has a weekday in column B, "
+        f"reading the shifts from row {FIRST_SHIFT_ROW + 1}"
+    )
+    return FIRST_SHIFT_ROW
+
+def read_workbook(schedule_file_path):
+    """
+    Reads everything the display needs from the spreadsheet in a single streaming pass.
+    The workbook is opened read-only and each sheet is read once, down to its last non-empty row,
+    so the cost follows the amount of data and the sheets can grow without changing the code.
+    :param schedule_file_path: the path to the spreadsheet
+    :return: a tuple of (the five day schedules, the tutor schedule rows, the tutor info rows)
+    """
+    # openpyxl is only loaded once a spreadsheet actually has to be parsed
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(schedule_file_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        print_schedule = _read_rows(workbook[PRINT_SCHEDULE_SHEET], PRINT_SCHEDULE_COLUMNS)
+        tutor_schedule = _read_rows(workbook[TUTOR_SCHEDULE_SHEET], TUTOR_SCHEDULE_COLUMNS)
+        tutor_info = _read_rows(workbook[TUTOR_INFO_SHEET], TUTOR_INFO_COLUMNS)
+    finally:
+        # a read-only workbook keeps the file open until it is closed
+        workbook.close()
+
+    # the six rows under each day's header, without the label column
+    day_schedules = [
+        [row[1:] for row in print_schedule[header_row + 1:header_row + 1 + DAY_BLOCK_ROWS]]
+        for header_row in _find_day_headers(print_schedule)
+    ]
+
+    # every shift row and every tutor below the header row
+    tutor_schedule = tutor_schedule[_find_first_shift_row(tutor_schedule):]
+    tutor_info = tutor_info[1:]
+
+    return day_schedules, tutor_schedule, tutor_info
+
+def format_time(minutes):
+    """
+    Formats a time for the display.
+    :param minutes: the time in minutes after midnight
+    :return: the time on a 12-hour clock without am/pm, e.g. 870 -> "2:30"
+    """
+    hour, minute = divmod(minutes, 60)
+    display_hour = hour % 12
+    if display_hour == 0:
+        display_hour = 12 # Midnight or Noon case
+    return f"{display_hour}:{minute:02d}"
 
 # noinspection PyTypeChecker
 class ExcelManager:
     """
     Manages information grabbed from the local schedule spreadsheet.
 
+    The parsed schedule is kept in memory as an immutable ScheduleSnapshot. Queries answer from
+    the snapshot without touching the disk. When the spreadsheet changes a new snapshot is built
+    by read_snapshot (on a worker thread in the display) and replaces the old one in one step.
+
     Methods:
-        __init__(self)
+        __init__(self, schedule_file_path="data/Schedule.xlsx", cache_path="data/schedule_cache.bin")
             Defines variables.
         fetch_schedule(self)
-            Gets the schedule information from the local Excel file.
+            Makes sure the snapshot matches the local Excel file.
+        read_snapshot(self, current)
+            Works out the snapshot that matches the local Excel file without changing anything.
+        load_cache(self)
+            Uses the binary cache without checking it against the Excel file.
+        get_snapshot(self)
+            Gets the snapshot in memory.
         get_today_schedule(self)
             Specifically gets the schedule for today.
         get_on_shift(self)
             Gets a list of all the tutors on shift.
+        get_roster(self, weekday, slot)
+            Gets who is on shift during any slot of the week.
+        get_timeline(self)
+            Gets the roster for every slot of the week.
+        get_transitions(self, weekday)
+            Gets the times of day at which someone starts or ends a shift.
         get_now_index()
             Gets the index in today's schedule that corresponds to the current time.
     """
-    def __init__(self):
+    def __init__(self, schedule_file_path="data/Schedule.xlsx", cache_path="data/schedule_cache.bin"):
         """
         Defines variables.
+        :param schedule_file_path: the path to the local spreadsheet
+        :param cache_path: the path to the binary cache of the parsed spreadsheet
         """
-        # Set up the variables
-        self.friday_schedule = None
-        self.thursday_schedule = None
-        self.wednesday_schedule = None
-        self.tuesday_schedule = None
-        self.monday_schedule = None
-        self.tutors = dict(dict())
+        # Define local file paths
+        self.schedule_file_path = schedule_file_path
+        self.cache_path = cache_path
+
+        # The schedule currently in use (None until the first fetch)
+        self.snapshot = None
 
     def fetch_schedule(self):
         """
-        Gets the schedule information from the local spreadsheet file (Schedule.xlsx).
-        Uses caching to avoid reprocessing if the file hasn't changed since the last run.
+        Makes sure the in-memory snapshot matches the local spreadsheet file (Schedule.xlsx).
+        This blocks while the spreadsheet is parsed; the display uses a ScheduleLoader to do the
+        same work on a worker thread.
+        :return: the current ScheduleSnapshot (None if there is no data at all)
         """
-        # Define local file paths
-        schedule_file_path = "data/Schedule.xlsx"
-        tutor_cache_path = "data/tutor_data.json"
-        schedule_cache_path = "data/daily_schedules.json"
+        self.snapshot = self.read_snapshot(self.snapshot)
+        return self.snapshot
+
+    @metrics.timed("fetch_schedule")
+    def read_snapshot(self, current):
+        """
+        Works out the snapshot that matches the local spreadsheet file without changing the manager,
+        so it is safe to call from a worker thread while the display keeps using the current one.
+        On the common path this is a single os.stat call. The binary cache and the spreadsheet are
+        only read when the spreadsheet's fingerprint (mtime, size, inode) has changed.
+        :param current: the snapshot in use now (None if there is none)
+        :return: the ScheduleSnapshot to use (None if there is no data at all)
+        """
+        with metrics.timed("schedule_stat"):
+            fingerprint = file_fingerprint(self.schedule_file_path)
+
+        # --- Fast path: nothing has changed since the snapshot was built ---
+        if current is not None and current.fingerprint == fingerprint:
+            return current
 
         # --- Check if local Excel file exists ---
-        if not os.path.exists(schedule_file_path):
-            print(f"Error: '{schedule_file_path}' not found. Cannot update schedule.")
+        if fingerprint is None:
+            print(f"Error: '{self.schedule_file_path}' not found. Cannot update schedule.")
+            if current is not None:
+                # Keep showing what we already have, but remember the file is gone so we only warn once.
+                return current._replace(fingerprint=None)
+
             # Try to load from cache even if Excel file is missing, in case old data is sufficient.
-            try:
-                with open(tutor_cache_path, "r") as file:
-                    self.tutors = json.load(file)
-                with open(schedule_cache_path) as file:
-                    temp_list = json.load(file)
-                    self.monday_schedule = temp_list[0]
-                    self.tuesday_schedule = temp_list[1]
-                    self.wednesday_schedule = temp_list[2]
-                    self.thursday_schedule = temp_list[3]
-                    self.friday_schedule = temp_list[4]
-            except FileNotFoundError:
+            with metrics.timed("cache_load"):
+                cached = load_snapshot(self.cache_path)
+            if cached is None:
                 print("No cache found. Data remains uninitialized.")
-            return
+                return None
+            return cached._replace(fingerprint=None)
 
-        # --- Caching logic: Compare cache time with file modification time ---
-        do_update = False
-        last_read_time = None
+        # --- Caching logic: the cache is only valid for the exact file it was built from ---
+        with metrics.timed("cache_load"):
+            cached = load_snapshot(self.cache_path)
+        if cached is not None and cached.fingerprint == fingerprint:
+            return cached
+
+        # --- Process Excel file ---
+        with metrics.timed("excel_parse"):
+            parsed = self._parse_workbook()
+            if parsed is None:
+                # Keep the old data rather than showing nothing
+                return current
 
+            snapshot = build_snapshot(parsed[0], parsed[1], fingerprint)
+
+        # --- Cache saving logic ---
         try:
-            # Read tutor data cache
-            with open(tutor_cache_path, "r") as file:
-                self.tutors = json.load(file)
-            # Read schedule structure cache
-            with open(schedule_cache_path) as file:
-                temp_list = json.load(file)
-                self.monday_schedule = temp_list[0]
-                self.tuesday_schedule = temp_list[1]
-                self.wednesday_schedule = temp_list[2]
-                self.thursday_schedule = temp_list[3]
-                self.friday_schedule = temp_list[4]
-
-            # Get the timestamp from the last successful cache write
-            last_read_time = datetime.strptime(self.tutors['last_fetch'], "%Y-%m-%d %H:%M:%S.%f")
-
-        except (FileNotFoundError, KeyError, json.JSONDecodeError):
-            do_update = True
-
-        # Get modification time of the source Excel file
-        excel_mod_time = datetime.fromtimestamp(os.path.getmtime(schedule_file_path))
-
-        # If cache exists and is newer than the Excel file, no need to update.
-        if not do_update and last_read_time > excel_mod_time:
-            # print("Cache is up to date.") # Optional: for debugging
-            return
+            with metrics.timed("cache_save"):
+                save_snapshot(snapshot, self.cache_path)
+        except OSError as e:
+            print(f"Error saving the schedule cache '{self.cache_path}': {e}")
 
-        # --- Process Excel file ---
+        return snapshot
+
+    def load_cache(self):
+        """
+        Uses the binary cache as it is, without checking it against the spreadsheet, so the display
+        has something to show straight away. Nothing happens if a snapshot is already loaded.
+        :return: the current ScheduleSnapshot (None if there is no data at all)
+        """
+        if self.snapshot is None:
+            with metrics.timed("cache_load"):
+                self.snapshot = load_snapshot(self.cache_path)
+        return self.snapshot
+
+    def get_snapshot(self):
+        """
+        Gets the snapshot in memory without touching the disk. It is replaced by fetch_schedule,
+        load_cache or the display's ScheduleLoader when the spreadsheet changes.
+        :return: the current ScheduleSnapshot (None if nothing has been loaded yet)
+        """
+        return self.snapshot
+
+    def _parse_workbook(self):
+        """
+        Parses the spreadsheet into plain dictionaries and lists.
+        :return: a tuple of (tutor dictionary, list of day schedules) or None if the file could not be read
+        """
         print("Updating schedule from local file...")
-        self.tutors = {}
-        self.monday_schedule = []
-        self.tuesday_schedule = []
-        self.wednesday_schedule = []
-        self.thursday_schedule = []
-        self.friday_schedule = []
+        tutors = {}
 
         # Read data from the different sheets/sections of the Excel file
         try:
-            self.monday_schedule = pd.read_excel(schedule_file_path, sheet_name='Print Schedule', usecols='B:AC', skiprows=3, nrows=6).values.tolist()
-            self.tuesday_schedule = pd.read_excel(schedule_file_path, sheet_name='Print Schedule', usecols='B:AC', skiprows=12, nrows=6).values.tolist()
-            self.wednesday_schedule = pd.read_excel(schedule_file_path, sheet_name='Print Schedule', usecols='B:AC', skiprows=21, nrows=6).values.tolist()
-            self.thursday_schedule = pd.read_excel(schedule_file_path, sheet_name='Print Schedule', usecols='B:AC', skiprows=30, nrows=6).values.tolist()
-            self.friday_schedule = pd.read_excel(schedule_file_path, sheet_name='Print Schedule', usecols='B:AC', skiprows=39, nrows=6).values.tolist()
-            temp_tutor_schedule = pd.read_excel(schedule_file_path, sheet_name='Schedule', usecols='A:AE', skiprows=10, nrows=200).values.tolist()
-            tutor_info = pd.read_excel(schedule_file_path, sheet_name='Tutor Info', usecols='A:J', nrows=30).values.tolist()
+            schedule_list, temp_tutor_schedule, tutor_info = read_workbook(self.schedule_file_path)
         except Exception as e:
-            print(f"Error reading Excel file '{schedule_file_path}': {e}")
-            return
-
-        schedule_list = [self.monday_schedule, self.tuesday_schedule, self.wednesday_schedule, self.thursday_schedule, self.friday_schedule]
-
-        # --- Data processing logic (unchanged) ---
+            print(f"Error reading Excel file '{self.schedule_file_path}': {e}")
+            return None
 
         # Simplify the schedules to just be when we are open on that day
         for index, schedule in enumerate(schedule_list):
@@ -146,18 +306,18 @@ class ExcelManager:
             tutor_name = row[0]
 
             # Ignore if it is empty
-            if pd.isna(tutor_name): # More reliable check for pandas NaN
+            if _is_empty(tutor_name):
                 continue
 
             for j in range(len(row)):
-                if pd.isna(row[j]):
+                if _is_empty(row[j]):
                     row[j] = ""
 
             # If we have run into a tutor who it has not seen before
-            if tutor_name.lower() not in self.tutors:
+            if tutor_name.lower() not in tutors:
                 # Build an empty tutor and add it to the dictionary of tutors
                 empty_schedule_dict = {'Monday': [], 'Tuesday': [], 'Wednesday': [], 'Thursday': [], 'Friday': []}
-                self.tutors[tutor_name.lower()] = {
+                tutors[tutor_name.lower()] = {
                     'schedule': empty_schedule_dict,
                     "major": "",
                     'profile_image': 'default.png',
@@ -166,123 +326,100 @@ class ExcelManager:
                 }
 
             # Add the schedule and the major to the tutor
-            self.tutors[row[0].lower()]["schedule"][row[1]] = row[3:]
-            self.tutors[row[0].lower()]["major"] = row[2]
+            tutors[row[0].lower()]["schedule"][row[1]] = row[3:]
+            tutors[row[0].lower()]["major"] = row[2]
 
         # Get the information from all the tutors and iterate over it
         for row in tutor_info:
             # Get the name of the tutor
             tutor_name = row[0]
-            if pd.isna(tutor_name):
+            if _is_empty(tutor_name):
                 continue
 
             # Add the academic class to the tutor they belong to
-            if tutor_name.lower() in self.tutors:
-                self.tutors[tutor_name.lower()]['academic_class'] = row[3]
+            if tutor_name.lower() in tutors:
+                tutors[tutor_name.lower()]['academic_class'] = row[3]
 
                 # Update the profile picture if one is specified
-                if not pd.isna(row[9]):
-                    self.tutors[tutor_name.lower()]['profile_image'] = str(row[9]) # Ensure string conversion
+                if not _is_empty(row[9]):
+                    tutors[tutor_name.lower()]['profile_image'] = str(row[9]) # Ensure string conversion
 
-        # --- Cache saving logic ---
-        # Save the tutor dictionary to tutor_data.json
-        with open(tutor_cache_path, 'w') as file:
-            # Update the time that we last updated
-            self.tutors['last_fetch'] = str(datetime.now())
-            json.dump(self.tutors, file, indent=4)
-
-        # Save the schedule dictionary to daily_schedules.json
-        with open(schedule_cache_path, 'w') as file:
-            json.dump(schedule_list, file, indent=4)
+        return tutors, schedule_list
 
     def get_today_schedule(self):
         """
         Gets today's schedule.
         :return: today's schedule list or None if weekend/error.
         """
-        # Make sure that you have an updated schedule (or load from cache)
-        self.fetch_schedule()
+        # Use the schedule in memory (loading it from the cache or the file the first time)
+        snapshot = self.get_snapshot()
 
         # Get the schedule for the specific weekday of today
-        weekday = datetime.today().weekday()
-        if weekday == 0:
-            today_schedule = self.monday_schedule
-        elif weekday == 1:
-            today_schedule = self.tuesday_schedule
-        elif weekday == 2:
-            today_schedule = self.wednesday_schedule
-        elif weekday == 3:
-            today_schedule = self.thursday_schedule
-        elif weekday == 4:
-            today_schedule = self.friday_schedule
-        else:
-            today_schedule = None
+        weekday = clock.now().weekday()
+        if snapshot is None or weekday >= len(snapshot.days):
+            return None
+        today_schedule = snapshot.days[weekday]
 
         # Check if schedule data exists and remove the hidden extra row from the data
-        if today_schedule and len(today_schedule) > 2:
-            schedule_copy = list(today_schedule) # Create copy to avoid modifying class attribute repeatedly
+        schedule_copy = list(today_schedule) # Copy so the caller can reorder the rows
+        if len(schedule_copy) > 2:
             schedule_copy.pop(2)
-            return schedule_copy
-        return today_schedule
+        return schedule_copy
 
+    @metrics.timed("get_on_shift")
     def get_on_shift(self):
         """
         Finds all the tutors who are currently on shift.
-        :return: A list of all the tutors on shift.
+        This is a single lookup in the week timeline that was built when the spreadsheet was read.
+        :return: A tuple of RosterEntry sorted by major and then by when they leave.
         """
-        # Ensure data is loaded
-        self.fetch_schedule()
-
-        # Initialize the return list
-        on_shift = []
-
         # Get the day of the week
-        day_of_week = datetime.now().strftime('%A')
+        weekday = clock.now().weekday()
 
         # Get the index that corresponds to the current time block
         try:
             now_index = self.get_now_index()
         except ValueError: # Handle times outside operating hours if get_now_index raises error
-            return []
+            return ()
 
-        # Loop through all the tutors in the dictionary
-        for tutor_name, tutor_data in self.tutors.items():
-            # Skip metadata keys like 'last_fetch'
-            if "schedule" not in tutor_data:
-                continue
+        return self.get_roster(weekday, now_index)
 
-            # Get the tutor's schedule for the day
-            try:
-                tutors_schedule = tutor_data["schedule"][day_of_week]
-            except KeyError:
-                continue # Tutor might not have schedule data for this day
+    def get_roster(self, weekday, slot):
+        """
+        Gets who is on shift during any slot of the week.
+        :param weekday: the day of the week (0 is Monday)
+        :param slot: the index of the half hour slot (0 is 7:00 AM)
+        :return: A tuple of RosterEntry sorted by major and then by when they leave (empty if nobody is on).
+        """
+        timeline = self.get_timeline()
+        if not (0 <= weekday < len(timeline)) or not (0 <= slot < len(timeline[weekday])):
+            return ()
+        return timeline[weekday][slot]
 
-            # Basic validation of schedule length and index range
-            if not isinstance(tutors_schedule, list) or not (0 <= now_index < len(tutors_schedule)):
-                continue
+    def get_timeline(self):
+        """
+        Gets the roster for every slot of the week.
+        The timeline is rebuilt only when the spreadsheet changes, so it is safe to keep a reference to it.
+        :return: A tuple of weekdays (Monday first), each a tuple of slots, each a tuple of RosterEntry.
+        """
+        # Ensure data is loaded
+        snapshot = self.get_snapshot()
+        if snapshot is None:
+            return ()
+        return snapshot.timeline
 
-            # Check if the tutor is currently on shift based on schedule code
-            if str(tutors_schedule[now_index]).lower() in {"cp", "m", "ce", "el", "b"}:
-                # Find end time: loop until the tutor is not on shift
-                end_index = len(tutors_schedule) # Default to end of schedule length
-                for j in range(now_index + 1, len(tutors_schedule)):
-                    if str(tutors_schedule[j]).lower() not in {"cp", "m", "ce", "el", "b"}:
-                        end_index = j
-                        break
-
-                # Calculate end time string
-                end_schedule_hour = end_index / 2.0 + 7.0 # 7 AM start, 0.5 hour increments
-                hour = int(floor(end_schedule_hour))
-                minute = int((end_schedule_hour - hour) * 60)
-                # Format to 12-hour clock
-                display_hour = hour % 12
-                if display_hour == 0:
-                    display_hour = 12 # Midnight or Noon case
-
-                tutor_data["here_until"] = f"{display_hour}:{minute:02d}"
-                on_shift.append(tutor_data)
-
-        return on_shift
+    def get_transitions(self, weekday):
+        """
+        Gets the times of day at which someone starts or ends a shift.
+        The roster returned by get_roster can only change at these times.
+        :param weekday: the day of the week (0 is Monday)
+        :return: A sorted list of times in minutes after midnight (empty if nobody works that day).
+        """
+        snapshot = self.get_snapshot()
+        if snapshot is None or not (0 <= weekday < len(snapshot.shifts)):
+            return []
+        shifts = snapshot.shifts[weekday]
+        return sorted({shift.start for shift in shifts} | {shift.end for shift in shifts})
 
     @staticmethod
     def get_now_index():
@@ -292,7 +429,7 @@ class ExcelManager:
         :return: The index corresponding to the current time.
         :raises ValueError: If time is outside common schedule range (e.g., before 7 AM).
         """
-        now = datetime.now()
+        now = clock.now()
 
         # Convert the current time to a fractional hour (e.g., 9:15 -> 9.25, 9:30 -> 9.5)
         # Round down to nearest half hour slot for index calculation
@@ -333,6 +470,15 @@ if __name__ == "__main__":
     on_shift_tutors = em.get_on_shift()
     if on_shift_tutors:
         for tutor in on_shift_tutors:
-            print(f"{tutor['name']} (Major: {tutor['major']}) - Here until: {tutor['here_until']}")
+            print(f"{tutor.name} (Major: {tutor.major}) - Here until: {format_time(tutor.here_until)}")
+    else:
+        print("No tutors currently on shift.")
+
+    print("\n--- Tutors Per Major Today ---")
+    weekday = clock.now().weekday()
+    if em.snapshot is not None and weekday < len(WEEKDAYS):
+        counts = em.snapshot.tensor.major_counts(weekday)
+        for major, row in zip(MAJORS, counts.tolist()):
+            print(f"{major:>5}: {' '.join(str(count) for count in row)}")
     else:
-        print("No tutors currently on shift.")
\ No newline at end of file
+        print("No schedule available for today.")
\ No newline at end of file
@@ -0,0 +1,57 @@
+#import modules
+from PySide6.QtGui import QFont, QFontDatabase
+
+# the font files the display uses, by the name the rest of the code refers to them with
+FONT_FILES = {
+    "regular": "Fonts/BRLNSR.TTF",
+    "bold": "Fonts/BRLNSB.TTF",
+}
+
+# the family name of every font file that has been registered, filled in by load_fonts
+_families = {}
+
+# every QFont handed out so far, keyed by (family, size, weight)
+_fonts = {}
+
+def load_fonts():
+    """
+    registers every font in FONT_FILES with Qt. each file is only read once per process,
+    so calling this again does nothing. a QApplication has to exist first
+    """
+    for name, path in FONT_FILES.items():
+        if name in _families:
+            continue
+
+        font_id = QFontDatabase.addApplicationFont(path)
+        if font_id < 0:
+            print(f"Error loading font {path}")
+            families = []
+        else:
+            families = QFontDatabase.applicationFontFamilies(font_id)
+
+        # fall back to the default family so a missing font file does not crash the display
+        _families[name] = families[0] if families else QFont().family()
+
+def get_font(name, size, weight=QFont.Weight.Normal):
+    """
+    gets a font from the registry, building it the first time it is asked for
+    :param name: the name of the font in FONT_FILES ("regular" or "bold")
+    :param size: the point size of the font
+    :param weight: the weight of the font
+    :return: the QFont
+    """
+    if name not in _families:
+        load_fonts()
+
+    key = (_families[name], int(size), weight)
+    font = _fonts.get(key)
+    if font is None:
+        font = QFont(key[0], key[1], weight)
+        _fonts[key] = font
+    return font
+
+def registered_font_count():
+    """
+    :return: how many font files have been registered with Qt, used to check the registry is not growing
+    """
+    return len(_families)
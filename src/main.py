@@ -1,39 +1,113 @@
 # import modules
-from PySide6.QtGui import QGuiApplication, QFontDatabase, QFont
+# startup is imported first so it can time everything after it
+import startup
+from PySide6.QtGui import QGuiApplication
 from PySide6.QtWidgets import QApplication, QMainWindow, QGridLayout, QStackedWidget, QWidget, QVBoxLayout, QLabel, \
     QHBoxLayout
-from PySide6.QtCore import QTime, QTimer, QSize, Qt
-from numpy.ma.core import floor
+from PySide6.QtCore import QObject, QEvent, QTimer, QSize, Qt, QThreadPool, Signal
+import math
 import sys
-from socket import socket,  AF_INET, SOCK_STREAM, error
-import uuid
+import time
+from datetime import timedelta
+from functools import partial
 
 # import custom modules
-from excel import ExcelManager
+from excel import format_time
+from snapshot import RosterEntry
+from center import Center
+import clock
 import custom_widgets
+import fonts
+import memory
+import metrics
+import network
+import portraits
+import style
+from preprocess_images import preprocess_images
+from watcher import FileWatcher
+from worker import WorkerSignal
 from constants import *
 
+startup.mark("imports done")
+
 class MainWindow(QMainWindow):
     """
     The main window of the program
 
     Methods:
-        __init__(self)
-            formats the screen, parses the tutor_data.json file, and adds all the tutor widgets.
+        __init__(self, center=None, screen=None, network_monitor=None)
+            formats the screen, loads the schedule, and adds all the tutor widgets.
+
+        update_ui(self)
+            brings the display up to date, only touching the widgets that changed
+
+        build_ui(self)
+            rebuilds the whole page when the schedule itself changes
+
+        show_snapshot(self, snapshot)
+            shows the snapshot the center switched to
+
+        refresh_pictures(self)
+            shows the new pictures once they have been preprocessed
+
+        release_page_widgets(self)
+            gives every card on the current page back to its pool
+
+        release_tutor_list_widget(self, widget)
+            gives a widget from the tutor list back to its pool
+
+        update_now_column(self, now_index)
+            moves the dark current-time column of the schedule
+
+        get_tutor_list_items(self, on_shift, now_index)
+            works out what belongs in every spot of the tutor list
+
+        update_tutor_list(self, tutor_items)
+            changes only the spots of the tutor list that are different from what is on screen
+
+        get_next_change(self, now)
+            works out the next time anything on screen changes
+
+        schedule_next_update(self)
+            arms the update timer for the next time anything on screen changes
+
+        update_data(self)
+            updates the display when the update timer fires
+
+        check_clock(self)
+            updates the display again if the wall clock jumped
+
+        show_network_status(self, connected)
+            shows a banner while the device is not connected to the internet
+
+        event(self, event)
+            times how long painting the window takes
+
+        paintEvent(self, event)
+            notices the first frame so the startup report can be printed
+
+        on_first_frame(self)
+            prints the startup report
 
         keyPressEvent(self, event)
             is responsible for closing the program when the esc key is pressed
+
+        stop(self)
+            stops the background work of the center and network monitor the window made itself
     """
-    def __init__(self):
+    def __init__(self, center=None, screen=None, network_monitor=None):
         """
         sets up the main screen
+        :param center: the Center to show. a window on its own makes its own from the first entry of CENTERS
+        :param screen: the QScreen to fill (the primary screen if None)
+        :param network_monitor: a NetworkMonitor shared with other windows (the window starts its own if None)
         """
         super().__init__()
 
         # define constants
-        self.screen_size = QGuiApplication.primaryScreen().size()
+        self.display_screen = screen or QGuiApplication.primaryScreen()
+        self.screen_size = self.display_screen.size()
         self.spacing = 20
-        self.corner_radius = 30
 
         # make the main layout a stack so that we can swap between updates
         self.stacked_widget = QStackedWidget(self)
@@ -46,47 +120,57 @@ class MainWindow(QMainWindow):
         self.stacked_widget.addWidget(self.active_widget)
         self.stacked_widget.addWidget(self.hidden_widget)
 
-        try:
-            test = socket(AF_INET, SOCK_STREAM)
-            test.settimeout(3)
-            test.connect(("8.8.8.8", 53))
-            test.close()
-
-            print('Connected to the internet')
-        except error:
-            mac = ':'.join(f'{(uuid.getnode() >> i) & 0xFF:02x}' for i in range(0, 48, 8)[::-1])
-            print(f'\nNot connected to the internet. Please check the ethernet cord or re-register the device at netreg.usu.edu using mac address {mac}. Press enter to acknowledge')
-            input()
-            print('quitting')
-            sys.exit(0)
-
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
         print("getting pictures")
         # update the pictures
         print("updateing schedule")
-        # update the schedules
-        self.em = ExcelManager()
-        self.schedule = self.em.get_today_schedule()
-        
-        # manually put them in rainbow order
-        self.schedule[1], self.schedule[2], self.schedule[3], self.schedule[4] = self.schedule[4], self.schedule[3], self.schedule[1], self.schedule[2]
-
-        # define the timer for auto updating
+        # update the schedules. windows showing the same center share its snapshot instead of parsing it again
+        self.owns_center = center is None
+        self.center = center or Center(**CENTERS[0], parent=self)
+        self.em = self.center.em
+        # noinspection PyUnresolvedReferences
+        self.center.snapshot_changed.connect(self.show_snapshot)
+
+        # what is currently on screen so that update_ui only touches what changed
+        self.schedule = None
+        self.displayed_snapshot = None
+        self.displayed_weekday = None
+        self.displayed_now_index = None
+        self.displayed_tutor_items = [None] * TUTOR_LIST_HEIGHT
+        self.tutor_list_widgets = [None] * TUTOR_LIST_HEIGHT
+        self.schedule_grid = None
+        self.tutor_list_layout = None
+
+        # pools so that cards are reused instead of being built again every update
+        self.tutor_card_pool = custom_widgets.WidgetPool(custom_widgets.TutorCard, TUTOR_LIST_HEIGHT)
+        self.will_return_pool = custom_widgets.WidgetPool(custom_widgets.WillReturn, len(MAJORS))
+
+        # set up the main screen. this only has to happen once
+        self.setWindowTitle("Tutor Center")
+
+        # the whole application uses one style sheet. setting it again would re-polish every widget so it only happens once
+        app = QApplication.instance()
+        if app.styleSheet() != style.APP_STYLESHEET:
+            app.setStyleSheet(style.APP_STYLESHEET)
+
+        # one timer armed for the next time anything on screen changes (see schedule_next_update)
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        # noinspection PyUnresolvedReferences
+        self.timer.timeout.connect(self.update_data)
+        self.next_update = None
+
+        # QTimer counts on a clock that ignores changes to the wall clock, so check for jumps separately
+        self.clock_offset = clock.timestamp() - time.monotonic()
+        self.clock_timer = QTimer(self)
+        self.clock_timer.setInterval(CLOCK_CHECK_MS)
         # noinspection PyUnresolvedReferences
-        self.timer.timeout.connect(self.update_ui)
+        self.clock_timer.timeout.connect(self.check_clock)
+        self.clock_timer.start()
         print("defining fonts")
-        # define the bold font
-        bold_font_id = QFontDatabase.addApplicationFont("Fonts/BRLNSB.TTF")
-        if bold_font_id < 0:
-            print("Error loading font")
-        self.bold_families = QFontDatabase.applicationFontFamilies(bold_font_id)
-
-        # define the normal font
-        font_id = QFontDatabase.addApplicationFont("Fonts/BRLNSR.TTF")
-        if font_id < 0:
-            print("Error loading font")
-        self.families = QFontDatabase.applicationFontFamilies(font_id)
+        # register the fonts once for the whole program
+        fonts.load_fonts()
         print("update_ui")
         # build the layout
         self.update_ui()
@@ -95,31 +179,98 @@ class MainWindow(QMainWindow):
         self.schedule_next_update()
         print("showing")
         # show the screen
+        self.setScreen(self.display_screen)
+        self.setGeometry(self.display_screen.geometry())
         self.showFullScreen()
 
+        # make sure the cache matches the spreadsheet, parsing it in the background if it does not.
+        # a shared center is loaded by whoever made it
+        if self.owns_center:
+            self.center.load()
+
+        # check the internet connection in the background and show a banner while it is down
+        self.network_banner = QLabel(self)
+        self.network_banner.setObjectName("networkBanner")
+        self.network_banner.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.network_banner.setWordWrap(True)
+        self.network_banner.setFont(fonts.get_font("bold", 24))
+        self.network_banner.hide()
+        self.owns_network_monitor = network_monitor is None
+        self.network_monitor = network_monitor or network.NetworkMonitor(parent=self)
+        # noinspection PyUnresolvedReferences
+        self.network_monitor.status_changed.connect(self.show_network_status)
+        if self.owns_network_monitor:
+            self.network_monitor.start()
+        elif network_monitor.connected is False:
+            # the shared monitor already knows the network is down
+            self.show_network_status(False)
+
+        # a window on its own stops what it made itself before the program exits
+        if self.owns_center or self.owns_network_monitor:
+            # noinspection PyUnresolvedReferences
+            QApplication.instance().aboutToQuit.connect(self.stop)
+
+        startup.mark("window built")
+
+        # the first paint of the window is reported once it has finished (see paintEvent)
+        self.first_frame_drawn = False
+
+    @metrics.timed("update_ui")
     def update_ui(self):
         """
-        defines the layout of the display and fills it in with the data fetched from the spreadsheet
-        :return:
+        brings the display up to date. the whole page is only rebuilt when the schedule itself changes,
+        otherwise only the tutor cards that changed and the dark current-time column are touched
         """
+        # rebuild the page if there is a new schedule or it is a new day. the center keeps the snapshot current
+        snapshot = self.em.get_snapshot()
+        weekday = clock.now().weekday()
+        if snapshot is not self.displayed_snapshot or weekday != self.displayed_weekday:
+            schedule = self.em.get_today_schedule()
+
+            # on days without a schedule (or before anything has been loaded) keep showing the last one we had
+            if schedule is not None:
+                # manually put them in rainbow order
+                schedule[1], schedule[2], schedule[3], schedule[4] = schedule[4], schedule[3], schedule[1], schedule[2]
+                self.schedule = schedule
+                self.build_ui()
+
+            self.displayed_snapshot = snapshot
+            self.displayed_weekday = weekday
+
+        # nothing to show until the first schedule has been loaded
+        if self.schedule is None:
+            return
 
-        # set up the main screen
-        self.setWindowTitle("Tutor Center")
-        self.setStyleSheet(f"background-color: {BACK_BLUE}")
+        # get the index of the current time so that it can be darkened
+        try:
+            now_index = self.em.get_now_index()
+        except ValueError:
+            now_index = -1
 
-        # clear out the old main widget so that we can rebuild it
-        if self.hidden_widget.layout():
-            old_layout = self.hidden_widget.layout()
+        # move the dark column if the time slot changed
+        if now_index != self.displayed_now_index:
+            self.update_now_column(now_index)
 
-            # iterate through all children and mark them for deletion
-            while old_layout.count():
-                item = old_layout.takeAt(0)
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
+        # only touch the tutor list if something in it changed
+        tutor_items = self.get_tutor_list_items(self.em.get_on_shift(), now_index)
+        if tutor_items != self.displayed_tutor_items:
+            self.update_tutor_list(tutor_items)
 
-            # mark the layout for deletion
-            old_layout.deleteLater()
+    @metrics.timed("build_ui")
+    def build_ui(self):
+        """
+        defines the layout of the display and fills in the schedule fetched from the spreadsheet.
+        the tutor list is left empty for update_tutor_list to fill in
+        """
+        # give the cards on the current page back to the pools so the new page can reuse them
+        self.release_page_widgets()
+
+        # throw away the old page so that we can rebuild it. it is taken out of the stack as well, so the
+        # stack never holds more than the page on screen and the one being built
+        if self.hidden_widget.layout():
+            self.stacked_widget.removeWidget(self.hidden_widget)
+            # everything on the page goes with it. the pooled cards were taken off it when they were released
+            self.hidden_widget.deleteLater()
 
             # add a fresh widget
             self.hidden_widget = QWidget()
@@ -131,11 +282,11 @@ class MainWindow(QMainWindow):
         top_layout.setContentsMargins(0, 0, 0, 0)
 
         # create the title
-        title = QLabel("Welcome to The Engineering Tutor Center")
+        title = QLabel(self.center.title)
         title.setFixedSize(QSize(self.screen_size.width(), int(self.screen_size.width() * 0.06)))
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet(f"background-color: {TITLE_TEAL}; font-weight: 700; color: white")
-        title.setFont(QFont(self.bold_families[0], 60))
+        title.setObjectName("title")
+        title.setFont(fonts.get_font("bold", 60))
         top_layout.addWidget(title)
 
         # set up the base widget
@@ -152,7 +303,7 @@ class MainWindow(QMainWindow):
         # define the widget for the list of all the tutors
         tutor_list_widget = QWidget()
         tutor_list_widget.setFixedSize(QSize(int(self.screen_size.width() * 0.61), base_widget.size().height() - 2 * self.spacing))
-        tutor_list_widget.setStyleSheet(f"background-color: white; border-radius: {self.corner_radius}")
+        tutor_list_widget.setObjectName("tutorList")
         base_layout.addWidget(tutor_list_widget)
 
         # define the widget for the right side
@@ -167,14 +318,12 @@ class MainWindow(QMainWindow):
 
         # add the call to sign in and the description
         sign_in_widget = QLabel("Please Sign In!")
-        sign_in_widget.setStyleSheet("color: black")
         sign_in_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        sign_in_widget.setFont(QFont(self.families[0], 50))
+        sign_in_widget.setFont(fonts.get_font("regular", 50))
         sign_in_widget.setFixedHeight(80)
         description_widget = QLabel("Tutors are wearing colored\nlanyards according to the colors\nin the schedule below")
-        description_widget.setStyleSheet("color: black")
         description_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        description_widget.setFont(QFont(self.families[0], 30))
+        description_widget.setFont(fonts.get_font("regular", 30))
         right_section_layout.addWidget(sign_in_widget)
         right_section_layout.addWidget(description_widget)
 
@@ -182,237 +331,299 @@ class MainWindow(QMainWindow):
         schedule_title_widget = QLabel("Today's Schedule")
         schedule_title_widget.setFixedHeight(int(self.screen_size.width() * 0.039))
         schedule_title_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        schedule_title_widget.setStyleSheet(
-            f"background-color: {TITLE_TEAL}; "
-            f"border-top-left-radius: {self.corner_radius}; "
-            f"border-top-right-radius: {self.corner_radius}; "
-            f"font-weight: 700;"
-            f"color: white"
-        )
-        schedule_title_widget.setFont(QFont(self.families[0], 35))
+        schedule_title_widget.setObjectName("scheduleTitle")
+        schedule_title_widget.setFont(fonts.get_font("regular", 35))
         right_section_layout.addWidget(schedule_title_widget)
 
-        # define the schedule widget
-        schedule_widget = QWidget()
-        schedule_widget.setFixedHeight(int(self.screen_size.width() * 0.321))
-        schedule_widget.setStyleSheet(
-            f"background-color: white; "
-            f"border-bottom-right-radius: {self.corner_radius}; "
-            f"border-bottom-left-radius: {self.corner_radius}"
-        )
-        right_section_layout.addWidget(schedule_widget)
-
-        # define the layout for the schedule itself
-        schedule_layout = QGridLayout()
-        schedule_widget.setLayout(schedule_layout)
-        schedule_layout.setSpacing(0)
-        schedule_layout.setContentsMargins(0, 0, 0, 0)
-
-        # get the index of the current time so that it can be darkened
-        now_index = self.em.get_now_index()
-
-        while schedule_layout.count():
-            item = schedule_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
-
-        start_index = 28
-        end_index = 0
-
-        for i, value in enumerate(self.schedule[0]):
-            if value.lower() != "c" and i < start_index:
-                start_index = i
-            elif value.lower() != "c" and i > end_index:
-                end_index = i
-
-        # loop through all the cells and add them
-        for row in range(5):
-            for col in range(len(self.schedule[0])):
-                if col < start_index or col > end_index:
-                    continue
-
-                schedule_layout.addWidget(
-                    custom_widgets.ScheduleCell(
-                        self.schedule[row][col], # the letter at the cell in the spreadsheet
-                        row, # the current row for formatting
-                        col, # the current col for formatting
-                        col == now_index, # if this cell is for the current time slot and therefore needs to be dark
-                        start_index,
-                        end_index
-                    ),
-                    row + 3, # offset the position to account for labels and spacing
-                    col + 3 # offset the position to account for labels and spacing
-                )
-
-        cell_width = int(schedule_widget.width() / (end_index - start_index - 1))
-
-        # define spacers to make the layout look good and add them
-        spacer = QLabel()
-        spacer.setFixedSize(QSize(cell_width, self.spacing))
-        spacer.setStyleSheet("background-color: transparent")
-        spacer2 = QLabel()
-        spacer2.setFixedSize(QSize(cell_width, self.spacing))
-        spacer2.setStyleSheet("background-color: transparent")
-        spacer3 = QLabel()
-        spacer3.setFixedSize(QSize(cell_width, self.spacing))
-        spacer3.setStyleSheet("background-color: transparent")
-
-        schedule_layout.addWidget(spacer, 8, len(self.schedule[0]) + 3)
-        schedule_layout.addWidget(spacer2, 1, 1)
-        schedule_layout.addWidget(spacer3, 1, 2)
-
-        # add the labels for the majors
-        for i, major in enumerate(MAJORS):
-            temp = QLabel(major)
-            temp.setStyleSheet("color: black")
-            temp.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            temp.setFont(QFont(self.families[0], 18))
-            schedule_layout.addWidget(temp, i + 3, 1, 1, 2) # offset and spans multiple cols to make it look good
-
-        # add the hour labels
-        for i in range(15):
-            label_text = f"{(i + 6) % 12 + 1}:00"
-            if i * 2 < start_index or i * 2 > end_index + 1:
-                continue
-
-            temp = QLabel(label_text)
-            temp.setStyleSheet("color: black")
-            temp.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            temp.setFixedHeight(30)
-            temp.setFont(QFont(self.families[0], 15))
-
-            #the first and last label are a little different so take care of them
-            if i * 2 == start_index:
-                schedule_layout.addWidget(temp, 2, 2, 1, start_index+2) # FIXME I have been having problems with this line. If the time changes you should check this out
-            elif i * 2 == end_index + 1:
-                schedule_layout.addWidget(temp, 2, i * 2 + 2, 1, 40)  # spanning 40 columns seems like a good way to make sure it spans to the end
-            else:
-                schedule_layout.addWidget(temp, 2, i * 2 + 2, 1, 2) # offset and spans multiple cols to make it look good
+        # define the schedule widget. the whole grid is painted by this one widget
+        self.schedule_grid = custom_widgets.ScheduleGrid(self.schedule, self.displayed_now_index, self.spacing)
+        self.schedule_grid.setFixedHeight(int(self.screen_size.width() * 0.321))
+        right_section_layout.addWidget(self.schedule_grid)
 
         # define the layout of the tutor list
         tutor_list_layout = QGridLayout()
         tutor_list_layout.setSpacing(self.spacing)
         tutor_list_layout.setContentsMargins(self.spacing, self.spacing, self.spacing, self.spacing)
         tutor_list_widget.setLayout(tutor_list_layout)
+        self.tutor_list_layout = tutor_list_layout
+
+        # the new tutor list is empty so everything has to be added again
+        self.displayed_tutor_items = [None] * TUTOR_LIST_HEIGHT
+        self.tutor_list_widgets = [None] * TUTOR_LIST_HEIGHT
+
+        # swap the active and the hidden widget now that the hidden widget has been created
+        self.stacked_widget.setCurrentWidget(self.hidden_widget)
+        self.active_widget, self.hidden_widget = self.hidden_widget, self.active_widget
+
+    def show_snapshot(self, snapshot):
+        """
+        shows the snapshot the center switched to. until this runs the old one stays on screen
+        :param snapshot: the new ScheduleSnapshot
+        """
+        self.update_ui()
+
+        # the shifts may have moved
+        self.schedule_next_update()
 
-        def parse_time(time_str):
-            """Convert hh:mm string to a comparable 24-hour format"""
-            hours, minutes = map(int, time_str.split(":"))
-            if hours < 9:  # Assume PM if hour is less than 9
-                hours += 12
-            return hours * 60 + minutes  # Convert to total minutes for easy sorting
+    def refresh_pictures(self):
+        """
+        shows the new pictures once they have been preprocessed by rebuilding the page
+        """
+        self.displayed_snapshot = None
+        self.update_ui()
+
+    def release_page_widgets(self):
+        """
+        gives every card on the current page back to its pool
+        """
+        for widget in self.tutor_list_widgets:
+            if widget is not None:
+                self.release_tutor_list_widget(widget)
+        self.tutor_list_widgets = [None] * TUTOR_LIST_HEIGHT
+        self.displayed_tutor_items = [None] * TUTOR_LIST_HEIGHT
+
+    def release_tutor_list_widget(self, widget):
+        """
+        gives a widget from the tutor list back to its pool, or deletes it if it is just a filler
+        :param widget: the widget to get rid of
+        """
+        if isinstance(widget, custom_widgets.TutorCard):
+            self.tutor_card_pool.release(widget)
+        elif isinstance(widget, custom_widgets.WillReturn):
+            self.will_return_pool.release(widget)
+        else:
+            self.tutor_list_layout.removeWidget(widget)
+            widget.deleteLater()
 
-        def sort_key(entry):
-            """Sorting key function that sorts by major and then by converted time"""
-            major_rank = MAJOR_ORDER.get(entry["major"], float("inf"))  # Default to last if unknown
-            time_value = parse_time(entry["here_until"])
-            return major_rank, time_value
+    def update_now_column(self, now_index):
+        """
+        moves the dark current-time column of the schedule
+        :param now_index: the index of the current time slot
+        """
+        if self.schedule_grid is not None:
+            self.schedule_grid.set_now_index(now_index)
 
-        # get the tutors on shift and sort them by major then by time that they are leaving
-        on_shift = sorted(self.em.get_on_shift(), key=sort_key)
+        self.displayed_now_index = now_index
 
+    def get_tutor_list_items(self, on_shift, now_index):
+        """
+        works out what belongs in every spot of the tutor list
+        :param on_shift: the tutors on shift, sorted by major then by the time that they are leaving
+        :param now_index: the index of the current time slot
+        :return: a list with one item per spot. a RosterEntry for a tutor, a (major, next_in) tuple for a
+                 "will return" card or None for an empty spot
+        """
         # keep track of what majors have a tutor on shift
         majors_not_on_shift = ["MAE", "ECE", "CMPE", "CEE", "BENG"]
+        for tutor in on_shift[:TUTOR_LIST_HEIGHT]:
+            # remove the major for the list of majors not on shift
+            if tutor.major in majors_not_on_shift:
+                majors_not_on_shift.remove(tutor.major)
+
+        items = []
+        for display_order in range(TUTOR_LIST_HEIGHT):
+            # if we have not already added every tutor
+            if display_order < len(on_shift):
+                items.append(on_shift[display_order])
+                continue
 
-        # loop through every slot in the tutor list
-        for i in range(TUTOR_LIST_HEIGHT//2):
-            for j in range(2):
-                # convert the row and col to a single index
-                display_order = 2 * i + j
-
-                # if we have not already added every tutor
-                if display_order < len(on_shift):
-                    tutor = on_shift[display_order]
-
-                    # add a tutor card to the layout
-                    tutor_list_layout.addWidget(
-                        custom_widgets.TutorCard(
-                            tutor["name"], #the name of the tutor
-                            f"Images/{tutor['profile_image']}", # the path to the image
-                            MAJOR_ABBREVIATIONS[tutor["major"]], # the name of the major
-                            tutor["academic_class"], #softmore, junior, etc
-                            f"Here until {tutor['here_until']}" # when the tutor is leaving
-                        ),
-                        i,
-                        j
-                    )
-
-                    # remove the major for the list of majors not on shift
-                    if tutor["major"] in majors_not_on_shift:
-                        majors_not_on_shift.remove(tutor["major"])
-                # if we have added every tutor
-                else:
-                    # calculate how many spots wee need to fill
-                    spots_left = TUTOR_LIST_HEIGHT - (i * 2 + j)
-
-                    # add the "major will be back" cards to the very end
-                    if spots_left <= len(majors_not_on_shift):
-                        # get the major to add
-                        current_major = MAJOR_ABBREVIATIONS[majors_not_on_shift[spots_left - 1]]
-
-                        # get the schedule for the specific major
-                        match current_major:
-                            case "Biological Engineer":
-                                major_schedule = self.schedule[4]
-                            case "Civil Engineer":
-                                major_schedule = self.schedule[3]
-                            case "Electrical Engineer":
-                                major_schedule = self.schedule[2]
-                            case "Computer Engineer":
-                                major_schedule = self.schedule[1]
-                            case "Mechanical Engineer":
-                                major_schedule = self.schedule[0]
-                            case _:
-                                major_schedule = []
-
-                        # find when the major will be back next
-                        for block in range(now_index + 1, len(major_schedule)):
-                            # if the current cell indicates that a tutor is in
-                            if major_schedule[block].lower() in {"ma", "ce", "b", "el", "cp"}:
-                                #calculate when the major will be in next and then break the loop
-                                end_schedule = block / 2 + 9
-                                next_in = f"at {int(floor(end_schedule - 1) % 12 + 1)}:{int((end_schedule - floor(end_schedule)) * 60):02d}"
-                                break
-                        # if it did not find a time when a tutor will be in then they must be coming in tomorrow
-                        else:
-                            next_in = "Tomorrow"
-
-                        # add the widget
-                        tutor_list_layout.addWidget(custom_widgets.WillReturn(current_major, next_in))
-                    else:
-                        # add a fake widget
-                        tutor_list_layout.addWidget(QWidget(), i, j)
+            # calculate how many spots wee need to fill
+            spots_left = TUTOR_LIST_HEIGHT - display_order
 
-        # swap the active and the hidden widget now that the hidden widget has been created
-        self.stacked_widget.setCurrentWidget(self.hidden_widget)
-        self.active_widget, self.hidden_widget = self.hidden_widget, self.active_widget
+            # add the "major will be back" cards to the very end
+            if spots_left > len(majors_not_on_shift):
+                items.append(None)
+                continue
 
-    def schedule_next_update(self):
-        """Calculates time until the next half-hour and sets the update timer."""
+            # get the major to add
+            current_major = MAJOR_ABBREVIATIONS[majors_not_on_shift[spots_left - 1]]
+
+            # get the schedule for the specific major
+            match current_major:
+                case "Biological Engineer":
+                    major_schedule = self.schedule[4]
+                case "Civil Engineer":
+                    major_schedule = self.schedule[3]
+                case "Electrical Engineer":
+                    major_schedule = self.schedule[2]
+                case "Computer Engineer":
+                    major_schedule = self.schedule[1]
+                case "Mechanical Engineer":
+                    major_schedule = self.schedule[0]
+                case _:
+                    major_schedule = []
+
+            # find when the major will be back next
+            for block in range(now_index + 1, len(major_schedule)):
+                # if the current cell indicates that a tutor is in
+                if major_schedule[block].lower() in {"ma", "ce", "b", "el", "cp"}:
+                    #calculate when the major will be in next and then break the loop
+                    next_in = f"at {format_time(SCHEDULE_START_MINUTE + block * SLOT_MINUTES)}"
+                    break
+            # if it did not find a time when a tutor will be in then they must be coming in tomorrow
+            else:
+                next_in = "Tomorrow"
 
-        #parse the current time
-        now = QTime.currentTime()
-        minutes_past_hour = now.minute()
-        seconds_past_minute = now.second()
+            items.append((current_major, next_in))
 
-        # find next update time (either :00 or :30)
-        if minutes_past_hour < 30:
-            minutes_until_next = 30 - minutes_past_hour
-        else:
-            minutes_until_next = 60 - minutes_past_hour
+        return items
+
+    def update_tutor_list(self, tutor_items):
+        """
+        changes only the spots of the tutor list that are different from what is on screen.
+        cards that just moved to a different spot are reused as they are and the rest come from the pools
+        :param tutor_items: what belongs in every spot, from get_tutor_list_items
+        """
+        # remember the widgets that are on screen so that moved cards can be reused
+        reusable = {}
+        for item, widget in zip(self.displayed_tutor_items, self.tutor_list_widgets):
+            if widget is not None:
+                reusable.setdefault(item, []).append(widget)
+
+        # keep every widget that is still showing the right thing
+        new_widgets = [reusable[item].pop(0) if reusable.get(item) else None for item in tutor_items]
+        in_place = [widget is not None and widget is old for widget, old in zip(new_widgets, self.tutor_list_widgets)]
+
+        # take out every widget that is leaving its spot before putting anything new in
+        for display_order, widget in enumerate(self.tutor_list_widgets):
+            if widget is not None and not in_place[display_order]:
+                self.tutor_list_layout.removeWidget(widget)
+
+        # give the cards that are no longer needed back to the pools so the new ones can use them
+        for widgets in reusable.values():
+            for widget in widgets:
+                self.release_tutor_list_widget(widget)
+
+        # fill in the rest of the spots
+        for display_order, item in enumerate(tutor_items):
+            if new_widgets[display_order] is not None:
+                continue
+
+            if item is None:
+                # add a fake widget
+                new_widgets[display_order] = QWidget()
+            elif isinstance(item, RosterEntry):
+                new_widgets[display_order] = self.tutor_card_pool.acquire(
+                    item.name, #the name of the tutor
+                    portraits.portrait_path(item.profile_image), # the path to the small copy of the image
+                    MAJOR_ABBREVIATIONS[item.major], # the name of the major
+                    item.academic_class, #softmore, junior, etc
+                    f"Here until {format_time(item.here_until)}" # when the tutor is leaving
+                )
+            else:
+                new_widgets[display_order] = self.will_return_pool.acquire(*item)
+
+        # put the widgets that changed into their spots. pooled widgets were hidden when they were released
+        for display_order, widget in enumerate(new_widgets):
+            if not in_place[display_order]:
+                self.tutor_list_layout.addWidget(widget, display_order // 2, display_order % 2)
+                widget.show()
 
-        seconds_until_next = (minutes_until_next * 60) - seconds_past_minute
-        seconds_until_next = 5
+        self.displayed_tutor_items = list(tutor_items)
+        self.tutor_list_widgets = new_widgets
 
-        # schedule the update
-        QTimer.singleShot(seconds_until_next * 1000, self.update_data)
+    def get_next_change(self, now):
+        """
+        works out the next time anything on screen changes: someone starting or ending a shift, the dark
+        column moving across the schedule (which includes opening and closing) or a new day starting.
+        changes to the files are handled by the file watcher
+        :param now: the current local time
+        :return: the local time of the next change
+        """
+        minute = now.hour * 60 + now.minute
+        changes = set(self.em.get_transitions(now.weekday()))
+        if self.schedule_grid is not None:
+            changes.update(self.schedule_grid.change_minutes())
+        changes.add(24 * 60) # midnight
+
+        next_minute = min(change for change in changes if change > minute)
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return midnight + timedelta(minutes=next_minute)
+
+    def schedule_next_update(self):
+        """
+        arms the update timer for the next time anything on screen changes. the wait is worked out from
+        timestamps of the display's clock so the change to or from daylight saving time is accounted for,
+        and a replayed clock does not make the timer fire straight away
+        """
+        next_change = self.get_next_change(clock.now())
+        # timestamp() treats the naive local time with the UTC offset in effect on that day
+        self.next_update = next_change.timestamp()
+        self.timer.start(max(0, math.ceil((self.next_update - clock.timestamp()) * 1000)))
 
     def update_data(self):
-        """Updates the UI and switches to a 30-minute repeating update."""
+        """
+        updates the display when the update timer fires and arms it for the next change
+        """
+        # timers can fire a little early, so wait out the rest rather than updating one slot too soon
+        remaining = self.next_update - clock.timestamp()
+        if remaining > 0:
+            self.timer.start(math.ceil(remaining * 1000))
+            return
+
         self.update_ui()
         self.schedule_next_update()
 
+    def check_clock(self):
+        """
+        updates the display again if the wall clock jumped, since the update timer would then fire at the wrong time
+        """
+        offset = clock.timestamp() - time.monotonic()
+        jump = offset - self.clock_offset
+        self.clock_offset = offset
+        if abs(jump) > CLOCK_JUMP_TOLERANCE_S:
+            print(f"The clock jumped by {jump:.0f}s, updating the display")
+            self.update_ui()
+            self.schedule_next_update()
+
+    def show_network_status(self, connected):
+        """
+        shows a banner along the bottom of the screen while the device is not connected to the internet
+        :param connected: True if the last network check worked
+        """
+        if connected:
+            self.network_banner.hide()
+            return
+
+        self.network_banner.setText(
+            "Not connected to the internet. Please check the ethernet cord or re-register the device "
+            f"at netreg.usu.edu using MAC address {network.mac_address()}"
+        )
+        height = int(self.screen_size.height() * 0.08)
+        self.network_banner.setGeometry(0, self.screen_size.height() - height, self.screen_size.width(), height)
+        self.network_banner.raise_()
+        self.network_banner.show()
+
+    def event(self, event):
+        """
+        times how long painting the window takes. every widget that changed is painted while the window
+        handles one update request, so this is the paint that follows update_ui
+        :param event: the event to handle
+        :return: True if the event was handled
+        """
+        if event.type() != QEvent.Type.UpdateRequest:
+            return super().event(event)
+        with metrics.timed("paint"):
+            return super().event(event)
+
+    def paintEvent(self, event):
+        """
+        notices the first frame so the startup report can be printed once it is on screen
+        :param event: the paint event
+        """
+        super().paintEvent(event)
+        if not self.first_frame_drawn:
+            self.first_frame_drawn = True
+            # runs after the rest of the window has been painted
+            QTimer.singleShot(0, self.on_first_frame)
+
+    def on_first_frame(self):
+        """
+        prints the startup report. benchmarks/bench_startup.py passes --exit-after-first-frame to stop here
+        """
+        # with several screens only the first window to be drawn reports
+        if startup.first_frame() and "--exit-after-first-frame" in sys.argv:
+            QApplication.instance().quit()
 
     def keyPressEvent(self, event):
         """
@@ -424,8 +635,195 @@ class MainWindow(QMainWindow):
         if event.key() == Qt.Key.Key_Escape:
             self.close()
 
+    def stop(self):
+        """
+        stops the background work of the center and network monitor the window made itself, so none of it
+        is still running when the window is deleted. shared ones are stopped by whoever made them
+        """
+        if self.owns_center:
+            self.center.stop()
+        if self.owns_network_monitor:
+            self.network_monitor.stop()
+
+def preprocess_pictures(result):
+    """
+    runs preprocess_images on a pool thread and tells the display when it is done
+    :param result: the WorkerSignal that tells the display
+    """
+    try:
+        counts = preprocess_images()
+        print("preprocessed pictures: " + ", ".join(f"{count} {name}" for name, count in counts.items()))
+    except Exception as e:
+        print(f"Error preprocessing pictures: {e}")
+    finally:
+        # the display waits for this on quit, so it is sent whatever happened. the signal is queued so
+        # refresh_pictures runs on the GUI thread
+        result.emit()
+
+class TutorDisplay(QObject):
+    """
+    runs the display on one screen or on every attached screen. each center's spreadsheet is parsed once
+    and the windows showing it share the snapshot; the fonts, the portrait cache, the network check, the
+    memory log, the metrics endpoint and the pictures are shared by every window
+
+    Signals:
+        pictures_ready
+            emitted from the background thread once new pictures have been preprocessed
+
+    Methods:
+        __init__(self, all_screens=False, centers=CENTERS)
+            loads every center and opens a window on each screen
+
+        add_screen(self, screen)
+            opens a window on a screen, taking turns between the centers
+
+        remove_screen(self, screen)
+            closes the window of a screen that was unplugged
+
+        cache_stats(self)
+            counts the hits and misses of the widget pools and the portrait cache
+
+        reload_images(self)
+            makes small copies of the new pictures in the background
+
+        refresh_pictures(self)
+            shows the new pictures on every window once they have been preprocessed
+
+        stop(self)
+            stops the background work before the program exits
+    """
+    pictures_ready = Signal()
+
+    def __init__(self, all_screens=False, centers=CENTERS):
+        """
+        loads every center and opens a window on each screen
+        :param all_screens: True to open a window on every attached screen, False for only the primary screen
+        :param centers: the centers to show, in the format of CENTERS
+        """
+        super().__init__()
+        self.centers = [Center(**config, parent=self) for config in centers]
+        self.network_monitor = network.NetworkMonitor(parent=self)
+
+        # the pictures are the same for every center, so one watcher looks after them
+        self.watcher = FileWatcher(images_dir=IMAGES_DIR, parent=self)
+        # noinspection PyUnresolvedReferences
+        self.watcher.images_changed.connect(self.reload_images)
+        # noinspection PyUnresolvedReferences
+        self.pictures_ready.connect(self.refresh_pictures)
+        self.pictures_result = WorkerSignal(self.pictures_ready)
+        # only one run of preprocess_images at a time, since two would write the same manifest and copies
+        self.preprocessing = False
+        self.preprocess_again = False
+
+        # one window per screen, in the order they were opened
+        self.windows = {}
+        app = QApplication.instance()
+        if all_screens:
+            for screen in app.screens():
+                self.add_screen(screen)
+            # noinspection PyUnresolvedReferences
+            app.screenAdded.connect(self.add_screen)
+            # noinspection PyUnresolvedReferences
+            app.screenRemoved.connect(self.remove_screen)
+        else:
+            self.add_screen(app.primaryScreen())
+        # noinspection PyUnresolvedReferences
+        app.aboutToQuit.connect(self.stop)
+
+        # log the memory and how well the pools and the portrait cache work every so often, so a slow leak
+        # is noticed before the device runs out
+        self.memory_monitor = memory.MemoryMonitor(caches=self.cache_stats, parent=self)
+
+        # everything below works in the background once the windows are up
+        self.network_monitor.start()
+        self.memory_monitor.start()
+        self.metrics_server = metrics.start_server()
+        for center in self.centers:
+            center.load()
+
+    def add_screen(self, screen):
+        """
+        opens a window on a screen. the screens take turns between the centers in the order they were attached
+        :param screen: the QScreen to fill
+        """
+        if screen in self.windows:
+            return
+        center = self.centers[len(self.windows) % len(self.centers)]
+        print(f"showing the {center.name} center on {screen.name()}")
+        self.windows[screen] = MainWindow(center, screen, self.network_monitor)
+
+    def remove_screen(self, screen):
+        """
+        closes the window of a screen that was unplugged
+        :param screen: the QScreen that went away
+        """
+        window = self.windows.pop(screen, None)
+        if window is not None:
+            window.close()
+            window.deleteLater()
+
+    def cache_stats(self):
+        """
+        counts the hits and misses of the widget pools of every window and of the shared portrait cache
+        :return: {name: (hits, misses)}
+        """
+        windows = list(self.windows.values())
+        return {
+            "tutor_card_pool": (
+                sum(window.tutor_card_pool.hits for window in windows),
+                sum(window.tutor_card_pool.misses for window in windows),
+            ),
+            "will_return_pool": (
+                sum(window.will_return_pool.hits for window in windows),
+                sum(window.will_return_pool.misses for window in windows),
+            ),
+            "portrait_cache": (portraits.portrait_cache.hits, portraits.portrait_cache.misses),
+        }
+
+    def reload_images(self):
+        """
+        makes small copies of the new pictures in the background so the display keeps running meanwhile.
+        if they are already being made, they are made once more afterwards so no change is missed
+        """
+        if self.pictures_result.closed:
+            return
+        if self.preprocessing:
+            self.preprocess_again = True
+            return
+
+        print(f"{IMAGES_DIR}/ changed, preprocessing pictures")
+        self.preprocessing = True
+        self.pictures_result.start()
+        QThreadPool.globalInstance().start(partial(preprocess_pictures, self.pictures_result))
+
+    def refresh_pictures(self):
+        """
+        shows the new pictures on every window once they have been preprocessed, and preprocesses them
+        again if they changed in the meantime
+        """
+        self.preprocessing = False
+        if self.preprocess_again:
+            self.preprocess_again = False
+            self.reload_images()
+
+        # the pictures that were replaced have a new modification time
+        portraits.portrait_cache.forget_mtimes()
+        for window in self.windows.values():
+            window.refresh_pictures()
+
+    def stop(self):
+        """
+        stops the background work before the program exits, so no worker thread is left to hand its
+        result to a center, the network monitor or the display after they have been deleted
+        """
+        self.network_monitor.stop()
+        self.pictures_result.close()
+        for center in self.centers:
+            center.stop()
+
 # run the program
 if __name__ == "__main__":
         app = QApplication([])
-        window = MainWindow()
+        startup.mark("application created")
+        display = TutorDisplay(all_screens="--all-screens" in sys.argv)
         sys.exit(app.exec())
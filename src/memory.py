@@ -0,0 +1,157 @@
+#import modules
+import os
+import time
+import tracemalloc
+from collections import Counter, deque
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtWidgets import QApplication
+import metrics
+from constants import MEMORY_CHECK_MS, MEMORY_WINDOW_SAMPLES, MEMORY_GROWTH_WARNING_MIB, MEMORY_TOP_CLASSES
+
+def rss_mib():
+    """
+    gets the resident memory of the process
+    :return: the memory in MiB (0 where /proc is not available)
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            pages = int(file.read().split()[1])
+        return round(pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024, 1)
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+def qobject_counts():
+    """
+    counts the live QObjects by class, starting from the application and every top level widget
+    :return: a Counter of class name -> number of objects
+    """
+    app = QApplication.instance()
+    if app is None:
+        return Counter()
+
+    roots = [app] + app.topLevelWidgets()
+    seen = set()
+    counts = Counter()
+    for root in roots:
+        for obj in [root] + root.findChildren(QObject):
+            # a widget is a child of the application's tree and of its own, so count it once
+            key = id(obj)
+            if key in seen:
+                continue
+            seen.add(key)
+            counts[obj.metaObject().className()] += 1
+    return counts
+
+class MemoryMonitor(QObject):
+    """
+    samples the memory of the display every so often and keeps the last day of samples, so a slow leak
+    shows up in ERRORLOG.txt long before the device runs out of memory. each sample has the resident
+    memory, the python heap traced by tracemalloc, the number of live QObjects of every class and how well
+    the widget pools and the portrait cache are working
+
+    Methods:
+        __init__(self, interval_ms=MEMORY_CHECK_MS, window=MEMORY_WINDOW_SAMPLES, caches=None, parent=None)
+            defines the monitor
+
+        start(self)
+            starts tracing the python heap and samples right away and then every interval
+
+        sample(self)
+            takes a sample and logs it
+
+        growth(self)
+            works out how much the memory grew across the window
+    """
+    def __init__(self, interval_ms=MEMORY_CHECK_MS, window=MEMORY_WINDOW_SAMPLES, caches=None, parent=None):
+        """
+        defines the monitor
+        :param interval_ms: how often to take a sample
+        :param window: how many samples to keep
+        :param caches: a function returning {name: (hits, misses)} for every pool and cache to report (None for none)
+        :param parent: the QObject that owns the monitor
+        """
+        super().__init__(parent)
+        self.samples = deque(maxlen=window)
+        self.caches = caches
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        # noinspection PyUnresolvedReferences
+        self.timer.timeout.connect(self.sample)
+
+    def start(self):
+        """
+        starts tracing the python heap and samples right away and then every interval
+        """
+        # one frame per allocation is enough to count the heap and keeps the overhead low
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(1)
+        self.sample()
+        self.timer.start()
+
+    def sample(self):
+        """
+        takes a sample, logs it and warns if the memory kept growing across the window
+        :return: the sample
+        """
+        heap, heap_peak = tracemalloc.get_traced_memory()
+        counts = qobject_counts()
+        sample = {
+            "time": time.time(),
+            "rss_mib": rss_mib(),
+            "python_heap_mib": round(heap / 1024 / 1024, 1),
+            "python_heap_peak_mib": round(heap_peak / 1024 / 1024, 1),
+            "qobjects": sum(counts.values()),
+            "classes": counts,
+            "caches": self.caches() if self.caches is not None else {},
+        }
+        self.samples.append(sample)
+
+        # the latest sample is also served with the timing histograms
+        metrics.set_value("tutor_display_rss_bytes", int(sample["rss_mib"] * 1024 * 1024), "Resident memory of the display.")
+        metrics.set_value("tutor_display_python_heap_bytes", heap, "Python heap traced by tracemalloc.")
+        metrics.set_value("tutor_display_qobjects", sample["qobjects"], "Live QObjects.")
+        for name, (hits, misses) in sample["caches"].items():
+            metrics.set_value(f"tutor_display_{name}_hits_total", hits, f"Lookups in the {name} that reused something.", "counter")
+            metrics.set_value(f"tutor_display_{name}_misses_total", misses, f"Lookups in the {name} that built something new.", "counter")
+
+        top = ", ".join(f"{name} {count}" for name, count in counts.most_common(MEMORY_TOP_CLASSES))
+        print(
+            f"memory: rss {sample['rss_mib']} MiB, python heap {sample['python_heap_mib']} MiB "
+            f"(peak {sample['python_heap_peak_mib']} MiB), {sample['qobjects']} QObjects ({top})",
+            flush=True
+        )
+        if sample["caches"]:
+            print("caches: " + ", ".join(
+                f"{name} {hits} hits, {misses} misses ({hits / (hits + misses) if hits + misses else 0:.0%})"
+                for name, (hits, misses) in sample["caches"].items()
+            ), flush=True)
+
+        growth = self.growth()
+        if growth is not None and growth["rss_mib"] > MEMORY_GROWTH_WARNING_MIB:
+            grown = ", ".join(f"{name} +{count}" for name, count in growth["classes"].most_common(MEMORY_TOP_CLASSES))
+            print(
+                f"memory warning: rss grew {growth['rss_mib']} MiB and the python heap "
+                f"{growth['python_heap_mib']} MiB in {growth['hours']:.1f} hours. QObjects that grew: {grown or 'none'}",
+                flush=True
+            )
+
+        return sample
+
+    def growth(self):
+        """
+        works out how much the memory grew from the oldest sample in the window to the newest
+        :return: a dictionary with the growth of the rss, the python heap and every class that gained
+                 objects (None until there are two samples)
+        """
+        if len(self.samples) < 2:
+            return None
+
+        first, last = self.samples[0], self.samples[-1]
+        classes = last["classes"] - first["classes"] # Counter subtraction keeps only the classes that grew
+        return {
+            "hours": (last["time"] - first["time"]) / 3600,
+            "rss_mib": round(last["rss_mib"] - first["rss_mib"], 1),
+            "python_heap_mib": round(last["python_heap_mib"] - first["python_heap_mib"], 1),
+            "classes": classes,
+        }
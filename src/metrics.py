@@ -0,0 +1,155 @@
+"""
+records how long each phase of keeping the display up to date takes, as histograms that can be scraped
+in the Prometheus text format from http://127.0.0.1:METRICS_PORT/metrics.
+
+a phase is timed by wrapping it in timed(), either as a with block or as a decorator. recording a time
+is two perf_counter calls and a bisect, so it stays on in production. the count of every histogram is
+also the number of times that phase ran, e.g. how many times the display was updated
+"""
+#import modules
+import bisect
+import contextlib
+import threading
+import time
+from constants import METRICS_HOST, METRICS_PORT, METRICS_BUCKETS_S
+
+# the name every phase histogram is exported under
+PHASE_METRIC = "tutor_display_phase_seconds"
+
+# phases are timed on the GUI thread and on the worker threads, so every change goes through the lock
+_lock = threading.Lock()
+_histograms = {}
+_values = {}
+
+class Histogram:
+    """
+    counts how many times fall into each bucket, like a Prometheus histogram
+
+    Methods:
+        __init__(self, buckets=METRICS_BUCKETS_S)
+            defines an empty histogram
+
+        observe(self, value)
+            adds one time to the histogram
+    """
+    def __init__(self, buckets=METRICS_BUCKETS_S):
+        """
+        defines an empty histogram
+        :param buckets: the upper bounds of the buckets in seconds, smallest first
+        """
+        self.buckets = tuple(buckets)
+        # one count per bucket plus one for the times above the last bound. these are not cumulative
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        """
+        adds one time to the histogram
+        :param value: the time in seconds
+        """
+        # a bucket counts the values less than or equal to its bound
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+def observe(phase, seconds):
+    """
+    records one run of a phase
+    :param phase: the name of the phase
+    :param seconds: how long it took
+    """
+    with _lock:
+        histogram = _histograms.get(phase)
+        if histogram is None:
+            histogram = _histograms[phase] = Histogram()
+        histogram.observe(seconds)
+
+@contextlib.contextmanager
+def timed(phase):
+    """
+    times the code in a with block, or every call of a function when used as a decorator
+    :param phase: the name of the phase
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(phase, time.perf_counter() - start)
+
+def set_value(name, value, description, kind="gauge"):
+    """
+    sets a value that is exported as it is, like the memory in use or a count kept somewhere else
+    :param name: the name of the metric
+    :param value: the current value
+    :param description: what the value means, for the HELP line
+    :param kind: the Prometheus type of the value ("gauge", or "counter" for a count that only goes up)
+    """
+    with _lock:
+        _values[name] = (value, description, kind)
+
+def render():
+    """
+    :return: every metric in the Prometheus text format
+    """
+    lines = []
+    with _lock:
+        if _histograms:
+            lines.append(f"# HELP {PHASE_METRIC} How long each phase of keeping the display up to date took.")
+            lines.append(f"# TYPE {PHASE_METRIC} histogram")
+            for phase, histogram in sorted(_histograms.items()):
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{PHASE_METRIC}_bucket{{phase="{phase}",le="{bound}"}} {cumulative}')
+                lines.append(f'{PHASE_METRIC}_bucket{{phase="{phase}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{PHASE_METRIC}_sum{{phase="{phase}"}} {histogram.sum}')
+                lines.append(f'{PHASE_METRIC}_count{{phase="{phase}"}} {histogram.count}')
+
+        for name, (value, description, kind) in sorted(_values.items()):
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {value}")
+
+    return "\n".join(lines) + "\n"
+
+def start_server(host=METRICS_HOST, port=METRICS_PORT):
+    """
+    serves the metrics on a daemon thread. it only listens on localhost, so the monitoring box scrapes it
+    through an agent or a tunnel on the device
+    :param host: the address to listen on
+    :param port: the port to listen on (None to not serve the metrics)
+    :return: the server (None if it is turned off or the port could not be used)
+    """
+    if port is None:
+        return None
+
+    # http.server is only needed once the display is up, so it is not imported with the rest of the display
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # every scrape would otherwise be a line in ERRORLOG.txt
+            pass
+
+    try:
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+    except OSError as e:
+        print(f"Error serving the metrics on {host}:{port}: {e}")
+        return None
+
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    print(f"serving the metrics on http://{host}:{port}/metrics")
+    return server
@@ -0,0 +1,126 @@
+#import modules
+import socket
+import uuid
+from functools import partial
+from PySide6.QtCore import QObject, QThreadPool, QTimer, Signal
+from constants import NETWORK_CHECK_MS, NETWORK_PROBE_ADDRESS, NETWORK_PROBE_TIMEOUT_S
+from worker import WorkerSignal
+
+def mac_address():
+    """
+    gets the MAC address the device has to be registered with at netreg.usu.edu
+    :return: the address as six colon separated hex bytes
+    """
+    node = uuid.getnode()
+    return ':'.join(f'{(node >> i) & 0xFF:02x}' for i in range(0, 48, 8)[::-1])
+
+def probe(address=NETWORK_PROBE_ADDRESS, timeout=NETWORK_PROBE_TIMEOUT_S):
+    """
+    tries to open a connection to check that the device can reach the internet. this blocks for up to
+    timeout seconds, so the display only calls it from a worker thread
+    :param address: the (host, port) to connect to
+    :param timeout: how long to wait in seconds
+    :return: True if the connection worked
+    """
+    try:
+        with socket.create_connection(address, timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+def run_probe(result):
+    """
+    runs the probe on a worker thread and hands the result back to the monitor
+    :param result: the WorkerSignal of the monitor
+    """
+    result.emit(probe())
+
+class NetworkMonitor(QObject):
+    """
+    checks the internet connection every so often on a worker thread. the display only reads local files,
+    so nothing waits for the result; it is only used to tell someone walking by that the device needs help
+
+    Signals:
+        status_changed(connected)
+            the connection came up or went down (also sent after the first check)
+
+    Methods:
+        __init__(self, interval_ms=NETWORK_CHECK_MS, parent=None)
+            defines the monitor
+
+        start(self)
+            checks right away and then every interval
+
+        check(self)
+            starts a probe in the background unless one is still running or the monitor was stopped
+
+        on_probe_finished(self, connected)
+            reports the result if it is different from the last one
+
+        stop(self)
+            stops checking and waits for a probe that is still running
+    """
+    status_changed = Signal(bool)
+
+    # used by the worker thread to hand the result back to the thread the monitor lives in
+    _probe_finished = Signal(bool)
+
+    def __init__(self, interval_ms=NETWORK_CHECK_MS, parent=None):
+        """
+        defines the monitor
+        :param interval_ms: how often to check the connection
+        :param parent: the QObject that owns the monitor
+        """
+        super().__init__(parent)
+        self.connected = None
+        self.probing = False
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        # noinspection PyUnresolvedReferences
+        self.timer.timeout.connect(self.check)
+        # the probe only holds the WorkerSignal, so nothing is emitted once stop() closed it
+        # noinspection PyUnresolvedReferences
+        self._probe_finished.connect(self.on_probe_finished)
+        self.result = WorkerSignal(self._probe_finished)
+
+    def start(self):
+        """
+        checks right away and then every interval
+        """
+        self.check()
+        self.timer.start()
+
+    def check(self):
+        """
+        starts a probe in the background unless one is still running or the monitor was stopped
+        """
+        if self.probing or self.result.closed:
+            return
+        self.probing = True
+        self.result.start()
+        QThreadPool.globalInstance().start(partial(run_probe, self.result))
+
+    def on_probe_finished(self, connected):
+        """
+        reports the result if it is different from the last one
+        :param connected: True if the probe could connect
+        """
+        self.probing = False
+        if connected == self.connected:
+            return
+
+        self.connected = connected
+        if connected:
+            print('Connected to the internet')
+        else:
+            print(f'Not connected to the internet. MAC address {mac_address()}')
+        self.status_changed.emit(connected)
+
+    def stop(self):
+        """
+        stops checking and waits for a probe that is still running, which takes at most its timeout.
+        its result is dropped. this has to run before the monitor is deleted
+        """
+        self.timer.stop()
+        self.result.close()
@@ -0,0 +1,195 @@
+#import modules
+import os
+from collections import OrderedDict
+from PySide6.QtGui import QPixmap, QPainter, QPainterPath, QColor, QPen
+from PySide6.QtCore import Qt, QSize, QRectF
+from constants import PORTRAIT_CACHE_BYTES, IMAGES_DIR, DERIVED_PORTRAITS_DIR, DERIVED_PORTRAITS_MANIFEST
+from preprocess_images import load_manifest
+
+# the manifest written by preprocess_images.py and the modification time it had when it was read
+_manifest = {}
+_manifest_mtime = None
+
+def portrait_path(file_name):
+    """
+    gets the path of the small copy of a tutor's picture made by preprocess_images.py.
+    falls back to the original in Images/ if the picture has not been preprocessed yet
+    :param file_name: the file name of the picture in Images/
+    :return: the path to load the picture from
+    """
+    global _manifest, _manifest_mtime
+
+    # read the manifest again only when preprocess_images.py has rewritten it
+    try:
+        mtime = os.stat(DERIVED_PORTRAITS_MANIFEST).st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime != _manifest_mtime:
+        _manifest = load_manifest(DERIVED_PORTRAITS_MANIFEST) if mtime is not None else {}
+        _manifest_mtime = mtime
+
+    record = _manifest.get(file_name)
+    if record is not None:
+        return os.path.join(DERIVED_PORTRAITS_DIR, record["file"])
+    return os.path.join(IMAGES_DIR, file_name)
+
+def render_portrait(image_path, box, corner_radius, border_color):
+    """
+    draws a picture with rounded corners and a border
+    :param image_path: the path to the image
+    :param box: the picture is scaled to fit in a square this many pixels wide, keeping its aspect ratio
+    :param corner_radius: the radius of the corners
+    :param border_color: the color of the border
+    :return: the finished QPixmap (a null QPixmap if the image could not be loaded)
+    """
+    pixmap_original = QPixmap(image_path)  # Load the original image
+    if pixmap_original.isNull() or box < 1:
+        return QPixmap()
+
+    # scale the pixmap to the box, maintaining aspect ratio
+    scaled_pixmap = pixmap_original.scaled(
+        QSize(box, box),
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation
+    )
+
+    # create a new QPixmap for the result
+    rounded_pixmap = QPixmap(scaled_pixmap.size())
+    rounded_pixmap.fill(Qt.GlobalColor.transparent)
+
+    # create the painter for drawing
+    painter = QPainter(rounded_pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    # draw the image with rounded corners (using clipping path)
+    path = QPainterPath()
+    r = corner_radius  # The radius of the corners
+    rect = QRectF(scaled_pixmap.rect())  # Convert QRect to QRectF
+    path.addRoundedRect(rect, r, r)  # Add rounded rect path
+    painter.setClipPath(path)  # Set clipping path to make the image fit inside
+
+    # draw the image
+    painter.drawPixmap(0, 0, scaled_pixmap)
+
+    # now draw the border on top of the image
+    border_thickness = 5  # Set the thickness of the border
+
+    # create a QPen for the border with specified thickness and color
+    pen = QPen(QColor(border_color))
+    pen.setWidth(border_thickness)  # Set the width of the border
+    painter.setPen(pen)  # Apply the pen to the painter
+    painter.setBrush(Qt.GlobalColor.transparent)  # No fill for the border
+
+    # draw the rounded rectangle border (without clipping)
+    painter.drawRoundedRect(rect, r, r)
+
+    # end the painter to finalize drawing
+    painter.end()
+
+    return rounded_pixmap
+
+class PortraitCache:
+    """
+    keeps finished portraits so that drawing the same tutor again is a dictionary lookup.
+    the least recently used portraits are dropped once the cache uses more memory than its budget
+
+    Methods:
+        __init__(self, max_bytes=PORTRAIT_CACHE_BYTES)
+            defines the empty cache
+
+        get(self, image_path, box, corner_radius, border_color)
+            gets the finished portrait, drawing it if it is not cached yet
+
+        forget_mtimes(self)
+            forgets the modification times of the pictures so they are read again
+
+        clear(self)
+            drops every portrait
+    """
+    def __init__(self, max_bytes=PORTRAIT_CACHE_BYTES):
+        """
+        defines the empty cache
+        :param max_bytes: how much pixmap memory the cache may hold
+        """
+        self.max_bytes = max_bytes
+        self.portraits = OrderedDict()
+        self.bytes = 0
+
+        # the modification time of every picture, read once instead of on every lookup. the images watcher
+        # calls forget_mtimes when the pictures change
+        self.mtimes = {}
+
+        # counters for how well the cache is working
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, image_path, box, corner_radius, border_color):
+        """
+        gets the finished portrait, drawing it if it is not cached yet
+        :param image_path: the path to the image
+        :param box: the size of the square the picture has to fit in
+        :param corner_radius: the radius of the corners
+        :param border_color: the color of the border
+        :return: the QPixmap (a null QPixmap if the image could not be loaded)
+        """
+        # the modification time is part of the key so a picture that was replaced gets drawn again
+        if image_path in self.mtimes:
+            mtime = self.mtimes[image_path]
+        else:
+            try:
+                mtime = os.stat(image_path).st_mtime_ns
+            except OSError:
+                mtime = None
+            self.mtimes[image_path] = mtime
+        key = (image_path, mtime, box, corner_radius, border_color)
+
+        pixmap = self.portraits.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self.portraits.move_to_end(key)
+            return pixmap
+
+        self.misses += 1
+        pixmap = render_portrait(image_path, box, corner_radius, border_color)
+        self.portraits[key] = pixmap
+        self.bytes += self.pixmap_bytes(pixmap)
+
+        # drop the least recently used portraits until the cache fits its budget again (always keeping the new one)
+        while self.bytes > self.max_bytes and len(self.portraits) > 1:
+            _, old = self.portraits.popitem(last=False)
+            self.bytes -= self.pixmap_bytes(old)
+            self.evictions += 1
+
+        return pixmap
+
+    def forget_mtimes(self):
+        """
+        forgets the modification times of the pictures so the next lookup of each reads it again.
+        portraits of pictures that were replaced are then drawn again, the rest are still hits
+        """
+        self.mtimes.clear()
+
+    def clear(self):
+        """
+        drops every portrait
+        """
+        self.portraits.clear()
+        self.bytes = 0
+
+    @staticmethod
+    def pixmap_bytes(pixmap):
+        """
+        :return: roughly how much memory the pixmap uses
+        """
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def __repr__(self):
+        total = self.hits + self.misses
+        return (
+            f"Portrait cache: {self.hits} hits, {self.misses} misses ({self.hits / total if total else 0:.0%}), "
+            f"{len(self.portraits)} portraits, {self.bytes / 1024 / 1024:.1f} MiB, {self.evictions} evicted"
+        )
+
+# the cache shared by every RoundedImageLabel
+portrait_cache = PortraitCache()
@@ -0,0 +1,207 @@
+"""
+makes small copies of the tutor pictures so the display never has to decode the full size photos.
+run.sh runs this right after rclone syncs the Images/ folder:
+
+    python src/preprocess_images.py
+
+every picture is rotated to match its EXIF orientation, cropped to the shape of a portrait and scaled
+down to PORTRAIT_WIDTH x PORTRAIT_HEIGHT. the copies are named after a hash of the original file, and
+a manifest maps each picture in Images/ to its copy. pictures that have not changed since the last run
+are skipped.
+"""
+#import modules
+import json
+import math
+import os
+import sys
+import time
+from PySide6.QtGui import QImage, QImageIOHandler, QImageReader
+from PySide6.QtCore import Qt, QSize, QRect
+from constants import IMAGES_DIR, DERIVED_PORTRAITS_DIR, DERIVED_PORTRAITS_MANIFEST, PORTRAIT_WIDTH, PORTRAIT_HEIGHT
+
+# bump this whenever the processing changes so every picture is made again
+PROCESSING_VERSION = 1
+
+# the quality of the saved copies
+JPEG_QUALITY = 90
+
+def content_hash(path):
+    """
+    hashes the contents of a picture together with the processing settings
+    :param path: the path to the picture
+    :return: the hex digest used to name the copy
+    """
+    import hashlib
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{PORTRAIT_WIDTH}x{PORTRAIT_HEIGHT} v{PROCESSING_VERSION}".encode())
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def process_image(source_path, target_path):
+    """
+    decodes, rotates, crops and scales a single picture. this runs in a worker process
+    :param source_path: the path to the original picture
+    :param target_path: where to save the copy
+    :return: None if it worked, otherwise the error message
+    """
+    reader = QImageReader(source_path)
+    reader.setAutoTransform(True)  # rotate according to the EXIF orientation
+    stored_size = reader.size()
+    if not stored_size.isValid():
+        return reader.errorString()
+
+    # the size after the EXIF rotation
+    width, height = stored_size.width(), stored_size.height()
+    if reader.transformation() & QImageIOHandler.Transformation.TransformationRotate90:
+        width, height = height, width
+
+    # let the decoder skip the detail we would throw away anyway, while still covering the portrait after cropping
+    scale = min(1.0, max(PORTRAIT_WIDTH / width, PORTRAIT_HEIGHT / height))
+    if scale < 1.0:
+        reader.setScaledSize(QSize(
+            math.ceil(stored_size.width() * scale),
+            math.ceil(stored_size.height() * scale)
+        ))
+
+    image = reader.read()
+    if image.isNull():
+        return reader.errorString()
+
+    # crop the middle of the picture to the shape of a portrait
+    crop_width = min(image.width(), round(image.height() * PORTRAIT_WIDTH / PORTRAIT_HEIGHT))
+    crop_height = min(image.height(), round(image.width() * PORTRAIT_HEIGHT / PORTRAIT_WIDTH))
+    image = image.copy(QRect(
+        (image.width() - crop_width) // 2,
+        (image.height() - crop_height) // 2,
+        crop_width,
+        crop_height
+    ))
+
+    image = image.scaled(
+        PORTRAIT_WIDTH,
+        PORTRAIT_HEIGHT,
+        Qt.AspectRatioMode.IgnoreAspectRatio,
+        Qt.TransformationMode.SmoothTransformation
+    ).convertToFormat(QImage.Format.Format_RGB32)
+
+    # save next to the target and rename so the display never sees a half written file
+    temp_path = f"{target_path}.tmp.jpg"
+    if not image.save(temp_path, "JPG", JPEG_QUALITY):
+        return f"could not write {target_path}"
+    os.replace(temp_path, target_path)
+    return None
+
+def load_manifest(path=DERIVED_PORTRAITS_MANIFEST):
+    """
+    reads the manifest written by the last run
+    :param path: the path to the manifest
+    :return: a dictionary of picture name -> {"mtime", "size", "hash", "file"} (empty if there is no manifest)
+    """
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_manifest(manifest, path=DERIVED_PORTRAITS_MANIFEST):
+    """
+    writes the manifest to a temporary file and renames it over the old one
+    :param manifest: the dictionary to save
+    :param path: the path to the manifest
+    """
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+    os.replace(temp_path, path)
+
+def preprocess_images(images_dir=IMAGES_DIR, derived_dir=DERIVED_PORTRAITS_DIR, manifest_path=DERIVED_PORTRAITS_MANIFEST, workers=None):
+    """
+    makes a small copy of every picture in images_dir that changed since the last run
+    :param images_dir: the folder rclone syncs the pictures into
+    :param derived_dir: the folder the copies go in
+    :param manifest_path: the path of the manifest
+    :param workers: how many processes to use (one per CPU if None)
+    :return: a dictionary of counts of what happened
+    """
+    # the display imports this module for load_manifest, so what only processing needs is imported here
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    os.makedirs(derived_dir, exist_ok=True)
+    old_manifest = load_manifest(manifest_path)
+    manifest = {}
+    jobs = {}
+    counts = {"unchanged": 0, "reused": 0, "processed": 0, "failed": 0, "removed": 0}
+
+    for entry in os.scandir(images_dir):
+        if not entry.is_file() or entry.name.startswith("."):
+            continue
+        stat = entry.stat()
+
+        # skip pictures that have not been touched since the last run
+        old = old_manifest.get(entry.name)
+        if (
+            old is not None
+            and old["mtime"] == stat.st_mtime_ns
+            and old["size"] == stat.st_size
+            and os.path.exists(os.path.join(derived_dir, old["file"]))
+        ):
+            manifest[entry.name] = old
+            counts["unchanged"] += 1
+            continue
+
+        # rclone can touch a file without changing it, so check the contents before processing it again
+        digest = content_hash(entry.path)
+        record = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "hash": digest, "file": f"{digest}.jpg"}
+        if os.path.exists(os.path.join(derived_dir, record["file"])):
+            manifest[entry.name] = record
+            counts["reused"] += 1
+        else:
+            jobs[entry.name] = record
+
+    # process everything that changed in parallel. identical pictures only have to be processed once
+    if jobs:
+        sources = {}
+        for name, record in jobs.items():
+            sources.setdefault(record["file"], name)
+
+        # spawn the workers instead of forking so this is also safe from the display, which has threads running
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = {
+                file: executor.submit(process_image, os.path.join(images_dir, name), os.path.join(derived_dir, file))
+                for file, name in sources.items()
+            }
+            errors = {file: future.result() for file, future in futures.items()}
+
+        for name, record in jobs.items():
+            error = errors[record["file"]]
+            if error is None:
+                manifest[name] = record
+                counts["processed"] += 1
+            else:
+                print(f"Error processing {name}: {error}")
+                counts["failed"] += 1
+
+    # delete the copies of pictures that are gone
+    in_use = {record["file"] for record in manifest.values()}
+    for entry in os.scandir(derived_dir):
+        if entry.name.endswith(".jpg") and entry.name not in in_use:
+            os.remove(entry.path)
+            counts["removed"] += 1
+
+    save_manifest(manifest, manifest_path)
+    return counts
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    if not os.path.isdir(IMAGES_DIR):
+        print(f"{IMAGES_DIR}/ does not exist, nothing to preprocess")
+        sys.exit(0)
+
+    result = preprocess_images()
+    print(
+        f"preprocessed pictures in {time.perf_counter() - start:.2f}s: "
+        + ", ".join(f"{count} {name}" for name, count in result.items())
+    )
@@ -0,0 +1,112 @@
+#import modules
+from functools import partial
+from PySide6.QtCore import QObject, QThreadPool, Signal
+from worker import WorkerSignal
+
+def read_snapshot(excel_manager, current, result):
+    """
+    does the reading. this runs on the worker thread and must not touch anything on the display
+    :param excel_manager: the ExcelManager whose files are read
+    :param current: the snapshot that was in use when the load started
+    :param result: the WorkerSignal that hands the new snapshot back to the loader
+    """
+    try:
+        snapshot = excel_manager.read_snapshot(current)
+    except Exception as e:
+        print(f"Error loading the schedule: {e}")
+        snapshot = current
+    result.emit(snapshot)
+
+class ScheduleLoader(QObject):
+    """
+    reads the schedule spreadsheet on a worker thread so the display never freezes while it is parsed.
+    the worker only builds a new snapshot and hands it back through a signal; the display keeps using
+    the old one until then
+
+    Signals:
+        snapshot_ready(snapshot)
+            a load finished. the snapshot is None if there is no data at all
+
+    Methods:
+        __init__(self, excel_manager, parent=None)
+            defines the loader
+
+        load(self)
+            starts reading the spreadsheet in the background
+
+        is_loading(self)
+            tells if a load is running
+
+        stop(self)
+            stops loading and waits for a load that is still running
+
+        on_finished(self, snapshot)
+            starts the next load if the spreadsheet changed again while this one was running
+    """
+    snapshot_ready = Signal(object)
+
+    # used by the worker thread to hand the result back to the thread the loader lives in
+    _finished = Signal(object)
+
+    def __init__(self, excel_manager, parent=None):
+        """
+        defines the loader
+        :param excel_manager: the ExcelManager whose files are read
+        :param parent: the QObject that owns the loader
+        """
+        super().__init__(parent)
+        self.em = excel_manager
+        self.pool = QThreadPool.globalInstance()
+        self.loading = False
+        self.load_again = False
+        self.stopped = False
+
+        # the connection is queued because the signal is emitted from the worker thread. the worker only
+        # holds the WorkerSignal, so nothing is emitted once stop() closed it
+        # noinspection PyUnresolvedReferences
+        self._finished.connect(self.on_finished)
+        self.result = WorkerSignal(self._finished)
+
+    def load(self):
+        """
+        starts reading the spreadsheet in the background. if a load is already running, one more is
+        done after it so a change made in the meantime is not missed
+        """
+        if self.stopped:
+            return
+        if self.loading:
+            self.load_again = True
+            return
+
+        self.loading = True
+        self.result.start()
+        self.pool.start(partial(read_snapshot, self.em, self.em.get_snapshot(), self.result))
+
+    def is_loading(self):
+        """
+        :return: True if a load is running
+        """
+        return self.loading
+
+    def stop(self):
+        """
+        stops loading and waits for a load that is still running, so it does not write the cache while
+        the program exits. its snapshot is dropped. this has to run before the loader is deleted
+        """
+        self.stopped = True
+        self.load_again = False
+        self.result.close()
+
+    def on_finished(self, snapshot):
+        """
+        passes the new snapshot on and starts the next load if the spreadsheet changed again while this one was running
+        :param snapshot: the snapshot built by the worker
+        """
+        self.loading = False
+        if self.stopped:
+            return
+        self.snapshot_ready.emit(snapshot)
+
+        if self.load_again:
+            self.load_again = False
+            self.load()
@@ -0,0 +1,78 @@
+import numpy as np
+from typing import NamedTuple
+from constants import MAJORS, WEEKDAYS
+
+# the code table for the cells of the tutor schedule. index 0 means the tutor is not on shift
+SLOT_CODES = ('', 'CP', 'M', 'CE', 'EL', 'B')
+_CODE_LOOKUP = {code.lower(): index for index, code in enumerate(SLOT_CODES)}
+
+class ScheduleTensor(NamedTuple):
+    """
+    The tutor schedule encoded as a NumPy array so roster questions can be answered with vectorized expressions.
+
+    Attributes:
+        codes: a uint8 array of tutors x weekdays x slots holding indexes into SLOT_CODES
+        majors: a uint8 array with the index of each tutor's major in MAJORS (len(MAJORS) if it is unknown)
+
+    Methods:
+        on_shift(self, weekday, slot)
+            Gets the indexes of the tutors on shift at a slot.
+        shift_end(self, weekday, slot, tutors=None)
+            Gets the first slot after a slot where each tutor is off shift.
+        major_counts(self, weekday)
+            Counts how many tutors of each major are on shift at every slot.
+    """
+    codes: np.ndarray
+    majors: np.ndarray
+
+    def on_shift(self, weekday, slot):
+        """
+        Gets the indexes of the tutors on shift at a slot.
+        :param weekday: the day of the week (0 is Monday)
+        :param slot: the index of the half hour slot
+        :return: an array of tutor indexes in spreadsheet order
+        """
+        return np.flatnonzero(self.codes[:, weekday, slot])
+
+    def shift_end(self, weekday, slot, tutors=None):
+        """
+        Gets the first slot at or after a slot where each tutor is off shift.
+        For a tutor who is on shift at the slot this is the slot their shift ends at.
+        :param weekday: the day of the week (0 is Monday)
+        :param slot: the index of the half hour slot
+        :param tutors: the indexes of the tutors to check (all of them if None)
+        :return: an array with the end slot of each tutor
+        """
+        rows = self.codes[:, weekday, slot:] if tutors is None else self.codes[tutors, weekday, slot:]
+
+        # pad with an off column so a shift that runs until closing ends at the last slot
+        off = np.concatenate((rows == 0, np.ones((len(rows), 1), dtype=bool)), axis=1)
+        return slot + off.argmax(axis=1)
+
+    def major_counts(self, weekday):
+        """
+        Counts how many tutors of each major are on shift at every slot.
+        :param weekday: the day of the week (0 is Monday)
+        :return: an array of majors (in the order of MAJORS) x slots
+        """
+        one_hot = np.eye(len(MAJORS) + 1, dtype=np.int32)[self.majors]
+        return (one_hot.T @ (self.codes[:, weekday, :] != 0).astype(np.int32))[:len(MAJORS)]
+
+def build_tensor(tutors):
+    """
+    Encodes the slot codes of every tutor into a ScheduleTensor.
+    Codes that are not in SLOT_CODES are treated as off shift.
+    :param tutors: the tutors in spreadsheet order
+    :return: the new ScheduleTensor
+    """
+    slot_count = max((len(day) for tutor in tutors for day in tutor.schedule), default=0)
+    codes = np.zeros((len(tutors), len(WEEKDAYS), slot_count), dtype=np.uint8)
+
+    for index, tutor in enumerate(tutors):
+        for weekday, day in enumerate(tutor.schedule[:len(WEEKDAYS)]):
+            codes[index, weekday, :len(day)] = [_CODE_LOOKUP.get(value.lower(), 0) for value in day]
+
+    major_lookup = {major: index for index, major in enumerate(MAJORS)}
+    majors = np.array([major_lookup.get(tutor.major, len(MAJORS)) for tutor in tutors], dtype=np.uint8)
+
+    return ScheduleTensor(codes, majors)
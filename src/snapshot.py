@@ -0,0 +1,251 @@
+import os
+import pickle
+import struct
+import zlib
+from typing import NamedTuple
+import numpy as np
+from constants import MAJOR_ORDER, SCHEDULE_START_MINUTE, SLOT_MINUTES, WEEKDAYS
+from schedule_tensor import ScheduleTensor, build_tensor
+
+# the binary cache starts with this header: magic bytes, schema version, fingerprint, payload length and checksum.
+# bump SCHEMA_VERSION whenever the layout of ScheduleSnapshot changes so old caches are ignored
+CACHE_MAGIC = b"TDSNAP"
+SCHEMA_VERSION = 5
+_HEADER = struct.Struct("<6sH?qQQII")
+
+class Tutor(NamedTuple):
+    """
+    Everything the display knows about a single tutor.
+
+    Attributes:
+        name: the name of the tutor as written in the spreadsheet
+        major: the abbreviation of the tutor's major (MAE, ECE, ...)
+        academic_class: sophomore, junior, etc.
+        profile_image: the file name of the tutor's picture in Images/
+        schedule: one tuple of slot codes per weekday, Monday first
+    """
+    name: str
+    major: str
+    academic_class: str
+    profile_image: str
+    schedule: tuple
+
+class Shift(NamedTuple):
+    """
+    One continuous block of time a tutor is on shift.
+
+    Attributes:
+        start: when the shift starts in minutes after midnight
+        end: when the shift ends (exclusive) in minutes after midnight
+        order: the position of the tutor in ScheduleSnapshot.tutors, used to keep results in spreadsheet order
+        tutor: the Tutor working the shift
+    """
+    start: int
+    end: int
+    order: int
+    tutor: Tutor
+
+class RosterEntry(NamedTuple):
+    """
+    A tutor who is on shift, as shown on the display.
+
+    Attributes:
+        name: the name of the tutor
+        major: the abbreviation of the tutor's major
+        academic_class: sophomore, junior, etc.
+        profile_image: the file name of the tutor's picture in Images/
+        here_until: when the tutor's shift ends in minutes after midnight
+    """
+    name: str
+    major: str
+    academic_class: str
+    profile_image: str
+    here_until: int
+
+class ScheduleSnapshot(NamedTuple):
+    """
+    An immutable copy of the schedule as it was when the spreadsheet was last read.
+    A new snapshot is built whenever the spreadsheet changes instead of editing the old one,
+    so anything holding on to a snapshot can keep using it safely.
+
+    Attributes:
+        fingerprint: the file_fingerprint of the spreadsheet this was built from (None if it was missing)
+        tutors: a tuple of Tutor in the order they appear in the spreadsheet
+        days: the print schedule for each weekday, Monday first, as tuples of rows
+        tensor: the tutor schedule encoded as a ScheduleTensor
+        shifts: for each weekday, Monday first, a tuple of Shift sorted by start
+        timeline: for each weekday, for each slot, a tuple of RosterEntry sorted by major and then by when they leave
+    """
+    fingerprint: tuple | None
+    tutors: tuple
+    days: tuple
+    tensor: ScheduleTensor
+    shifts: tuple
+    timeline: tuple
+
+def file_fingerprint(path):
+    """
+    Gets a cheap fingerprint of a file using a single os.stat call.
+    :param path: the path to the file
+    :return: a tuple of (modification time in ns, size, inode) or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+def build_snapshot(tutor_dict, schedule_list, fingerprint):
+    """
+    Freezes the dictionaries produced while parsing the spreadsheet into a snapshot.
+    :param tutor_dict: the tutors keyed by their lowercase name
+    :param schedule_list: the print schedule for each weekday, Monday first
+    :param fingerprint: the fingerprint of the spreadsheet the data came from
+    :return: the new ScheduleSnapshot
+    """
+    tutors = []
+    for key, tutor_data in tutor_dict.items():
+        # skip metadata keys like 'last_fetch'
+        if not isinstance(tutor_data, dict) or "schedule" not in tutor_data:
+            continue
+
+        tutors.append(Tutor(
+            name=str(tutor_data["name"]),
+            major=str(tutor_data["major"]),
+            academic_class=str(tutor_data["academic_class"]),
+            profile_image=str(tutor_data["profile_image"]),
+            schedule=tuple(tuple(str(value) for value in tutor_data["schedule"].get(day) or ()) for day in WEEKDAYS)
+        ))
+
+    days = tuple(tuple(tuple(str(value) for value in row) for row in day) for day in schedule_list)
+
+    tutors = tuple(tutors)
+    tensor = build_tensor(tutors)
+
+    return ScheduleSnapshot(fingerprint, tutors, days, tensor, compile_shifts(tutors, tensor), build_timeline(tutors, tensor))
+
+def compile_shifts(tutors, tensor):
+    """
+    Turns every tutor's slot codes into shift intervals measured in minutes.
+    The display only needs their starts and ends, to know when the roster can change.
+    :param tutors: the tutors in spreadsheet order
+    :param tensor: the ScheduleTensor built from the same tutors
+    :return: a tuple with the shifts of each weekday sorted by start, Monday first
+    """
+    # pad every day with an off slot on both sides so the start and end of each run show up as +1 and -1
+    on_shift = np.pad(tensor.codes != 0, ((0, 0), (0, 0), (1, 1))).astype(np.int8)
+    edges = np.diff(on_shift, axis=2)
+
+    # argwhere walks the array in the same order for both, so the nth start belongs with the nth end
+    run_starts = np.argwhere(edges == 1)
+    run_ends = np.argwhere(edges == -1)[:, 2]
+
+    shifts_by_day = [[] for _ in WEEKDAYS]
+    for (order, weekday, start_slot), end_slot in zip(run_starts.tolist(), run_ends.tolist()):
+        shifts_by_day[weekday].append(Shift(
+            SCHEDULE_START_MINUTE + start_slot * SLOT_MINUTES,
+            SCHEDULE_START_MINUTE + end_slot * SLOT_MINUTES,
+            order,
+            tutors[order]
+        ))
+
+    for shifts in shifts_by_day:
+        shifts.sort(key=lambda shift: (shift.start, shift.order))
+    return tuple(tuple(shifts) for shifts in shifts_by_day)
+
+def build_timeline(tutors, tensor):
+    """
+    Works out the sorted roster for every slot of the week.
+    The roster only changes at slot boundaries, so this answers every "who is on shift" question up front.
+    :param tutors: the tutors in spreadsheet order
+    :param tensor: the ScheduleTensor built from the same tutors
+    :return: a tuple of weekdays, each a tuple of slots, each a tuple of RosterEntry
+    """
+    slot_count = tensor.codes.shape[2]
+
+    timeline = []
+    for weekday in range(len(WEEKDAYS)):
+        day = []
+        for slot in range(slot_count):
+            on_shift = tensor.on_shift(weekday, slot)
+            ends = tensor.shift_end(weekday, slot, on_shift).tolist()
+            on_shift = on_shift.tolist()
+
+            roster = [
+                RosterEntry(
+                    tutors[order].name,
+                    tutors[order].major,
+                    tutors[order].academic_class,
+                    tutors[order].profile_image,
+                    SCHEDULE_START_MINUTE + end * SLOT_MINUTES
+                )
+                for order, end in zip(on_shift, ends)
+            ]
+
+            # sort by major and then by the time that they are leaving (unknown majors go last)
+            roster.sort(key=lambda entry: (MAJOR_ORDER.get(entry.major, len(MAJOR_ORDER)), entry.here_until))
+            day.append(tuple(roster))
+        timeline.append(tuple(day))
+
+    return tuple(timeline)
+
+def save_snapshot(snapshot, cache_path):
+    """
+    Writes a snapshot to the binary cache.
+    The data is written to a temporary file next to the cache and then renamed over it, so a crash
+    mid-write leaves either the old cache or the new one, never a half written file.
+    :param snapshot: the ScheduleSnapshot to save
+    :param cache_path: where to save it
+    """
+    payload = pickle.dumps(tuple(snapshot[1:]), protocol=pickle.HIGHEST_PROTOCOL)
+    fingerprint = snapshot.fingerprint or (0, 0, 0)
+    header = _HEADER.pack(
+        CACHE_MAGIC,
+        SCHEMA_VERSION,
+        snapshot.fingerprint is not None,
+        *fingerprint,
+        len(payload),
+        zlib.crc32(payload)
+    )
+
+    temp_path = f"{cache_path}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(header)
+        file.write(payload)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, cache_path)
+
+def load_snapshot(cache_path):
+    """
+    Reads a snapshot from the binary cache.
+    :param cache_path: the path to the cache
+    :return: the cached ScheduleSnapshot or None if there is no cache, it was written by a different schema version or it cannot be read
+    """
+    try:
+        with open(cache_path, "rb") as file:
+            data = file.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        print(f"Error reading the schedule cache '{cache_path}': {e}")
+        return None
+
+    # check the header before trusting any of the data
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, has_fingerprint, mtime, size, inode, length, checksum = _HEADER.unpack_from(data)
+    if magic != CACHE_MAGIC or version != SCHEMA_VERSION:
+        return None
+
+    payload = data[_HEADER.size:]
+    if len(payload) != length or zlib.crc32(payload) != checksum:
+        return None
+
+    # the cache is only a shortcut, so whatever goes wrong unpickling it (a renamed module or class
+    # without a new SCHEMA_VERSION, say) the spreadsheet is read instead
+    try:
+        return ScheduleSnapshot((mtime, size, inode) if has_fingerprint else None, *pickle.loads(payload))
+    except Exception as e:
+        print(f"Error reading the schedule cache '{cache_path}': {e!r}")
+        return None
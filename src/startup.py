@@ -0,0 +1,73 @@
+"""
+keeps track of how long the display takes to start, from the moment the process was created to the
+first frame on screen. main.py imports this before anything else and marks each phase as it gets there.
+the report is printed once the first frame has been drawn, so every start (including restarts after a
+crash) leaves its time-to-first-frame in ERRORLOG.txt.
+
+for a per-module breakdown of the imports run benchmarks/bench_startup.py, which starts the display
+with python -X importtime
+"""
+#import modules
+import json
+import os
+import sys
+import time
+
+# the modules that should stay out of a start from the cache
+HEAVY_MODULES = ("pandas", "openpyxl")
+
+def process_age():
+    """
+    gets how long ago the process was created, so the time spent starting python itself is counted
+    :return: the age in seconds (0 where /proc is not available)
+    """
+    try:
+        with open("/proc/self/stat") as file:
+            # the fields after the command name, which is in brackets and may contain spaces
+            fields = file.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as file:
+            uptime = float(file.read().split()[0])
+        return max(0.0, uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+# the moment the process was created, on the perf_counter clock
+START = time.perf_counter() - process_age()
+
+# the phases reached so far, as (name, perf_counter time)
+_marks = [("python started", time.perf_counter())]
+
+def mark(name):
+    """
+    records that the display reached a phase of starting up
+    :param name: the name of the phase
+    """
+    _marks.append((name, time.perf_counter()))
+
+def report():
+    """
+    :return: a dictionary with the time of every phase in milliseconds since the process was created and
+             the heavy modules that were imported along the way
+    """
+    return {
+        "phases_ms": {name: round((when - START) * 1000, 1) for name, when in _marks},
+        "heavy_modules_loaded": [name for name in HEAVY_MODULES if name in sys.modules],
+        "modules_loaded": len(sys.modules),
+    }
+
+def print_report():
+    """
+    prints the report on one line so it is easy to find in the log
+    """
+    print(f"startup report: {json.dumps(report())}", flush=True)
+
+def first_frame():
+    """
+    marks the first frame and prints the report, once for the whole program however many windows it has
+    :return: True the first time it is called
+    """
+    if any(name == "first frame" for name, _ in _marks):
+        return False
+    mark("first frame")
+    print_report()
+    return True
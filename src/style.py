@@ -0,0 +1,62 @@
+#import modules
+from constants import *
+
+def build_stylesheet():
+    """
+    builds the one style sheet used by the whole application from the colors in constants.py.
+    widgets pick their look with their object name, their class or their "major" property instead
+    of getting a style sheet of their own
+    :return: the style sheet as a string
+    """
+    rules = [
+        # everything sits on the blue background unless something below says otherwise
+        f"QWidget {{background-color: {BACK_BLUE}}}",
+        "QLabel {color: black}",
+
+        # the title bars
+        f"#title {{background-color: {TITLE_TEAL}; font-weight: 700; color: white}}",
+        (
+            f"#scheduleTitle {{background-color: {TITLE_TEAL}; "
+            f"border-top-left-radius: {CORNER_RADIUS}px; border-top-right-radius: {CORNER_RADIUS}px; "
+            f"font-weight: 700; color: white}}"
+        ),
+
+        # the white panels
+        (
+            f"ScheduleGrid {{background-color: white; "
+            f"border-bottom-right-radius: {CORNER_RADIUS}px; border-bottom-left-radius: {CORNER_RADIUS}px}}"
+        ),
+        f"#tutorList, #tutorList QWidget {{background-color: white; border-radius: {CORNER_RADIUS}px}}",
+
+        # the cards in the tutor list
+        f"#tutorList TutorCard, #tutorList WillReturn {{background-color: {BACK_GREY}; border: 2px solid {BORDER_GREY}}}",
+        f"#tutorList RoundedImageLabel {{background-color: {BACK_GREY}}}",
+        "#tutorList #cardDetails, #tutorList #cardDetails QWidget {background-color: transparent}",
+        "#tutorList WillReturn QLabel {background-color: transparent}",
+
+        # the colored line on a tutor card and the colored bar on a will return card (black if the major is unknown)
+        "#tutorList #majorLine {border: 8px solid transparent; border-bottom-color: black; border-radius: 0px}",
+        "#tutorList #majorBar {border: 6px solid transparent; border-top-color: black; background: transparent}",
+
+        # the banner shown while the device is not connected to the internet
+        f"#networkBanner {{background-color: {NETWORK_BANNER_RED}; color: white; padding: 10px}}",
+    ]
+
+    for major, name in MAJOR_ABBREVIATIONS.items():
+        rules.append(f'#tutorList #majorLine[major="{name}"] {{border-bottom-color: {MAJOR_COLORS[major]}}}')
+        rules.append(f'#tutorList #majorBar[major="{name}"] {{border-top-color: {MAJOR_COLORS[major]}}}')
+
+    return "\n".join(rules)
+
+# built once when the module is imported
+APP_STYLESHEET = build_stylesheet()
+
+def set_major(widget, major):
+    """
+    changes the "major" property of a widget and re-polishes just that widget so its color follows
+    :param widget: the widget to change
+    :param major: the full name of the major (Mechanical Engineer, ...)
+    """
+    widget.setProperty("major", major)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
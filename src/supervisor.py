@@ -0,0 +1,318 @@
+"""
+keeps the display running. run.sh starts this instead of main.py; it starts main.py as a child process,
+copies everything the display prints to its own output (ERRORLOG.txt) and starts it again whenever it
+crashes, waiting a little longer after every crash in a row so a display that cannot start does not
+spin the CPU.
+
+every cache of the schedule that the display has been showing for SUPERVISOR_HEALTHY_S without crashing
+is kept next to the cache as the last good one. before a restart the last good cache is put back, so the
+new display draws its first frame from it straight away even if the newest schedule is what crashed it,
+and then reads the spreadsheet again in the background as usual.
+
+the number of crashes and restarts and the mean time to recover (from the crash to the first frame of the
+new display) are kept in SUPERVISOR_STATS_PATH across reboots.
+
+arguments are passed on to main.py, e.g. python src/supervisor.py --all-screens
+"""
+#import modules
+import filecmp
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+import time
+from constants import CENTERS, SUPERVISOR_BACKOFF_START_S, SUPERVISOR_BACKOFF_MAX_S, SUPERVISOR_HEALTHY_S, \
+    SUPERVISOR_STATS_PATH
+from snapshot import load_snapshot
+
+# main.py prints this once its first frame is on screen (see startup.py)
+FIRST_FRAME_LINE = "startup report:"
+
+# how often the child is checked on while it runs
+POLL_S = 1
+
+def copy_file(source, destination):
+    """
+    copies a file through a temporary file so the destination is never half written
+    :param source: the file to copy
+    :param destination: where to copy it
+    """
+    temp_path = f"{destination}.tmp"
+    shutil.copyfile(source, temp_path)
+    os.replace(temp_path, destination)
+
+def good_cache_path(cache_path):
+    """
+    :param cache_path: the path to a cache of the schedule
+    :return: the path of the last good copy of that cache
+    """
+    return f"{cache_path}.good"
+
+class Supervisor:
+    """
+    starts the display and starts it again after every crash
+
+    Methods:
+        __init__(self, arguments=(), centers=CENTERS, stats_path=SUPERVISOR_STATS_PATH)
+            defines the supervisor and reads the counts kept from earlier runs
+
+        run(self)
+            keeps the display running until it is closed or the supervisor is stopped
+
+        stop(self, signal_number=None, frame=None)
+            stops the display and the supervisor
+
+        start_child(self)
+            starts main.py and copies what it prints
+
+        pipe_output(self, child)
+            copies what the display prints and notices its first frame
+
+        watch_child(self, child)
+            waits for the display to exit, keeping its schedule once it has been up long enough
+
+        backoff(self)
+            works out how long to wait before the next restart
+
+        save_good_snapshots(self)
+            keeps every cache the display has been showing for long enough as the last good one
+
+        restore_good_snapshots(self)
+            puts the last good caches back for the next display to start from
+
+        record_recovery(self)
+            adds the time from the last crash to the first frame of the new display to the counts
+
+        save_stats(self)
+            writes the counts to SUPERVISOR_STATS_PATH
+    """
+    def __init__(self, arguments=(), centers=CENTERS, stats_path=SUPERVISOR_STATS_PATH):
+        """
+        defines the supervisor and reads the counts kept from earlier runs
+        :param arguments: the arguments to start main.py with
+        :param centers: the centers the display shows, for the paths to their caches
+        :param stats_path: where to keep the crash and restart counts
+        """
+        self.command = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py"), *arguments]
+        self.cache_paths = [center["cache_path"] for center in centers]
+        self.stats_path = stats_path
+
+        self.child = None
+        self.stopping = threading.Event()
+        self.first_frame = threading.Event()
+        self.first_frame_at = None
+
+        # the crashes since the display was last up for SUPERVISOR_HEALTHY_S, for the backoff
+        self.crashes_in_a_row = 0
+        # the monotonic time of the first crash the display is recovering from (None once it drew a frame again)
+        self.crashed_at = None
+
+        self.stats = {
+            "crashes": 0,
+            "restarts": 0,
+            "recoveries": 0,
+            "total_recovery_s": 0.0,
+            "mean_time_to_recover_s": None,
+            "last_exit_code": None,
+            "last_crash": None,
+        }
+        try:
+            with open(stats_path) as file:
+                self.stats.update(json.load(file))
+        except (OSError, ValueError):
+            pass
+
+    def run(self):
+        """
+        keeps the display running until it is closed (it exits with code 0) or the supervisor is stopped
+        :return: 0 once the display was closed or the supervisor stopped
+        """
+        while True:
+            child = self.start_child()
+            started = time.monotonic()
+            exit_code = self.watch_child(child)
+
+            if self.stopping.is_set():
+                print("supervisor: stopped", flush=True)
+                return 0
+            if exit_code == 0:
+                print("supervisor: the display was closed", flush=True)
+                return 0
+
+            # it crashed. if it had not drawn a frame since an earlier crash it is still recovering from that
+            # one, so the time to recover keeps counting from the first crash
+            if self.crashed_at is None:
+                self.crashed_at = time.monotonic()
+            self.crashes_in_a_row += 1
+            self.stats["crashes"] += 1
+            self.stats["last_exit_code"] = exit_code
+            self.stats["last_crash"] = time.strftime("%Y-%m-%d %H:%M:%S")
+            self.save_stats()
+
+            delay = self.backoff()
+            print(
+                f"supervisor: the display crashed with exit code {exit_code} after {time.monotonic() - started:.0f}s "
+                f"({self.stats['crashes']} crashes so far), restarting in {delay}s",
+                flush=True
+            )
+            self.restore_good_snapshots()
+
+            # stop() cuts the wait short
+            if self.stopping.wait(delay):
+                print("supervisor: stopped", flush=True)
+                return 0
+
+            self.stats["restarts"] += 1
+            self.save_stats()
+
+    def stop(self, signal_number=None, frame=None):
+        """
+        stops the display and the supervisor. this is the handler for SIGTERM and SIGINT
+        :param signal_number: the signal that was received
+        :param frame: the frame that was running when it was received
+        """
+        self.stopping.set()
+        if self.child is not None and self.child.poll() is None:
+            self.child.terminate()
+
+    def start_child(self):
+        """
+        starts main.py and copies what it prints
+        :return: the child process
+        """
+        self.first_frame.clear()
+        # without buffering every line reaches the log as soon as it is printed, including the first frame
+        environment = dict(os.environ, PYTHONUNBUFFERED="1")
+        # Qt and the C libraries can print bytes that are not valid text. they are replaced rather than
+        # stopping pipe_output, which would leave the display blocked on a full pipe
+        self.child = subprocess.Popen(
+            self.command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=environment, text=True,
+            errors="replace", bufsize=1
+        )
+        self.output_thread = threading.Thread(target=self.pipe_output, args=(self.child,), daemon=True)
+        self.output_thread.start()
+        return self.child
+
+    def pipe_output(self, child):
+        """
+        copies what the display prints and notices its first frame. this runs on its own thread until the display exits
+        :param child: the child process
+        """
+        for line in child.stdout:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            if line.startswith(FIRST_FRAME_LINE):
+                self.first_frame_at = time.monotonic()
+                self.first_frame.set()
+
+    def watch_child(self, child):
+        """
+        waits for the display to exit. once it has been up for SUPERVISOR_HEALTHY_S the crashes in a row
+        are forgotten, and every SUPERVISOR_HEALTHY_S the schedule it is showing is kept as the last good one
+        :param child: the child process
+        :return: the exit code of the display
+        """
+        started = time.monotonic()
+        checked = started
+        while True:
+            try:
+                exit_code = child.wait(timeout=POLL_S)
+                break
+            except subprocess.TimeoutExpired:
+                pass
+
+            if self.first_frame.is_set() and self.crashed_at is not None:
+                self.record_recovery()
+
+            now = time.monotonic()
+            if now - checked >= SUPERVISOR_HEALTHY_S:
+                checked = now
+                self.crashes_in_a_row = 0
+                self.save_good_snapshots()
+
+        # let the last lines reach the log before anything else is printed
+        self.output_thread.join()
+        if self.first_frame.is_set() and self.crashed_at is not None:
+            self.record_recovery()
+        return exit_code
+
+    def backoff(self):
+        """
+        works out how long to wait before the next restart. the wait doubles after every crash in a row
+        :return: the wait in seconds
+        """
+        return min(SUPERVISOR_BACKOFF_MAX_S, SUPERVISOR_BACKOFF_START_S * 2 ** (self.crashes_in_a_row - 1))
+
+    def save_good_snapshots(self):
+        """
+        keeps every cache the display has been showing for SUPERVISOR_HEALTHY_S without crashing as the
+        last good one. a cache written more recently has not proven itself yet
+        """
+        for cache_path in self.cache_paths:
+            good_path = good_cache_path(cache_path)
+            try:
+                if time.time() - os.stat(cache_path).st_mtime < SUPERVISOR_HEALTHY_S:
+                    continue
+                if os.path.exists(good_path) and filecmp.cmp(cache_path, good_path, shallow=False):
+                    continue
+                if load_snapshot(cache_path) is None:
+                    continue
+                copy_file(cache_path, good_path)
+                print(f"supervisor: kept {cache_path} as the last good schedule", flush=True)
+            except OSError as e:
+                print(f"supervisor: Error keeping {cache_path} as the last good schedule: {e}", flush=True)
+
+    def restore_good_snapshots(self):
+        """
+        puts the last good caches back for the next display to start from. the display reads the
+        spreadsheet again in the background, so nothing newer is lost
+        """
+        for cache_path in self.cache_paths:
+            good_path = good_cache_path(cache_path)
+            try:
+                if not os.path.exists(good_path):
+                    continue
+                if os.path.exists(cache_path) and filecmp.cmp(cache_path, good_path, shallow=False):
+                    continue
+                copy_file(good_path, cache_path)
+                print(f"supervisor: restored the last good schedule to {cache_path}", flush=True)
+            except OSError as e:
+                print(f"supervisor: Error restoring the last good schedule to {cache_path}: {e}", flush=True)
+
+    def record_recovery(self):
+        """
+        adds the time from the last crash to the first frame of the new display to the counts
+        """
+        recovery = self.first_frame_at - self.crashed_at
+        self.crashed_at = None
+        self.stats["recoveries"] += 1
+        self.stats["total_recovery_s"] = round(self.stats["total_recovery_s"] + recovery, 3)
+        self.stats["mean_time_to_recover_s"] = round(self.stats["total_recovery_s"] / self.stats["recoveries"], 3)
+        self.save_stats()
+        print(
+            f"supervisor: the display recovered in {recovery:.1f}s "
+            f"(mean time to recover {self.stats['mean_time_to_recover_s']}s over {self.stats['recoveries']} recoveries)",
+            flush=True
+        )
+
+    def save_stats(self):
+        """
+        writes the counts to SUPERVISOR_STATS_PATH through a temporary file so a power cut cannot leave half of it
+        """
+        temp_path = f"{self.stats_path}.tmp"
+        try:
+            with open(temp_path, "w") as file:
+                json.dump(self.stats, file, indent=2)
+            os.replace(temp_path, self.stats_path)
+        except OSError as e:
+            print(f"supervisor: Error saving {self.stats_path}: {e}", flush=True)
+
+# run the supervisor
+if __name__ == "__main__":
+    supervisor = Supervisor(sys.argv[1:])
+    signal.signal(signal.SIGTERM, supervisor.stop)
+    signal.signal(signal.SIGINT, supervisor.stop)
+    sys.exit(supervisor.run())
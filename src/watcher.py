@@ -0,0 +1,179 @@
+#import modules
+import os
+import zipfile
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+from constants import WATCH_DEBOUNCE_MS
+from snapshot import file_fingerprint
+
+def images_signature(images_dir):
+    """
+    describes the contents of the pictures folder so two looks at it can be compared
+    :param images_dir: the folder rclone syncs the pictures into
+    :return: a sorted tuple of (name, size, modification time) for every picture (None if the folder is missing)
+    """
+    try:
+        entries = os.scandir(images_dir)
+    except OSError:
+        return None
+
+    signature = []
+    with entries:
+        for entry in entries:
+            # skip hidden files and the temporary files rclone writes before renaming them into place
+            if entry.name.startswith(".") or entry.name.endswith(".partial") or not entry.is_file():
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue # deleted while we were looking
+            signature.append((entry.name, stat.st_size, stat.st_mtime_ns))
+
+    return tuple(sorted(signature))
+
+class FileWatcher(QObject):
+    """
+    watches the schedule spreadsheet and the pictures folder and says when either of them really changed.
+    a sync writes in bursts, so nothing is reported until the files have stopped changing for a while,
+    a spreadsheet that is not a complete workbook yet is ignored and touching a file without changing
+    it is not reported at all
+
+    Signals:
+        schedule_changed
+            the spreadsheet was replaced or rewritten and is ready to be read
+        images_changed
+            pictures were added, removed or changed
+
+    Methods:
+        __init__(self, schedule_path=None, images_dir=None, debounce_ms=WATCH_DEBOUNCE_MS, parent=None)
+            starts watching the files
+
+        watch_paths(self)
+            makes sure every path that exists is being watched
+
+        on_path_changed(self, path)
+            restarts the wait for the files to settle
+
+        check_schedule(self)
+            reports the spreadsheet once it has settled into a different, complete file
+
+        check_images(self)
+            reports the pictures once they have settled into something different
+    """
+    schedule_changed = Signal()
+    images_changed = Signal()
+
+    def __init__(self, schedule_path=None, images_dir=None, debounce_ms=WATCH_DEBOUNCE_MS, parent=None):
+        """
+        starts watching the files
+        :param schedule_path: the path to Schedule.xlsx (None to not watch a spreadsheet)
+        :param images_dir: the folder with the tutor pictures (None to not watch pictures)
+        :param debounce_ms: how long the files have to stay the same before a change is reported
+        :param parent: the QObject that owns the watcher
+        """
+        super().__init__(parent)
+        self.schedule_path = schedule_path
+        self.schedule_dir = (os.path.dirname(schedule_path) or ".") if schedule_path else None
+        self.images_dir = images_dir
+        self.images_parent = (os.path.dirname(os.path.normpath(images_dir)) or ".") if images_dir else None
+
+        # what the files looked like the last time they were reported, so only real changes are reported
+        self.reported_schedule = file_fingerprint(schedule_path) if schedule_path else None
+        self.reported_images = images_signature(images_dir) if images_dir else None
+
+        # what the files looked like at the last event, to tell if they are still being written
+        self.pending_schedule = self.reported_schedule
+        self.pending_images = self.reported_images
+
+        # one timer per thing being watched. every event restarts it so a burst of writes ends in one check
+        self.schedule_timer = QTimer(self)
+        self.schedule_timer.setSingleShot(True)
+        self.schedule_timer.setInterval(debounce_ms)
+        # noinspection PyUnresolvedReferences
+        self.schedule_timer.timeout.connect(self.check_schedule)
+
+        self.images_timer = QTimer(self)
+        self.images_timer.setSingleShot(True)
+        self.images_timer.setInterval(debounce_ms)
+        # noinspection PyUnresolvedReferences
+        self.images_timer.timeout.connect(self.check_images)
+
+        self.watcher = QFileSystemWatcher(self)
+        # noinspection PyUnresolvedReferences
+        self.watcher.fileChanged.connect(self.on_path_changed)
+        # noinspection PyUnresolvedReferences
+        self.watcher.directoryChanged.connect(self.on_path_changed)
+        self.watch_paths()
+
+    def watch_paths(self):
+        """
+        makes sure every path that exists is being watched. a file that is replaced by renaming a new one
+        over it stops being watched, so this runs again after every event
+        """
+        paths = []
+        if self.schedule_path:
+            paths += [self.schedule_dir, self.schedule_path]
+
+        # watch the folder above Images/ until Images/ is created
+        if self.images_dir:
+            paths.append(self.images_dir if os.path.isdir(self.images_dir) else self.images_parent)
+
+        watched = set(self.watcher.files()) | set(self.watcher.directories())
+        missing = [path for path in paths if path not in watched and os.path.exists(path)]
+        if missing:
+            self.watcher.addPaths(missing)
+
+    def on_path_changed(self, path):
+        """
+        restarts the wait for the files to settle
+        :param path: the file or folder that changed
+        """
+        self.watch_paths()
+
+        if self.schedule_path and path in (self.schedule_path, self.schedule_dir):
+            self.pending_schedule = file_fingerprint(self.schedule_path)
+            self.schedule_timer.start()
+        if self.images_dir and path in (self.images_dir, self.images_parent):
+            self.pending_images = images_signature(self.images_dir)
+            self.images_timer.start()
+
+    def check_schedule(self):
+        """
+        reports the spreadsheet once it has settled into a different, complete file
+        """
+        fingerprint = file_fingerprint(self.schedule_path)
+
+        # still being written, wait for it to settle
+        if fingerprint != self.pending_schedule:
+            self.pending_schedule = fingerprint
+            self.schedule_timer.start()
+            return
+
+        # gone, or the same file as last time (the cache being saved next to it also lands here)
+        if fingerprint is None or fingerprint == self.reported_schedule:
+            return
+
+        # an xlsx file is a zip archive, and a half written one has no central directory yet
+        if not zipfile.is_zipfile(self.schedule_path):
+            print(f"'{self.schedule_path}' is not a complete workbook yet, waiting for the next change")
+            return
+
+        self.reported_schedule = fingerprint
+        self.schedule_changed.emit()
+
+    def check_images(self):
+        """
+        reports the pictures once they have settled into something different
+        """
+        signature = images_signature(self.images_dir)
+
+        # still being synced, wait for it to settle
+        if signature != self.pending_images:
+            self.pending_images = signature
+            self.images_timer.start()
+            return
+
+        if signature is None or signature == self.reported_images:
+            return
+
+        self.reported_images = signature
+        self.images_changed.emit()
@@ -0,0 +1,62 @@
+#import modules
+import threading
+
+class WorkerSignal:
+    """
+    hands the results of background tasks back to a QObject through one of its signals. the tasks only
+    hold this object, never the QObject, and once it is closed their results are dropped. the QObject
+    closes it before it is deleted, so a task that is still running when the display quits never emits
+    a signal of a deleted object
+
+    Methods:
+        __init__(self, signal)
+            defines the worker signal
+
+        start(self)
+            counts a task as running. called on the GUI thread before the task is started
+
+        emit(self, *args)
+            hands a task's result back unless the worker signal was closed. called from the task
+
+        close(self, timeout=None)
+            drops the results of the tasks still running and waits for them to finish
+    """
+    def __init__(self, signal):
+        """
+        defines the worker signal
+        :param signal: the signal to emit the results with. it should be connected with a queued connection
+        """
+        self.signal = signal
+        self.running = 0
+        self.closed = False
+        self.condition = threading.Condition()
+
+    def start(self):
+        """
+        counts a task as running. called on the GUI thread before the task is started
+        """
+        with self.condition:
+            self.running += 1
+
+    def emit(self, *args):
+        """
+        hands a task's result back unless the worker signal was closed. every task calls this exactly once
+        :param args: the arguments of the signal
+        """
+        with self.condition:
+            self.running -= 1
+            # emitting only queues the result, so holding the lock while doing it is quick. close()
+            # cannot run in between, so the QObject is alive for the whole emit
+            if not self.closed:
+                self.signal.emit(*args)
+            self.condition.notify_all()
+
+    def close(self, timeout=None):
+        """
+        drops the results of the tasks still running and waits for them to finish
+        :param timeout: the longest to wait in seconds (None to wait as long as it takes)
+        :return: True if no task is running anymore
+        """
+        with self.condition:
+            self.closed = True
+            return self.condition.wait_for(lambda: self.running == 0, timeout)
@@ -0,0 +1,74 @@
+"""
+Shared setup for the tests. The tests import the modules in src/ the same way main.py does and run Qt
+offscreen on a 1920x1080 screen, like the benchmarks.
+
+Run them from the repository root:
+    python -m pytest tests
+"""
+import datetime
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+# a 1920x1080 offscreen screen so the layout matches the lobby display
+os.environ.setdefault("QT_QPA_PLATFORM", f"offscreen:configfile={os.path.join(ROOT, 'benchmarks', 'offscreen_1080p.json')}")
+
+# 10:05 on a Wednesday, the same time the benchmarks use
+WEDNESDAY = datetime.datetime(2025, 1, 8, 10, 5, 0, 1)
+
+@pytest.fixture(scope="session")
+def qapp():
+    """
+    The QApplication every Qt test shares.
+    """
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+@pytest.fixture
+def schedule_file(tmp_path):
+    """
+    A small made-up Schedule.xlsx written with benchmarks/make_schedule.py.
+    """
+    from make_schedule import make_schedule
+    path = tmp_path / "Schedule.xlsx"
+    make_schedule(str(path), tutors=12)
+    return str(path)
+
+@pytest.fixture
+def fixed_clock():
+    """
+    Fixes the time the display sees to WEDNESDAY for the length of a test.
+    """
+    import clock
+    clock.set_clock(lambda: WEDNESDAY)
+    yield WEDNESDAY
+    clock.set_clock()
+
+@pytest.fixture
+def display_dir(tmp_path, monkeypatch, qapp, fixed_clock):
+    """
+    A working directory laid out like the device (data/Schedule.xlsx, Fonts/ and a picture of every tutor in Images/) with
+    the network check replaced by one that always succeeds, so a MainWindow can be built in it.
+    """
+    from make_schedule import make_schedule
+    import network
+    (tmp_path / "data").mkdir()
+    (tmp_path / "Images").mkdir()
+    os.symlink(os.path.join(ROOT, "Fonts"), tmp_path / "Fonts")
+    make_schedule(str(tmp_path / "data" / "Schedule.xlsx"), tutors=24)
+
+    # a picture of a different color for every tutor, so the cards can be told apart in a screenshot
+    from PySide6.QtGui import QColor, QImage
+    for index in range(24):
+        image = QImage(120, 160, QImage.Format.Format_RGB32)
+        image.fill(QColor.fromHsv(index * 15, 200, 200))
+        image.save(str(tmp_path / "Images" / f"Tutor {index:03d}.jpg"))
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(network, "probe", lambda *args, **kwargs: True)
+    return tmp_path
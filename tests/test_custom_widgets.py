@@ -0,0 +1,123 @@
+import pytest
+from PySide6.QtCore import QCoreApplication, QEvent
+from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+import fonts
+import style
+from custom_widgets import TutorCard, WidgetPool, WillReturn
+
+CARD_SIZE = (560, 140)
+WILL_RETURN_SIZE = (560, 140)
+
+class Probe(QWidget):
+    """
+    A widget with a bind method that remembers what it was bound to.
+    """
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+        self.binds = 0
+
+    def bind(self, value):
+        self.value = value
+        self.binds += 1
+
+@pytest.fixture
+def styled(qapp):
+    """
+    The application style sheet and fonts main.py sets up, so widgets are drawn the way they are on the display.
+    """
+    fonts.load_fonts()
+    qapp.setStyleSheet(style.APP_STYLESHEET)
+    return qapp
+
+def settle(app):
+    for _ in range(3):
+        app.processEvents()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+def test_pool_counts_hits_and_misses(qapp):
+    pool = WidgetPool(Probe)
+    first = pool.acquire("a")
+    assert (pool.hits, pool.misses, pool.hit_rate()) == (0, 1, 0.0)
+
+    pool.release(first)
+    second = pool.acquire("b")
+    # the released widget came back, rebound rather than built again
+    assert second is first
+    assert second.value == "b" and second.binds == 1
+    assert (pool.hits, pool.misses, pool.released) == (1, 1, 1)
+    assert pool.hit_rate() == 0.5
+    assert repr(pool) == "Probe pool: 1 hits, 1 misses (50%), 0 free, 0 discarded"
+
+def test_empty_pool_hit_rate(qapp):
+    assert WidgetPool(Probe).hit_rate() == 0.0
+
+def test_release_takes_the_widget_off_its_page(qapp):
+    pool = WidgetPool(Probe)
+    page = QWidget()
+    layout = QVBoxLayout(page)
+    widget = pool.acquire("a")
+    layout.addWidget(widget)
+
+    pool.release(widget)
+    assert widget.parentWidget() is None
+    assert layout.count() == 0
+
+    # deleting the page must not take the pooled widget with it
+    page.deleteLater()
+    settle(qapp)
+    assert pool.acquire("b").value == "b"
+
+def test_pool_discards_beyond_max_size(qapp):
+    pool = WidgetPool(Probe, max_size=2)
+    widgets = [pool.acquire(index) for index in range(3)]
+    for widget in widgets:
+        pool.release(widget)
+
+    assert len(pool.free) == 2
+    assert pool.discarded == 1
+    assert (pool.released, pool.misses) == (3, 3)
+
+def shown(widget, size, app):
+    widget.setFixedSize(*size)
+    widget.show()
+    settle(app)
+    return widget
+
+def test_rebound_tutor_card_looks_like_a_new_one(display_dir, styled):
+    pool = WidgetPool(TutorCard)
+    old = shown(pool.acquire("Tutor 000", "Images/Tutor 000.jpg", "Mechanical Engineer", "Junior", "Here until 11:00 AM"), CARD_SIZE, styled)
+    old.hide()
+    pool.release(old)
+
+    # a different tutor, picture, major and class
+    arguments = ("Tutor 007", "Images/Tutor 007.jpg", "Electrical Engineer", "Senior", "Here until 3:30 PM")
+    rebound = shown(pool.acquire(*arguments), CARD_SIZE, styled)
+    new = shown(TutorCard(*arguments), CARD_SIZE, styled)
+
+    assert rebound is old
+    assert rebound.grab().toImage() == new.grab().toImage()
+
+def test_rebound_card_with_same_major_looks_like_a_new_one(display_dir, styled):
+    pool = WidgetPool(TutorCard)
+    old = shown(pool.acquire("Tutor 001", "Images/Tutor 001.jpg", "Civil Engineer", "Freshman", "Here until 9:00 AM"), CARD_SIZE, styled)
+    old.hide()
+    pool.release(old)
+
+    arguments = ("Tutor 002", "Images/Tutor 002.jpg", "Civil Engineer", "Graduate", "Here until 6:00 PM")
+    rebound = shown(pool.acquire(*arguments), CARD_SIZE, styled)
+    new = shown(TutorCard(*arguments), CARD_SIZE, styled)
+    assert rebound.grab().toImage() == new.grab().toImage()
+
+def test_rebound_will_return_looks_like_a_new_one(display_dir, styled):
+    pool = WidgetPool(WillReturn)
+    old = shown(pool.acquire("Mechanical Engineer", "at 1:00 PM"), WILL_RETURN_SIZE, styled)
+    old.hide()
+    pool.release(old)
+
+    rebound = shown(pool.acquire("Biological Engineer", "Tomorrow"), WILL_RETURN_SIZE, styled)
+    new = shown(WillReturn("Biological Engineer", "Tomorrow"), WILL_RETURN_SIZE, styled)
+
+    assert rebound is old
+    assert rebound.grab().toImage() == new.grab().toImage()
@@ -0,0 +1,78 @@
+import pytest
+from openpyxl import load_workbook
+
+from constants import WEEKDAYS
+from excel import DAY_HEADER_ROWS, FIRST_SHIFT_ROW, _find_day_headers, _find_first_shift_row, read_workbook
+
+def edit_workbook(path, edit):
+    """
+    Opens a workbook, lets edit change it and saves it again.
+    """
+    workbook = load_workbook(path)
+    edit(workbook)
+    workbook.save(path)
+
+def test_real_layout_is_found_without_a_warning(schedule_file, capsys):
+    # make_schedule writes the layout of the real Schedule.xlsx: the day headers on rows 4, 13, 22, 31 and 40
+    # of 'Print Schedule' and the header of 'Schedule' on row 11 with the shifts from row 12
+    day_schedules, tutor_schedule, tutor_info = read_workbook(schedule_file)
+
+    assert "Warning" not in capsys.readouterr().out
+    assert len(day_schedules) == len(WEEKDAYS)
+    assert all(len(day) == 6 for day in day_schedules)
+    # the first column of every day is 7:00, before the center opens
+    assert all(row[0] == "n" for day in day_schedules for row in day)
+    assert tutor_schedule[0][:2] == ["Tutor 000", "Monday"]
+    assert len(tutor_schedule) == 12 * len(WEEKDAYS)
+    assert tutor_info[0][0] == "Tutor 000" and len(tutor_info) == 12
+
+def test_real_layout_matches_the_fixed_rows(schedule_file):
+    workbook = load_workbook(schedule_file, read_only=True)
+    print_rows = [list(row) for row in workbook["Print Schedule"].iter_rows(max_col=29, values_only=True)]
+    schedule_rows = [list(row) for row in workbook["Schedule"].iter_rows(max_col=31, values_only=True)]
+    workbook.close()
+
+    assert _find_day_headers(print_rows) == DAY_HEADER_ROWS
+    assert _find_first_shift_row(schedule_rows) == FIRST_SHIFT_ROW
+
+def test_moved_blocks_are_still_found(schedule_file, capsys):
+    # a new title row above both sheets moves every block down by one
+    def add_title_rows(workbook):
+        workbook["Print Schedule"].insert_rows(1)
+        workbook["Schedule"].insert_rows(1)
+    edit_workbook(schedule_file, add_title_rows)
+
+    day_schedules, tutor_schedule, _ = read_workbook(schedule_file)
+    assert "Warning" not in capsys.readouterr().out
+    assert all(row[0] == "n" for day in day_schedules for row in day)
+    assert tutor_schedule[0][:2] == ["Tutor 000", "Monday"]
+
+def test_missing_day_names_fall_back_with_a_warning(schedule_file, capsys):
+    # without the names of the days above each block the hard-coded rows are used
+    def clear_day_names(workbook):
+        sheet = workbook["Print Schedule"]
+        for row in DAY_HEADER_ROWS:
+            sheet.cell(row + 1, 1).value = None
+    edit_workbook(schedule_file, clear_day_names)
+
+    day_schedules, _, _ = read_workbook(schedule_file)
+    out = capsys.readouterr().out
+    assert "Warning: could not find the Monday to Friday headers in the 'Print Schedule' sheet, using rows 4, 13, 22, 31, 40" in out
+    assert len(day_schedules) == len(WEEKDAYS)
+
+def test_missing_weekdays_fall_back_with_a_warning(schedule_file, capsys):
+    def clear_weekdays(workbook):
+        sheet = workbook["Schedule"]
+        for row in range(FIRST_SHIFT_ROW + 1, sheet.max_row + 1):
+            sheet.cell(row, 2).value = "?"
+    edit_workbook(schedule_file, clear_weekdays)
+
+    _, tutor_schedule, _ = read_workbook(schedule_file)
+    out = capsys.readouterr().out
+    assert "Warning: no row of the 'Schedule' sheet has a weekday in column B, reading the shifts from row 12" in out
+    assert tutor_schedule[0][0] == "Tutor 000"
+
+@pytest.mark.parametrize("rows", [[], [["Monday"]], [["Monday"], ["Tuesday"], ["Friday"]]])
+def test_incomplete_day_headers_fall_back(rows, capsys):
+    assert _find_day_headers(rows) == DAY_HEADER_ROWS
+    assert "Warning" in capsys.readouterr().out
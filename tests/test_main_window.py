@@ -0,0 +1,95 @@
+import datetime
+
+import pytest
+from PySide6.QtCore import QCoreApplication, QEvent, QThreadPool
+from PySide6.QtWidgets import QWidget
+
+import clock
+from conftest import WEDNESDAY
+from excel import ExcelManager
+
+def settle(app):
+    """
+    Lets the background work, the layout and any deleteLater calls finish.
+    """
+    QThreadPool.globalInstance().waitForDone()
+    for _ in range(3):
+        app.processEvents()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+@pytest.fixture
+def replay(display_dir, qapp):
+    """
+    A clock the test moves by hand, starting early on WEDNESDAY with the cache already built, so every
+    new window shows the schedule from its first frame.
+    """
+    ExcelManager().read_snapshot(None)
+    now = [WEDNESDAY.replace(hour=6, minute=0)]
+    clock.set_clock(lambda: now[0])
+    return now
+
+def build_window(app):
+    import main
+    window = main.MainWindow()
+    settle(app)
+    return window
+
+def close(window, app):
+    window.close()
+    window.deleteLater()
+    settle(app)
+
+def test_every_update_of_a_day_matches_a_fresh_window(replay, qapp):
+    now = replay
+    window = build_window(qapp)
+    end = now[0].replace(hour=0, minute=0) + datetime.timedelta(days=1)
+
+    checked = 0
+    while True:
+        now[0] = window.get_next_change(now[0])
+        if now[0] >= end:
+            break
+        window.update_ui()
+        settle(qapp)
+
+        fresh = build_window(qapp)
+        assert window.grab().toImage() == fresh.grab().toImage(), f"the display is different at {now[0]:%H:%M}"
+        assert window.displayed_tutor_items == fresh.displayed_tutor_items
+        close(fresh, qapp)
+        checked += 1
+
+    # the made-up center is open from 8:00 to 20:00, so at least every half hour in between was checked
+    assert checked >= 25
+    close(window, qapp)
+
+def test_repeated_tick_changes_nothing(replay, qapp):
+    now = replay
+    now[0] = WEDNESDAY
+    window = build_window(qapp)
+    widgets = len(window.findChildren(QWidget))
+    items = window.displayed_tutor_items
+    list_widgets = list(window.tutor_list_widgets)
+
+    for _ in range(5):
+        window.update_ui()
+        settle(qapp)
+
+    assert len(window.findChildren(QWidget)) == widgets
+    assert window.displayed_tutor_items == items
+    # the same card objects are still on screen, nothing was rebuilt or swapped
+    assert all(new is old for new, old in zip(window.tutor_list_widgets, list_widgets))
+    close(window, qapp)
+
+def test_replayed_clock_does_not_update_every_pass(replay, qapp):
+    # the update timer waits on the display's clock, which is stopped here, so it never fires
+    now = replay
+    now[0] = WEDNESDAY
+    window = build_window(qapp)
+    updates = []
+    window.timer.timeout.connect(lambda: updates.append(now[0]))
+
+    for _ in range(50):
+        qapp.processEvents()
+    assert updates == []
+    assert window.timer.remainingTime() > 60 * 1000
+    close(window, qapp)
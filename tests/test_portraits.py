@@ -0,0 +1,56 @@
+import os
+
+from PySide6.QtGui import QColor, QImage
+
+from portraits import PortraitCache
+
+def write_picture(path, color, mtime_ns):
+    image = QImage(64, 64, QImage.Format.Format_RGB32)
+    image.fill(QColor(color))
+    image.save(str(path), "PNG")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+def test_lookups_do_not_stat_the_picture(qapp, tmp_path, monkeypatch):
+    path = str(tmp_path / "tutor.png")
+    write_picture(path, "red", 1_000_000_000)
+    cache = PortraitCache()
+
+    stats = []
+    stat = os.stat
+    def counted_stat(target, *args, **kwargs):
+        if str(target) == path:
+            stats.append(target)
+        return stat(target, *args, **kwargs)
+    monkeypatch.setattr(os, "stat", counted_stat)
+
+    first = cache.get(path, 48, 10, "#000000")
+    for _ in range(10):
+        assert cache.get(path, 48, 10, "#000000") is first
+    assert len(stats) == 1
+    assert (cache.hits, cache.misses) == (10, 1)
+
+def test_replaced_picture_is_drawn_again_after_forget_mtimes(qapp, tmp_path):
+    path = str(tmp_path / "tutor.png")
+    write_picture(path, "red", 1_000_000_000)
+    cache = PortraitCache()
+    red = cache.get(path, 48, 10, "#000000")
+
+    # until the images watcher reports the change the cached portrait is kept
+    write_picture(path, "blue", 2_000_000_000)
+    assert cache.get(path, 48, 10, "#000000") is red
+
+    cache.forget_mtimes()
+    blue = cache.get(path, 48, 10, "#000000")
+    assert blue is not red
+    center = blue.toImage().pixelColor(24, 24)
+    assert center == QColor("blue")
+    assert (cache.hits, cache.misses) == (1, 2)
+
+def test_unchanged_pictures_stay_cached_after_forget_mtimes(qapp, tmp_path):
+    path = str(tmp_path / "tutor.png")
+    write_picture(path, "red", 1_000_000_000)
+    cache = PortraitCache()
+    red = cache.get(path, 48, 10, "#000000")
+
+    cache.forget_mtimes()
+    assert cache.get(path, 48, 10, "#000000") is red
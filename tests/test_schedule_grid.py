@@ -0,0 +1,120 @@
+import pytest
+from PySide6.QtGui import QColor, QRegion
+
+import constants
+import fonts
+from custom_widgets import ScheduleGrid
+
+SIZE = (1200, 616)
+SPACING = 20
+
+# the colors of the ScheduleCell widgets the grid replaced, as (light, dark) for every code in the print schedule
+BASELINE_CELL_COLORS = {
+    "MA": (constants.MAE_RED, constants.MAE_RED_DARK),
+    "CE": (constants.CEE_GREEN, constants.CEE_GREEN_DARK),
+    "B": (constants.BENG_BLUE, constants.BENG_BLUE_DARK),
+    "EL": (constants.ECE_YELLOW, constants.ECE_YELLOW_DARK),
+    "CP": (constants.CMPE_ORAGNE, constants.CMPE_ORAGNE_DARK),
+}
+BASELINE_EMPTY_COLORS = ("white", "#9e9e9e")
+
+def make_schedule():
+    """
+    Five rows of a print schedule, closed before 8:00 and after 8:00 PM, with every code and some empty slots.
+    """
+    codes = ["MA", "CP", "EL", "CE", "B"]
+    schedule = []
+    for row, code in enumerate(codes):
+        values = []
+        for col in range(28):
+            if col < 2 or col > 25:
+                values.append("c")
+            elif (col + row) % 4 == 0:
+                values.append("")
+            else:
+                values.append(code)
+        schedule.append(values)
+    return schedule
+
+class RecordingGrid(ScheduleGrid):
+    """
+    A ScheduleGrid that remembers the area of every paint event.
+    """
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.painted = []
+
+    def paintEvent(self, event):
+        self.painted.append(QRegion(event.region()))
+        super().paintEvent(event)
+
+def build_grid(app, schedule, now_index, grid_class=ScheduleGrid):
+    fonts.load_fonts()
+    grid = grid_class(schedule, now_index, SPACING)
+    grid.setFixedSize(*SIZE)
+    grid.setStyleSheet("background-color: white")
+    grid.show()
+    app.processEvents()
+    return grid
+
+@pytest.mark.parametrize("now_index", [-1, 2, 9, 25, 27])
+def test_every_cell_has_the_baseline_color(qapp, now_index):
+    schedule = make_schedule()
+    grid = build_grid(qapp, schedule, now_index)
+    image = grid.grab().toImage()
+
+    # the baseline grid had one cell for every row and every open column, in the same place
+    for row in range(len(schedule)):
+        for col in range(grid.start_index, grid.end_index + 1):
+            x = (grid.column_x(col) + grid.column_x(col + 1)) // 2
+            y = (grid.row_y(row) + grid.row_y(row + 1)) // 2
+            value = schedule[row][col]
+            expected = BASELINE_CELL_COLORS.get(value, BASELINE_EMPTY_COLORS)[col == now_index]
+            assert image.pixelColor(x, y) == QColor(expected), (row, col)
+
+    # nothing is drawn for the closed columns
+    assert grid.start_index == 2 and grid.end_index == 25
+    x = grid.column_x(grid.end_index + 1) + grid.cell_width() / 2
+    for row in range(len(schedule)):
+        assert image.pixelColor(int(x), (grid.row_y(row) + grid.row_y(row + 1)) // 2) == QColor("white")
+    grid.close()
+
+def test_moving_the_current_column_matches_a_new_grid(qapp):
+    schedule = make_schedule()
+    grid = build_grid(qapp, schedule, 2)
+    for now_index in range(3, 28):
+        grid.set_now_index(now_index)
+        qapp.processEvents()
+        fresh = build_grid(qapp, schedule, now_index)
+        assert grid.grab().toImage() == fresh.grab().toImage(), now_index
+        fresh.close()
+    grid.close()
+
+@pytest.mark.parametrize("old, new", [(2, 3), (9, 10), (10, 17), (25, 26)])
+def test_moving_the_current_column_repaints_only_two_columns(qapp, old, new):
+    grid = build_grid(qapp, make_schedule(), old, RecordingGrid)
+    grid.painted.clear()
+
+    grid.set_now_index(new)
+    qapp.processEvents()
+
+    expected = QRegion()
+    for col in (old, new):
+        if grid.start_index <= col <= grid.end_index:
+            expected = expected.united(grid.column_rect(col))
+    painted = QRegion()
+    for region in grid.painted:
+        painted = painted.united(region)
+
+    assert painted == expected
+    assert painted.boundingRect().height() < grid.height()
+    grid.close()
+
+def test_same_current_column_repaints_nothing(qapp):
+    grid = build_grid(qapp, make_schedule(), 9, RecordingGrid)
+    grid.painted.clear()
+
+    grid.set_now_index(9)
+    qapp.processEvents()
+    assert grid.painted == []
+    grid.close()
@@ -0,0 +1,157 @@
+import operator
+import os
+import pickle
+import zlib
+
+import numpy as np
+import pytest
+
+import snapshot
+from constants import SCHEDULE_START_MINUTE, SLOT_MINUTES
+from excel import ExcelManager
+from snapshot import load_snapshot, save_snapshot, _HEADER
+
+@pytest.fixture
+def built(schedule_file, tmp_path):
+    """
+    A snapshot parsed from the made-up spreadsheet and the path it was cached to.
+    """
+    cache_path = str(tmp_path / "schedule_cache.bin")
+    em = ExcelManager(schedule_file, cache_path)
+    result = em.read_snapshot(None)
+    assert result is not None
+    return result, cache_path
+
+def assert_same_snapshot(first, second):
+    assert first.fingerprint == second.fingerprint
+    assert first.tutors == second.tutors
+    assert first.days == second.days
+    assert first.shifts == second.shifts
+    assert first.timeline == second.timeline
+    assert np.array_equal(first.tensor.codes, second.tensor.codes)
+    assert np.array_equal(first.tensor.majors, second.tensor.majors)
+
+def test_round_trip(built):
+    result, cache_path = built
+    assert_same_snapshot(load_snapshot(cache_path), result)
+
+def test_round_trip_without_fingerprint(built, tmp_path):
+    result, _ = built
+    path = str(tmp_path / "no_fingerprint.bin")
+    save_snapshot(result._replace(fingerprint=None), path)
+    assert load_snapshot(path).fingerprint is None
+
+def test_save_leaves_no_temporary_file(built):
+    _, cache_path = built
+    assert not os.path.exists(f"{cache_path}.tmp")
+
+def test_missing_file(tmp_path):
+    assert load_snapshot(str(tmp_path / "missing.bin")) is None
+
+@pytest.mark.parametrize("length", [0, 10, _HEADER.size - 1, _HEADER.size, _HEADER.size + 100])
+def test_truncated_file_is_rejected(built, length):
+    _, cache_path = built
+    with open(cache_path, "rb") as file:
+        data = file.read()
+    with open(cache_path, "wb") as file:
+        file.write(data[:length])
+    assert load_snapshot(cache_path) is None
+
+def test_bad_checksum_is_rejected(built):
+    _, cache_path = built
+    with open(cache_path, "rb") as file:
+        data = bytearray(file.read())
+    # flip one bit in the middle of the payload
+    data[_HEADER.size + (len(data) - _HEADER.size) // 2] ^= 0x01
+    with open(cache_path, "wb") as file:
+        file.write(data)
+    assert load_snapshot(cache_path) is None
+
+def test_wrong_magic_is_rejected(built):
+    _, cache_path = built
+    with open(cache_path, "rb") as file:
+        data = file.read()
+    with open(cache_path, "wb") as file:
+        file.write(b"NOTSNP" + data[6:])
+    assert load_snapshot(cache_path) is None
+
+def test_old_schema_is_rejected(built, monkeypatch):
+    result, cache_path = built
+    monkeypatch.setattr(snapshot, "SCHEMA_VERSION", snapshot.SCHEMA_VERSION - 1)
+    save_snapshot(result, cache_path)
+    monkeypatch.undo()
+    assert load_snapshot(cache_path) is None
+
+def test_valid_header_with_unreadable_payload_is_rejected(tmp_path):
+    # the checksum matches, but the payload is not a pickled snapshot
+    payload = b"not a pickle"
+    header = _HEADER.pack(snapshot.CACHE_MAGIC, snapshot.SCHEMA_VERSION, False, 0, 0, 0, len(payload), zlib.crc32(payload))
+    path = str(tmp_path / "garbage.bin")
+    with open(path, "wb") as file:
+        file.write(header + payload)
+    assert load_snapshot(path) is None
+
+class MissingKey:
+    """
+    Raises KeyError when it is unpickled.
+    """
+    def __reduce__(self):
+        return operator.getitem, ({}, "tutors")
+
+@pytest.mark.parametrize("payload", [
+    # a class from a module that was renamed without a new SCHEMA_VERSION
+    b"cno_such_module\nScheduleTensor\n.",
+    # unpickling that fails with something other than a pickling error
+    pickle.dumps(MissingKey()),
+    # a payload of the wrong shape
+    pickle.dumps((1, 2)),
+])
+def test_any_unreadable_payload_falls_back(tmp_path, payload):
+    header = _HEADER.pack(snapshot.CACHE_MAGIC, snapshot.SCHEMA_VERSION, False, 0, 0, 0, len(payload), zlib.crc32(payload))
+    path = str(tmp_path / "renamed.bin")
+    with open(path, "wb") as file:
+        file.write(header + payload)
+    assert load_snapshot(path) is None
+
+def test_unreadable_file_falls_back(tmp_path):
+    # a directory where the cache should be cannot be read
+    assert load_snapshot(str(tmp_path)) is None
+
+def test_cache_of_another_spreadsheet_is_not_used(built, schedule_file):
+    # the cache only counts for the exact spreadsheet it was built from
+    result, cache_path = built
+    stat = os.stat(schedule_file)
+    os.utime(schedule_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    rebuilt = ExcelManager(schedule_file, cache_path).read_snapshot(None)
+    assert rebuilt.fingerprint != result.fingerprint
+    assert rebuilt.fingerprint == snapshot.file_fingerprint(schedule_file)
+    assert load_snapshot(cache_path).fingerprint == rebuilt.fingerprint
+
+def test_transitions_are_where_the_roster_changes(built, schedule_file):
+    result, cache_path = built
+    em = ExcelManager(schedule_file, cache_path)
+    em.load_cache()
+
+    for weekday, day in enumerate(result.timeline):
+        # the roster of every slot against the one before it, with nobody on before the first slot and after the last
+        rosters = [set()] + [{entry.name for entry in roster} for roster in day] + [set()]
+        changes = [
+            SCHEDULE_START_MINUTE + slot * SLOT_MINUTES
+            for slot in range(len(rosters) - 1)
+            if rosters[slot] != rosters[slot + 1]
+        ]
+        transitions = em.get_transitions(weekday)
+        # a change in who is on always happens at a transition
+        assert set(changes) <= set(transitions)
+        assert result.shifts[weekday] == tuple(sorted(result.shifts[weekday], key=lambda shift: (shift.start, shift.order)))
+
+def test_roster_leaves_when_the_shift_ends(built):
+    result, _ = built
+    tutors = {tutor.name: tutor for tutor in result.tutors}
+    for weekday, day in enumerate(result.timeline):
+        for slot, roster in enumerate(day):
+            for entry in roster:
+                codes = tutors[entry.name].schedule[weekday]
+                end = next((index for index in range(slot, len(codes)) if codes[index] in ("", "nan")), len(codes))
+                assert entry.here_until == SCHEDULE_START_MINUTE + end * SLOT_MINUTES
@@ -0,0 +1,84 @@
+import json
+import sys
+import textwrap
+
+import pytest
+
+import supervisor
+from supervisor import Supervisor
+
+@pytest.fixture
+def fast(monkeypatch):
+    """
+    Checks on the child and restarts it straight away so the tests do not wait for the real backoff.
+    """
+    monkeypatch.setattr(supervisor, "POLL_S", 0.05)
+    monkeypatch.setattr(supervisor, "SUPERVISOR_BACKOFF_START_S", 0.01)
+
+def make_supervisor(tmp_path, runs):
+    """
+    A supervisor of a made-up display. Each entry of runs is what one start of the display does in order:
+    a number of seconds to sleep, "frame" to report the first frame, or an exit code.
+    """
+    child = tmp_path / "child.py"
+    child.write_text(textwrap.dedent(f"""
+        import sys, time
+        runs = {runs!r}
+        count_path = {str(tmp_path / "count")!r}
+        try:
+            count = int(open(count_path).read())
+        except OSError:
+            count = 0
+        open(count_path, "w").write(str(count + 1))
+        for step in runs[count]:
+            if step == "frame":
+                print({supervisor.FIRST_FRAME_LINE!r} + " {{}}", flush=True)
+            elif isinstance(step, float):
+                time.sleep(step)
+            elif isinstance(step, bytes):
+                sys.stdout.buffer.write(step)
+                sys.stdout.flush()
+            else:
+                sys.exit(step)
+    """))
+    stats_path = tmp_path / "supervisor.json"
+    display = Supervisor(centers=[], stats_path=str(stats_path))
+    display.command = [sys.executable, str(child)]
+    return display, stats_path
+
+def test_recovery_counts_from_the_first_crash(tmp_path, fast, capsys):
+    # the display crashes twice before it draws a frame, the second time after 0.5s
+    display, stats_path = make_supervisor(tmp_path, [[3], [0.5, 3], ["frame", 0.2, 0]])
+    assert display.run() == 0
+
+    stats = json.loads(stats_path.read_text())
+    assert (stats["crashes"], stats["restarts"], stats["recoveries"]) == (2, 2, 1)
+    # counted from the second crash the recovery would be shorter than the 0.5s the second display ran
+    assert stats["mean_time_to_recover_s"] >= 0.5
+    assert display.crashed_at is None
+    assert "the display recovered in" in capsys.readouterr().out
+
+def test_every_recovery_is_counted(tmp_path, fast):
+    # a display that crashes after drawing its first frame starts a new recovery
+    display, stats_path = make_supervisor(tmp_path, [[3], ["frame", 0.2, 3], ["frame", 0.2, 0]])
+    assert display.run() == 0
+
+    stats = json.loads(stats_path.read_text())
+    assert (stats["crashes"], stats["recoveries"]) == (2, 2)
+    assert stats["mean_time_to_recover_s"] < 0.5
+
+def test_closed_display_is_not_restarted(tmp_path, fast):
+    display, stats_path = make_supervisor(tmp_path, [["frame", 0]])
+    assert display.run() == 0
+    assert not stats_path.exists()
+
+def test_output_that_is_not_text_is_still_copied(tmp_path, fast, capsys):
+    # a byte that is not valid UTF-8 used to end the thread copying the output, so a display that prints
+    # a lot afterwards blocked on the full pipe instead of getting to its first frame
+    noise = [b"qt.qpa: \xff\xfe bad bytes\n"] + [b"x" * 1000 + b"\n"] * 200
+    display, stats_path = make_supervisor(tmp_path, [noise + ["frame", 0]])
+    assert display.run() == 0
+
+    out = capsys.readouterr().out
+    assert "qt.qpa: \ufffd\ufffd bad bytes" in out
+    assert display.first_frame.is_set()
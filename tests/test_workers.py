@@ -0,0 +1,204 @@
+import threading
+
+import pytest
+import shiboken6
+from PySide6.QtCore import QObject, QThreadPool, Signal
+
+from center import Center
+from excel import ExcelManager
+from worker import WorkerSignal
+
+class Receiver(QObject):
+    result = Signal(object)
+
+def settle(app):
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+def test_worker_signal_hands_results_back(qapp):
+    receiver = Receiver()
+    received = []
+    receiver.result.connect(received.append)
+    result = WorkerSignal(receiver.result)
+
+    result.start()
+    QThreadPool.globalInstance().start(lambda: result.emit("done"))
+    settle(qapp)
+    assert received == ["done"]
+    assert result.running == 0
+
+def test_closed_worker_signal_does_not_touch_a_deleted_object(qapp):
+    receiver = Receiver()
+    result = WorkerSignal(receiver.result)
+    result.start()
+
+    assert not result.close(timeout=0)
+    shiboken6.delete(receiver)
+    # emitting the signal of the deleted receiver would raise "Signal source has been deleted"
+    result.emit("too late")
+    assert result.running == 0
+
+def test_close_waits_for_running_tasks(qapp):
+    result = WorkerSignal(Receiver().result)
+    release = threading.Event()
+    finished = []
+
+    def task():
+        release.wait()
+        finished.append(True)
+        result.emit(None)
+
+    result.start()
+    QThreadPool.globalInstance().start(task)
+    threading.Timer(0.2, release.set).start()
+    assert result.close()
+    assert finished == [True]
+
+@pytest.fixture
+def slow_center(schedule_file, tmp_path, monkeypatch, qapp):
+    """
+    A center whose spreadsheet is only read once the test sets the returned event.
+    """
+    release = threading.Event()
+    read_snapshot = ExcelManager.read_snapshot
+    def slow_read_snapshot(self, current):
+        release.wait()
+        return read_snapshot(self, current)
+    monkeypatch.setattr(ExcelManager, "read_snapshot", slow_read_snapshot)
+
+    center = Center("test", "Test Center", schedule_file, str(tmp_path / "cache.bin"))
+    return center, release
+
+def test_center_loads_in_the_background(slow_center, qapp):
+    center, release = slow_center
+    swapped = []
+    center.snapshot_changed.connect(swapped.append)
+
+    center.load()
+    assert center.loader.is_loading()
+    release.set()
+    settle(qapp)
+
+    assert len(swapped) == 1 and swapped[0] is center.em.get_snapshot()
+    center.stop()
+
+def test_stopping_a_center_during_a_load(slow_center, qapp):
+    center, release = slow_center
+    swapped = []
+    center.snapshot_changed.connect(swapped.append)
+    em = center.em
+
+    center.load()
+    threading.Timer(0.2, release.set).start()
+    center.stop()
+
+    # the load has finished, so the center can be deleted without the worker emitting into it
+    assert center.loader.result.running == 0
+    # and nothing new is started once it is stopped
+    center.reload_schedule()
+    assert center.loader.result.running == 0
+
+    shiboken6.delete(center)
+    settle(qapp)
+    assert swapped == []
+    assert em.get_snapshot() is None
+
+@pytest.fixture
+def slow_probe(monkeypatch):
+    """
+    A network check that only finishes once the test sets the returned event.
+    """
+    import network
+    release = threading.Event()
+    def probe(*args, **kwargs):
+        release.wait()
+        return True
+    monkeypatch.setattr(network, "probe", probe)
+    return release
+
+def test_network_monitor_reports_the_probe(slow_probe, qapp):
+    import network
+    monitor = network.NetworkMonitor()
+    changes = []
+    monitor.status_changed.connect(changes.append)
+
+    monitor.start()
+    slow_probe.set()
+    settle(qapp)
+    assert changes == [True] and monitor.connected is True
+    monitor.stop()
+
+def test_stopping_the_network_monitor_during_a_probe(slow_probe, qapp):
+    import network
+    monitor = network.NetworkMonitor()
+    changes = []
+    monitor.status_changed.connect(changes.append)
+
+    monitor.start()
+    threading.Timer(0.2, slow_probe.set).start()
+    monitor.stop()
+    assert monitor.result.running == 0 and not monitor.timer.isActive()
+
+    # no new probe is started, and the monitor can be deleted without the probe emitting into it
+    monitor.check()
+    assert monitor.result.running == 0
+    shiboken6.delete(monitor)
+    settle(qapp)
+    assert changes == []
+
+@pytest.fixture
+def display(display_dir, qapp, monkeypatch):
+    """
+    A TutorDisplay on the primary screen, without the metrics endpoint.
+    """
+    import main
+    import metrics
+    monkeypatch.setattr(metrics, "start_server", lambda *args, **kwargs: None)
+    display = main.TutorDisplay()
+    settle(qapp)
+    yield display
+    display.stop()
+    for window in display.windows.values():
+        window.close()
+        window.deleteLater()
+    shiboken6.delete(display)
+    settle(qapp)
+
+def test_pictures_are_preprocessed_one_run_at_a_time(display, qapp, monkeypatch):
+    import main
+    release = threading.Event()
+    running = []
+    runs = []
+    def preprocess_images():
+        running.append(True)
+        runs.append(len(running))
+        release.wait()
+        running.pop()
+        return {}
+    monkeypatch.setattr(main, "preprocess_images", preprocess_images)
+    refreshed = []
+    display.pictures_ready.connect(lambda: refreshed.append(True))
+
+    # a second change while the pictures are being made waits for the first run
+    display.reload_images()
+    display.reload_images()
+    display.reload_images()
+    assert display.pictures_result.running == 1
+
+    release.set()
+    settle(qapp)
+    settle(qapp)
+    assert runs == [1, 1]
+    assert len(refreshed) == 2
+    assert not display.preprocessing and not display.preprocess_again
+
+def test_failed_preprocessing_does_not_hang_the_quit(display, qapp, monkeypatch):
+    import main
+    def preprocess_images():
+        raise KeyError("file")
+    monkeypatch.setattr(main, "preprocess_images", preprocess_images)
+
+    display.reload_images()
+    QThreadPool.globalInstance().waitForDone()
+    assert display.pictures_result.running == 0
+    assert display.pictures_result.close(timeout=1)